@@ -0,0 +1,181 @@
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Any
+
+from app.base.common.general import setup_logging, is_file_exists, merge_path_elements, remove_file_or_folder
+from app.base.exceptions import CacheException, CacheMessages
+from app.base.types import Path, CacheKey, CacheStats
+
+
+class DiskCache(ABC):
+    """Базовый класс дискового кэша.
+    Записи адресуются по содержимому, при превышении размера вытесняются давно неиспользуемые записи (LRU).
+    """
+    exception = CacheException
+    messages = CacheMessages
+    extension: str = ""
+
+    def __init__(self, cache_path: Path, max_size: int) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            cache_path: Путь до папки кэша.
+            max_size: Максимальный размер кэша в байтах.
+        """
+        self.cache_path: Path = cache_path
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._logger = setup_logging()
+        self._lock: Lock = Lock()
+
+    @abstractmethod
+    def _dump(self, path: Path, value: Any) -> None:
+        """Метод записи значения в файл."""
+
+    @abstractmethod
+    def _load(self, path: Path) -> Any:
+        """Метод чтения значения из файла."""
+
+    @staticmethod
+    def get_key(*parts: Any) -> CacheKey:
+        """Метод формирования ключа записи.
+
+        Args:
+            *parts: Составные части ключа.
+
+        Returns:
+            Ключ записи.
+        """
+        return hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+
+    def get_path(self, key: CacheKey) -> Path:
+        """Метод получения пути до файла записи.
+
+        Args:
+            key: Ключ записи.
+
+        Returns:
+            Путь до файла записи.
+        """
+        return merge_path_elements([self.cache_path, f"{key}.{self.extension}"])
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Метод получения значения из кэша.
+
+        Args:
+            key: Ключ записи.
+
+        Returns:
+            Значение записи, либо None, если записи нет.
+        """
+        path: Path = self.get_path(key)
+        try:
+            value: Any = self._load(path) if is_file_exists(path) else None
+        except Exception as e:
+            self._logger.warning(self.messages.CACHE_READ_ERROR.format(path=path, msg=e.__str__()))
+            remove_file_or_folder(path)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # the modification time marks the last use of the record for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Метод сохранения значения в кэш.
+
+        Args:
+            key: Ключ записи.
+            value: Значение записи.
+        """
+        path: Path = self.get_path(key)
+        tmp_path: Path | None = None
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            # a unique temporary file per writer, so concurrent threads and processes do not overwrite each other
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=f".tmp.{self.extension}", dir=self.cache_path)
+            os.close(fd)
+            self._dump(tmp_path, value)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self._logger.warning(self.messages.CACHE_WRITE_ERROR.format(path=path, msg=e.__str__()))
+            if tmp_path is not None:
+                remove_file_or_folder(tmp_path)
+            return
+        self.evict()
+
+    def _get_records(self) -> list[os.DirEntry]:
+        """Метод получения записей кэша.
+
+        Returns:
+            Список файлов записей.
+        """
+        if not os.path.isdir(self.cache_path):
+            return []
+        with os.scandir(self.cache_path) as entries:
+            return [
+                entry for entry in entries
+                if entry.is_file() and entry.name.endswith(f".{self.extension}") and ".tmp." not in entry.name
+            ]
+
+    def _get_record_stats(self) -> list[tuple[os.DirEntry, os.stat_result]]:
+        """Метод получения записей кэша вместе с их атрибутами.
+        Записи, удаленные другим процессом во время обхода, пропускаются.
+
+        Returns:
+            Список файлов записей с атрибутами.
+        """
+        records: list[tuple[os.DirEntry, os.stat_result]] = []
+        for entry in self._get_records():
+            try:
+                records.append((entry, entry.stat()))
+            except FileNotFoundError:
+                continue
+        return records
+
+    def evict(self) -> None:
+        """Метод вытеснения давно неиспользуемых записей до допустимого размера кэша."""
+        records: list[tuple[os.DirEntry, os.stat_result]] = sorted(
+            self._get_record_stats(), key=lambda record: record[1].st_mtime
+        )
+        size: int = sum(stat.st_size for _, stat in records)
+        for entry, stat in records:
+            if size <= self.max_size:
+                break
+            size -= stat.st_size
+            remove_file_or_folder(entry.path)
+            self._logger.info(self.messages.CACHE_EVICT.format(path=entry.path))
+
+    @property
+    def stats(self) -> CacheStats:
+        """Свойство получения статистики кэша.
+
+        Returns:
+            Количество попаданий и промахов, количество и суммарный размер записей.
+        """
+        records: list[tuple[os.DirEntry, os.stat_result]] = self._get_record_stats()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "count": len(records),
+            "size": sum(stat.st_size for _, stat in records),
+        }
+
+    def clear(self) -> None:
+        """Метод очистки кэша и счетчиков."""
+        for entry in self._get_records():
+            remove_file_or_folder(entry.path)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import shutil
@@ -88,3 +89,47 @@ def merge_path_elements(path_parts: list[str]) -> Path:
         Сформированный путь.
     """
     return os.path.join(*path_parts).__str__()
+
+
+def get_memory_usage() -> int:
+    """Функция получения объема резидентной памяти текущего процесса.
+
+    Returns:
+        Объем памяти в байтах, либо 0, если его не удалось определить.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def get_hamming_distance(hash_first: str, hash_second: str) -> int:
+    """Функция вычисления расстояния Хэмминга между двумя шестнадцатеричными хешами.
+
+    Args:
+        hash_first: Первый хеш.
+        hash_second: Второй хеш.
+
+    Returns:
+        Количество различающихся бит.
+    """
+    return (int(hash_first, 16) ^ int(hash_second, 16)).bit_count()
+
+
+def get_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Функция вычисления хеша содержимого файла.
+    Файл читается блоками, поэтому большие файлы не загружаются в память целиком.
+
+    Args:
+        file_path: Путь до файла.
+        chunk_size: Размер считываемого блока в байтах.
+
+    Returns:
+        Хеш sha256 содержимого файла.
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
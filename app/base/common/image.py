@@ -1,20 +1,138 @@
-from typing import NoReturn
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import NoReturn, TYPE_CHECKING
 
 import cv2 as cv
-from easyocr import easyocr
-from psd_tools import PSDImage
+import numpy as np
+from PIL import Image as PILImage, ImageDraw
 
-from app.base.common.general import is_file_exists
-from app.base.constants import Language, FILL_TEXT_COLOR
+from app.base.common.cache import DiskCache
+from app.base.common.general import is_file_exists, get_file_hash, StringEnum
+from app.base.common.lazy import psd_tools
+from app.base.common.ocr import reader_pool
+from app.base.constants import (
+    Language,
+    TextDetector,
+    FILL_TEXT_COLOR,
+    COMPOSITE_CACHE_PATH,
+    COMPOSITE_CACHE_MAX_SIZE,
+    TEXT_BOX_CACHE_PATH,
+    TEXT_BOX_CACHE_MAX_SIZE,
+    OCR_TILE_HEIGHT,
+    OCR_TILE_OVERLAP,
+    OPENCV_TEXT_KERNEL_SIZE,
+    OPENCV_TEXT_MIN_SIZE,
+    OPENCV_TEXT_MAX_HEIGHT,
+    OPENCV_TEXT_MIN_FILL_RATIO
+)
 from app.base.exceptions import ImageException, ImageMessages, ImageCVMessages, ImageCVException
-from app.base.types import ImgPath, FromFormatImg, ToFormatImg, ImgMatrix, ImgSavePath, ImgSize
+from app.base.types import (
+    ImgPath,
+    FromFormatImg,
+    ToFormatImg,
+    ImgMatrix,
+    ImgSavePath,
+    ImgSize,
+    ImgHash,
+    PerceptualHash,
+    CompositeImg,
+    TileBounds,
+    TileGroups,
+    LayerBox,
+    TextPolygon,
+    CacheKey,
+    OcrReader,
+    Path
+)
+
+if TYPE_CHECKING:
+    from psd_tools import PSDImage
+
+
+class CompositeSource(StringEnum):
+    CACHE: str = "cache"
+    PREVIEW: str = "preview"
+    COMPOSITE: str = "composite"
+
+
+class CompositeCache(DiskCache):
+    """Класс дискового кэша скомпонованных изображений PSD.
+    Изображения хранятся в формате PNG с быстрым сжатием без потерь.
+    """
+    extension: str = "png"
+
+    def _dump(self, path: Path, value: CompositeImg) -> None:
+        value.save(path, format="PNG", compress_level=1)
+
+    def _load(self, path: Path) -> CompositeImg:
+        with PILImage.open(path) as file:
+            file.load()
+            return file.copy()
+
+    def get_composite_key(self, img_path: ImgPath, **options) -> CacheKey:
+        """Метод формирования ключа записи по содержимому файла PSD и параметрам компоновки.
+
+        Args:
+            img_path: Путь до изображения.
+            **options: Параметры компоновки.
+
+        Returns:
+            Ключ записи.
+        """
+        return self.get_key(get_file_hash(img_path), *(f"{key}={options[key]}" for key in sorted(options)))
+
+
+composite_cache = CompositeCache(COMPOSITE_CACHE_PATH, COMPOSITE_CACHE_MAX_SIZE)
+
+
+class TextBoxCache(DiskCache):
+    """Класс дискового кэша найденных на изображениях областей текста.
+    Области хранятся одним массивом N x 4 x 2 в сжатом формате npz.
+    """
+    extension: str = "npz"
+
+    def _dump(self, path: Path, value: list[TextPolygon]) -> None:
+        np.savez_compressed(path, polygons=np.array(value, dtype="int32").reshape(-1, 4, 2))
+
+    def _load(self, path: Path) -> list[TextPolygon]:
+        with np.load(path) as file:
+            return list(file["polygons"])
+
+    def get_text_box_key(self, img_hash: ImgHash, languages: list[Language], **options) -> CacheKey:
+        """Метод формирования ключа записи по содержимому изображения, языкам и параметрам поиска текста.
+
+        Args:
+            img_hash: Хеш пикселей изображения.
+            languages: Языки текста на изображении, порядок не важен.
+            **options: Параметры поиска текста.
+
+        Returns:
+            Ключ записи.
+        """
+        return self.get_key(
+            img_hash, ",".join(sorted(map(str, languages))), *(f"{key}={options[key]}" for key in sorted(options))
+        )
+
+
+text_box_cache = TextBoxCache(TEXT_BOX_CACHE_PATH, TEXT_BOX_CACHE_MAX_SIZE)
 
 
 class Image:
     exception = ImageException
     messages = ImageMessages
 
-    def open_image(self, img_path: ImgPath) -> PSDImage | NoReturn:
+    def __init__(self, cache: CompositeCache | None = composite_cache) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            cache: Кэш скомпонованных изображений, None - без кэширования.
+        """
+        self.cache: CompositeCache | None = cache
+        self.composite_source: CompositeSource | None = None
+
+    def open_image(self, img_path: ImgPath) -> "PSDImage | NoReturn":
         """Метод открытия изображения.
 
         Args:
@@ -26,18 +144,147 @@ class Image:
         if not (isinstance(img_path, str) and is_file_exists(img_path)):
             raise self.exception(self.messages.INVALID_IMG_PATH_ERROR)
         try:
-            return PSDImage.open(img_path)
+            return psd_tools.PSDImage.open(img_path)
         except (FileNotFoundError, IsADirectoryError):
             raise self.exception(self.messages.INVALID_IMG_PATH_ERROR)
         except PermissionError:
             raise self.exception(self.messages.IMG_PERMISSION_ERROR)
 
+    @staticmethod
+    def get_preview_image(file: "PSDImage") -> CompositeImg | None:
+        """Метод получения сохраненного в PSD объединенного изображения.
+        Изображение есть в файлах, сохраненных с опцией "Maximize compatibility". Оно используется,
+        только если ресурс с информацией о версии подтверждает, что записано настоящее объединенное
+        изображение: без этого ресурса актуальность изображения относительно слоев не гарантирована.
+
+        Args:
+            file: Объект изображения PSD.
+
+        Returns:
+            Объединенное изображение, либо None, если его нет, оно не подтверждено или не полного размера.
+        """
+        version_info = file.image_resources.get_data(psd_tools.constants.Resource.VERSION_INFO)
+        if version_info is None or not version_info.has_composite:
+            return None
+        preview: CompositeImg | None = file.topil()
+        if preview is None or preview.size != file.size:
+            return None
+        return preview
+
+    @staticmethod
+    def get_text_layer_boxes(file: "PSDImage") -> list[LayerBox]:
+        """Метод получения границ видимых текстовых слоев изображения PSD.
+
+        Args:
+            file: Объект изображения PSD.
+
+        Returns:
+            Список границ слоев в виде (left, top, right, bottom), обрезанных по размеру изображения.
+        """
+        width, height = file.size
+        boxes: list[LayerBox] = []
+        for layer in file.descendants():
+            if layer.kind != "type" or not layer.is_visible():
+                continue
+            left, top, right, bottom = layer.bbox
+            left, top, right, bottom = max(left, 0), max(top, 0), min(right, width), min(bottom, height)
+            if left < right and top < bottom:
+                boxes.append((left, top, right, bottom))
+        return boxes
+
+    @staticmethod
+    def fill_boxes(composite: CompositeImg, boxes: list[LayerBox]) -> CompositeImg:
+        """Метод закрашивания областей изображения цветом FILL_TEXT_COLOR.
+
+        Args:
+            composite: Скомпонованное изображение.
+            boxes: Список границ областей в виде (left, top, right, bottom).
+
+        Returns:
+            Изображение с закрашенными областями.
+        """
+        color: tuple[int, ...] = FILL_TEXT_COLOR + (255,) * (len(composite.getbands()) - len(FILL_TEXT_COLOR))
+        draw = ImageDraw.Draw(composite)
+        for left, top, right, bottom in boxes:
+            # the bounding box of a layer excludes its right and bottom edges
+            draw.rectangle((left, top, right - 1, bottom - 1), fill=color)
+        return composite
+
+    def _composite_image(self, img_path: ImgPath, use_preview: bool, hide_text: bool) -> CompositeImg | NoReturn:
+        """Метод компоновки изображения PSD без кэша.
+        Сохраненное объединенное изображение используется вместо компоновки всех слоев, если оно есть."""
+        file: PSDImage = self.open_image(img_path)
+        if use_preview and (composite := self.get_preview_image(file)) is not None:
+            self.composite_source = CompositeSource.PREVIEW
+        else:
+            self.composite_source = CompositeSource.COMPOSITE
+            composite = file.composite(ignore_preview=True)
+
+        if hide_text:
+            if composite.mode not in ("RGB", "RGBA"):
+                composite = composite.convert("RGB")
+            composite = self.fill_boxes(composite, self.get_text_layer_boxes(file))
+        return composite
+
+    def get_composite_image(
+            self,
+            img_path: ImgPath,
+            use_preview: bool = True,
+            hide_text: bool = False
+    ) -> CompositeImg | NoReturn:
+        """Метод компоновки слоев изображения PSD.
+        Повторная компоновка того же файла берется из кэша. Способ получения изображения
+        сохраняется в атрибуте composite_source.
+
+        Args:
+            img_path: Путь до изображения.
+            use_preview: Использовать сохраненное в PSD объединенное изображение, если оно актуально.
+            hide_text: Закрасить области текстовых слоев цветом FILL_TEXT_COLOR. Положение текста
+                берется из слоев PSD, поэтому распознавание текста не требуется.
+
+        Returns:
+            Скомпонованное изображение.
+        """
+        if self.cache is None:
+            return self._composite_image(img_path, use_preview, hide_text)
+        if not (isinstance(img_path, str) and is_file_exists(img_path)):
+            raise self.exception(self.messages.INVALID_IMG_PATH_ERROR)
+
+        key: CacheKey = self.cache.get_composite_key(img_path, use_preview=use_preview, hide_text=hide_text)
+        composite: CompositeImg | None = self.cache.get(key)
+        if composite is None:
+            composite = self._composite_image(img_path, use_preview, hide_text)
+            self.cache.set(key, composite)
+        else:
+            self.composite_source = CompositeSource.CACHE
+        return composite
+
+    def get_composite_matrix(
+            self,
+            img_path: ImgPath,
+            use_preview: bool = True,
+            hide_text: bool = False
+    ) -> ImgMatrix | NoReturn:
+        """Метод компоновки слоев изображения PSD сразу в попиксельную матрицу без записи в файл.
+
+        Args:
+            img_path: Путь до изображения.
+            use_preview: Использовать сохраненное в PSD объединенное изображение, если оно актуально.
+            hide_text: Закрасить области текстовых слоев цветом FILL_TEXT_COLOR.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы в формате BGR.
+        """
+        return ImageCV.convert_composite_to_matrix(self.get_composite_image(img_path, use_preview, hide_text))
+
     def convert_format_image(
             self,
             img_path: ImgPath,
             save_img_path: ImgPath | None = None,
             from_format: FromFormatImg = "psd",
-            to_format: ToFormatImg = "png"
+            to_format: ToFormatImg = "png",
+            use_preview: bool = True,
+            hide_text: bool = False
     ) -> ImgPath | NoReturn:
         """Метод конвертации формата изображения.
 
@@ -46,6 +293,8 @@ class Image:
             save_img_path: Пусть сохранения изображения.
             from_format: Конвертация из формата.
             to_format: Конвертация в формат.
+            use_preview: Использовать сохраненное в PSD объединенное изображение, если оно актуально.
+            hide_text: Закрасить области текстовых слоев цветом FILL_TEXT_COLOR.
         """
         if from_format not in ("psd", ):
             raise self.exception(self.messages.UNKNOWN_FROM_FORMAT_ERROR)
@@ -54,8 +303,7 @@ class Image:
 
         if from_format == "psd" and to_format == "png":
             try:
-                file: PSDImage = self.open_image(img_path)
-                file: PSDImage = file.composite()
+                file: CompositeImg = self.get_composite_image(img_path, use_preview, hide_text)
                 if not save_img_path:
                     save_img_path = img_path.replace(img_path.split(".")[-1], to_format)
                 file.save(save_img_path)
@@ -67,23 +315,143 @@ class Image:
                     raise self.exception(self.messages.IMG_SAVE_ERROR.format(msg=e.__str__()))
 
 
+# imread flags by (grayscale, reduce factor), reduced images are decoded at 1/2, 1/4 or 1/8 of the size
+IMREAD_FLAGS: dict[tuple[bool, int], int] = {
+    (False, 1): cv.IMREAD_COLOR,
+    (False, 2): cv.IMREAD_REDUCED_COLOR_2,
+    (False, 4): cv.IMREAD_REDUCED_COLOR_4,
+    (False, 8): cv.IMREAD_REDUCED_COLOR_8,
+    (True, 1): cv.IMREAD_GRAYSCALE,
+    (True, 2): cv.IMREAD_REDUCED_GRAYSCALE_2,
+    (True, 4): cv.IMREAD_REDUCED_GRAYSCALE_4,
+    (True, 8): cv.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+
 class ImageCV:
     exception = ImageCVException
     messages = ImageCVMessages
 
-    def read_image(self, img_path: ImgPath) -> ImgMatrix | NoReturn:
+    def __init__(self, cache: TextBoxCache | None = text_box_cache) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            cache: Кэш найденных областей текста, None - без кэширования.
+        """
+        self.cache: TextBoxCache | None = cache
+
+    def get_text_box_key(
+            self,
+            img_matrix: ImgMatrix,
+            languages: list[Language],
+            detect_only: bool,
+            detector: TextDetector,
+            scale: float,
+            tile_height: int,
+            overlap: int
+    ) -> CacheKey | None:
+        """Метод формирования ключа кэша областей текста изображения.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            languages: Языки текста на изображении.
+            detect_only: Только найти области текста без его распознавания.
+            detector: Способ поиска текста.
+            scale: Масштаб, к которому приводятся плитки перед поиском текста.
+            tile_height: Высота плитки в пикселях.
+            overlap: Перекрытие соседних плиток в пикселях.
+
+        Returns:
+            Ключ кэша, либо None, если кэш не используется.
+        """
+        if self.cache is None:
+            return None
+        settings: tuple = ()
+        if detector == TextDetector.OPENCV:
+            settings = (
+                OPENCV_TEXT_KERNEL_SIZE, OPENCV_TEXT_MIN_SIZE, OPENCV_TEXT_MAX_HEIGHT, OPENCV_TEXT_MIN_FILL_RATIO
+            )
+        return self.cache.get_text_box_key(
+            self.get_image_hash(img_matrix),
+            languages,
+            detect_only=detect_only,
+            detector=detector,
+            settings=settings,
+            scale=scale,
+            tile_height=tile_height,
+            overlap=overlap,
+        )
+
+    def get_read_flag(self, grayscale: bool = False, reduce: int = 1) -> int | NoReturn:
+        """Метод получения флага cv.imread для режима считывания изображения.
+
+        Args:
+            grayscale: Считать изображение сразу в черно-белом формате.
+            reduce: Во сколько раз уменьшить изображение при декодировании: 1, 2, 4 или 8.
+
+        Returns:
+            Флаг cv.imread.
+        """
+        if (bool(grayscale), reduce) not in IMREAD_FLAGS:
+            raise self.exception(self.messages.INVALID_REDUCE_FACTOR_ERROR)
+        return IMREAD_FLAGS[bool(grayscale), reduce]
+
+    @staticmethod
+    def get_image_size(img_path: ImgPath) -> ImgSize:
+        """Метод получения размера изображения из заголовка файла без декодирования.
+        Для файлов npy размер берется из заголовка массива.
+
+        Args:
+            img_path: Путь до изображения.
+
+        Returns:
+            Размер изображения (ширина, высота).
+        """
+        if img_path.endswith(".npy"):
+            height, width = np.load(img_path, mmap_mode="r").shape[:2]
+            return width, height
+        with PILImage.open(img_path) as file:
+            return file.size
+
+    @staticmethod
+    def get_reduce_factor(img_path: ImgPath, img_size: ImgSize) -> int:
+        """Метод выбора наибольшего уменьшения при считывании, после которого изображение
+        все еще не меньше размера, к которому его приведут. Размер читается из заголовка файла без декодирования.
+
+        Args:
+            img_path: Путь до изображения.
+            img_size: Итоговый размер изображения (ширина, высота).
+
+        Returns:
+            Коэффициент уменьшения: 1, 2, 4 или 8.
+        """
+        try:
+            width, height = ImageCV.get_image_size(img_path)
+        except Exception:
+            return 1
+        for factor in (8, 4, 2):
+            if width // factor >= img_size[0] and height // factor >= img_size[1]:
+                return factor
+        return 1
+
+    def read_image(self, img_path: ImgPath, grayscale: bool = False, reduce: int = 1) -> ImgMatrix | NoReturn:
         """Метод считывания изображения.
+        Черно-белое и уменьшенное изображение получается сразу при декодировании, что быстрее
+        и требует меньше памяти, чем считывание в полном размере с последующим преобразованием.
 
         Args:
             img_path: Путь до изображения.
+            grayscale: Считать изображение сразу в черно-белом формате.
+            reduce: Во сколько раз уменьшить изображение при декодировании: 1, 2, 4 или 8.
 
         Returns:
             Объект изображения в виде попиксельной матрицы.
         """
         if not (isinstance(img_path, str) and is_file_exists(img_path)):
             raise self.exception(self.messages.INVALID_IMG_PATH_ERROR)
+        flag: int = self.get_read_flag(grayscale, reduce)
         try:
-            return cv.imread(img_path)
+            return cv.imread(img_path, flag)
         except (FileNotFoundError, IsADirectoryError):
             raise self.exception(self.messages.INVALID_IMG_PATH_ERROR)
         except PermissionError:
@@ -91,6 +459,80 @@ class ImageCV:
         except Exception as e:
             raise self.exception(self.messages.IMG_READ_ERROR.format(msg=e.__str__()))
 
+    def convert_image_to_memmap(
+            self,
+            img: ImgPath | ImgMatrix,
+            npy_path: Path,
+            img_size: ImgSize
+    ) -> ImgMatrix | NoReturn:
+        """Метод сохранения черно-белого изображения заданного размера в файл npy, отображаемый в память.
+        Изображение декодируется один раз в 8-битном черно-белом формате, после чего его строки читаются
+        с диска по мере обращения. Файл npy нужного размера используется без преобразования.
+
+        Args:
+            img: Путь до изображения или файла npy, либо матрица изображения.
+            npy_path: Путь сохранения файла npy.
+            img_size: Размер изображения (ширина, высота).
+
+        Returns:
+            Матрица изображения, отображенная в память только для чтения.
+        """
+        shape: tuple[int, int] = (img_size[1], img_size[0])
+        if isinstance(img, ImgPath) and img.endswith(".npy"):
+            img_matrix: ImgMatrix = np.load(img, mmap_mode="r")
+            if img_matrix.shape == shape:
+                return img_matrix
+            img_matrix = np.asarray(img_matrix)
+        elif isinstance(img, ImgPath):
+            img_matrix = self.read_image(img, grayscale=True)
+        else:
+            img_matrix = img
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if img_matrix.ndim == 3:
+            img_matrix = self.convert_image_to_grayscale(img_matrix)
+        if img_matrix.shape != shape:
+            img_matrix = self.resize_image(img_matrix, img_size)
+
+        memmap: ImgMatrix = np.lib.format.open_memmap(npy_path, mode="w+", dtype="uint8", shape=shape)
+        memmap[:] = img_matrix
+        memmap.flush()
+        del memmap, img_matrix
+        return np.load(npy_path, mmap_mode="r")
+
+    def decode_image(self, img_bytes: bytes, grayscale: bool = False, reduce: int = 1) -> ImgMatrix | NoReturn:
+        """Метод декодирования изображения из байтов без записи в файл.
+
+        Args:
+            img_bytes: Закодированное изображение, например PNG-скриншот страницы.
+            grayscale: Декодировать изображение сразу в черно-белом формате.
+            reduce: Во сколько раз уменьшить изображение при декодировании: 1, 2, 4 или 8.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы.
+        """
+        if not isinstance(img_bytes, (bytes, bytearray, memoryview)):
+            raise self.exception(self.messages.IMG_BYTES_TYPE_ERROR)
+        img_matrix: ImgMatrix | None = cv.imdecode(
+            np.frombuffer(img_bytes, dtype="uint8"), self.get_read_flag(grayscale, reduce)
+        )
+        if img_matrix is None:
+            raise self.exception(self.messages.IMG_DECODE_ERROR)
+        return img_matrix
+
+    @staticmethod
+    def convert_composite_to_matrix(composite: CompositeImg) -> ImgMatrix:
+        """Метод преобразования скомпонованного изображения PIL в попиксельную матрицу.
+        Альфа-канал отбрасывается так же, как при считывании сохраненного PNG через cv.imread.
+
+        Args:
+            composite: Скомпонованное изображение.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы в формате BGR.
+        """
+        return cv.cvtColor(np.asarray(composite.convert("RGB")), cv.COLOR_RGB2BGR)
+
     def save_image(self, img_matrix: ImgMatrix, save_path: ImgSavePath) -> ImgSavePath | NoReturn:
         """Метод сохранения изображения.
 
@@ -136,6 +578,72 @@ class ImageCV:
         except Exception as e:
             raise self.exception(self.messages.IMG_RESIZE_ERROR.format(msg=e.__str__()))
 
+    def resize_image_to_width(self, img_matrix: ImgMatrix, width: int) -> ImgMatrix | NoReturn:
+        """Метод изменения ширины изображения с сохранением пропорций.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            width: Ширина изображения.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы с измененным размером.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if img_matrix.shape[1] == width:
+            return img_matrix
+        height: int = max(round(img_matrix.shape[0] * width / img_matrix.shape[1]), 1)
+        return self.resize_image(img_matrix, (width, height))
+
+    def pad_image_to_height(self, img_matrix: ImgMatrix, height: int) -> ImgMatrix | NoReturn:
+        """Метод дополнения изображения черными строками снизу до заданной высоты.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            height: Высота изображения.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы заданной высоты.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if img_matrix.shape[0] >= height:
+            return img_matrix
+        return cv.copyMakeBorder(img_matrix, 0, height - img_matrix.shape[0], 0, 0, cv.BORDER_CONSTANT, value=0)
+
+    def get_image_pyramid(self, img_matrix: ImgMatrix, levels: int, min_size: int = 16) -> list[ImgMatrix] | NoReturn:
+        """Метод построения гауссовой пирамиды изображения.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            levels: Количество уменьшенных уровней.
+            min_size: Минимальный размер стороны изображения на уровне пирамиды.
+
+        Returns:
+            Список изображений, начиная с исходного, каждое следующее вдвое меньше предыдущего.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        pyramid: list[ImgMatrix] = [img_matrix]
+        for _ in range(levels):
+            if min(pyramid[-1].shape[:2]) // 2 < min_size:
+                break
+            pyramid.append(cv.pyrDown(pyramid[-1]))
+        return pyramid
+
+    def convert_map_to_heatmap(self, map_matrix: ImgMatrix) -> ImgMatrix | NoReturn:
+        """Метод преобразования карты значений от 0 до 1 в цветную тепловую карту.
+
+        Args:
+            map_matrix: Карта значений от 0 до 1.
+
+        Returns:
+            Объект изображения тепловой карты в виде попиксельной матрицы.
+        """
+        if not isinstance(map_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        return cv.applyColorMap(np.clip(map_matrix * 255, 0, 255).astype("uint8"), cv.COLORMAP_JET)
+
     def convert_image_to_rgb(self, img_matrix: ImgMatrix) -> ImgMatrix | NoReturn:
         """Метод конвертации изображения к RGB-формату.
 
@@ -169,6 +677,40 @@ class ImageCV:
         except Exception as e:
             raise self.exception(self.messages.IMG_CONVERT_GRAYSCALE_ERROR.format(msg=e.__str__()))
 
+    def get_image_hash(self, img_matrix: ImgMatrix) -> ImgHash | NoReturn:
+        """Метод получения хеша содержимого изображения по его пикселям.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+
+        Returns:
+            Хеш sha256 пикселей, размера и типа матрицы изображения.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        img_hash = hashlib.sha256(f"{img_matrix.shape}|{img_matrix.dtype}".encode())
+        img_hash.update(np.ascontiguousarray(img_matrix).data)
+        return img_hash.hexdigest()
+
+    def get_perceptual_hash(self, img_matrix: ImgMatrix) -> PerceptualHash | NoReturn:
+        """Метод получения перцептивного хеша изображения (difference hash, dHash).
+        Изображение сжимается до 9x8 в черно-белом формате, каждый бит хеша показывает,
+        ярче ли пиксель своего правого соседа. Похожие изображения имеют близкие хеши.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+
+        Returns:
+            64-битный хеш в виде шестнадцатеричной строки.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if len(img_matrix.shape) == 3:
+            img_matrix = self.convert_image_to_grayscale(img_matrix)
+        img_small: ImgMatrix = cv.resize(img_matrix, (9, 8), interpolation=cv.INTER_AREA)
+        bits: ImgMatrix = np.packbits(img_small[:, 1:] > img_small[:, :-1])
+        return bits.tobytes().hex()
+
     def is_images_the_same_pixels(
             self,
             img_first: ImgPath | ImgMatrix,
@@ -191,31 +733,411 @@ class ImageCV:
         img_matrix_first = self.read_image(img_first) if isinstance(img_first, ImgPath) else img_first
         img_matrix_second = self.read_image(img_second) if isinstance(img_second, ImgPath) else img_second
 
-        difference = cv.subtract(img_matrix_first, img_matrix_second)
-        colors_decomposition = cv.split(difference)
-        if len(colors_decomposition) == 1:
-            if cv.countNonZero(colors_decomposition[0]) == 0:
-                return True
+        if img_matrix_first.shape != img_matrix_second.shape:
             return False
+        # the largest absolute difference over all pixels and channels, computed without temporaries
+        return cv.norm(img_matrix_first, img_matrix_second, cv.NORM_INF) == 0
+
+    def get_squared_error(self, img_first: ImgMatrix, img_second: ImgMatrix) -> float | NoReturn:
+        """Метод вычисления суммы квадратов попиксельных разностей двух изображений одного размера.
+        Сумма считается за один проход без промежуточных копий матриц, нулевое значение
+        означает попиксельно одинаковые изображения.
 
-        blue, green, red = colors_decomposition
+        Args:
+            img_first: Матрица первого изображения.
+            img_second: Матрица второго изображения.
 
-        if cv.countNonZero(blue) == 0 and cv.countNonZero(green) == 0 and cv.countNonZero(red) == 0:
-            return True
-        return False
+        Returns:
+            Сумма квадратов разностей пикселей.
+        """
+        if not isinstance(img_first, ImgMatrix) or not isinstance(img_second, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if img_first.shape != img_second.shape:
+            raise self.exception(self.messages.IMG_SIZE_MISMATCH_ERROR)
+        return cv.norm(img_first, img_second, cv.NORM_L2SQR)
+
+    @staticmethod
+    def get_text_polygons(
+            img_matrix: ImgMatrix,
+            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH),
+            detect_only: bool = False,
+            exclusive: bool = True,
+            detector: TextDetector = TextDetector.EASYOCR
+    ) -> list[TextPolygon]:
+        """Метод поиска областей текста на изображении.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            languages: Языки текста на изображении.
+            detect_only: Только найти области текста без его распознавания (reader.detect),
+                иначе текст распознается (reader.readtext).
+            exclusive: Использовать модель распознавания текста монопольно.
+            detector: Способ поиска текста, для OpenCV языки и модель распознавания не используются.
+
+        Returns:
+            Список четырехугольников областей текста в виде матриц 4x2 с координатами вершин.
+        """
+        if detector == TextDetector.OPENCV:
+            return ImageCV.get_text_polygons_opencv(img_matrix)
+        with reader_pool.acquire(languages, exclusive) as reader:
+            if detect_only:
+                horizontal_list, free_list = reader.detect(img_matrix)
+                return ImageCV._get_detected_polygons(horizontal_list[0], free_list[0])
+            return ImageCV._get_recognized_polygons(reader.readtext(img_matrix))
+
+    @staticmethod
+    def get_text_polygons_opencv(
+            img_matrix: ImgMatrix,
+            kernel_size: ImgSize = OPENCV_TEXT_KERNEL_SIZE,
+            min_size: int = OPENCV_TEXT_MIN_SIZE,
+            max_height: int = OPENCV_TEXT_MAX_HEIGHT,
+            min_fill_ratio: float = OPENCV_TEXT_MIN_FILL_RATIO
+    ) -> list[TextPolygon]:
+        """Метод поиска областей текста классическими методами OpenCV без нейросети.
+        Контуры букв выделяются морфологическим градиентом и бинаризацией Оцу, буквы склеиваются в слова
+        горизонтальным замыканием, а слова находятся как связные компоненты. Компоненты вне диапазона
+        высот строки или слабо заполненные контурами (рамки, линии, фотографии) отбрасываются.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            kernel_size: Размер ядра замыкания (ширина, высота), склеивающего буквы в слова.
+            min_size: Минимальные ширина и высота области текста в пикселях.
+            max_height: Максимальная высота области текста в пикселях.
+            min_fill_ratio: Минимальная доля пикселей контуров в прямоугольнике области.
+
+        Returns:
+            Список прямоугольников областей текста в виде матриц 4x2 с координатами вершин.
+        """
+        gray: ImgMatrix = cv.cvtColor(img_matrix, cv.COLOR_BGR2GRAY) if img_matrix.ndim == 3 else img_matrix
+        gradient: ImgMatrix = cv.morphologyEx(
+            gray, cv.MORPH_GRADIENT, cv.getStructuringElement(cv.MORPH_ELLIPSE, (3, 3))
+        )
+        _, edges = cv.threshold(gradient, 0, 255, cv.THRESH_BINARY | cv.THRESH_OTSU)
+        words: ImgMatrix = cv.morphologyEx(edges, cv.MORPH_CLOSE, cv.getStructuringElement(cv.MORPH_RECT, kernel_size))
+
+        count, labels, stats, _ = cv.connectedComponentsWithStats(words, connectivity=8)
+        x, y, width, height = (stats[:, index] for index in range(4))
+        filled: np.ndarray = np.bincount(labels[edges > 0], minlength=count)
+        keep: np.ndarray = (
+            (width >= min_size) & (height >= min_size) & (height <= max_height)
+            & (filled >= min_fill_ratio * width * height)
+        )
+        keep[0] = False  # background
+
+        x, y = x[keep], y[keep]
+        right, bottom = x + width[keep] - 1, y + height[keep] - 1
+        corners: np.ndarray = np.stack([x, y, right, y, right, bottom, x, bottom], axis=1).astype("int32")
+        return list(corners.reshape(-1, 4, 2))
+
+    @staticmethod
+    def _get_detected_polygons(horizontal: list, free: list) -> list[TextPolygon]:
+        """Метод преобразования результата reader.detect для одного изображения в четырехугольники."""
+        # horizontal boxes are given as (x_min, x_max, y_min, y_max), free boxes as four vertices
+        polygons: list[TextPolygon] = [
+            np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]], dtype="int32")
+            for x_min, x_max, y_min, y_max in horizontal
+        ]
+        polygons.extend(np.array(box, dtype="int32") for box in free)
+        return polygons
+
+    @staticmethod
+    def _get_recognized_polygons(results: list) -> list[TextPolygon]:
+        """Метод преобразования результата reader.readtext для одного изображения в четырехугольники."""
+        return [np.array(result[0], dtype="int32") for result in results]
+
+    def get_text_polygons_batch(
+            self,
+            img_matrices: list[ImgMatrix],
+            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH),
+            detect_only: bool = False,
+            batch_size: int = 8,
+            tile_height: int = OCR_TILE_HEIGHT,
+            overlap: int = OCR_TILE_OVERLAP
+    ) -> list[list[TextPolygon]] | NoReturn:
+        """Метод поиска областей текста сразу на нескольких изображениях.
+        Изображения разбиваются на плитки, плитки одного размера передаются в модель пакетами,
+        поэтому накладные расходы на вызов модели оплачиваются один раз на пакет.
+        Области текста уже обработанных изображений берутся из кэша, в модель передаются только остальные.
+
+        Args:
+            img_matrices: Объекты изображений в виде попиксельных матриц.
+            languages: Языки текста на изображениях.
+            detect_only: Только найти области текста без его распознавания.
+            batch_size: Количество плиток в одном пакете.
+            tile_height: Высота плитки в пикселях.
+            overlap: Перекрытие соседних плиток в пикселях.
+
+        Returns:
+            Списки четырехугольников областей текста для каждого изображения в порядке изображений.
+        """
+        if not isinstance(img_matrices, list) or not all(isinstance(img, ImgMatrix) for img in img_matrices):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if not 0 <= overlap < tile_height or batch_size < 1:
+            raise self.exception(self.messages.INVALID_TILE_PARAMS_ERROR)
+
+        keys: list[CacheKey | None] = [
+            self.get_text_box_key(img_matrix, languages, detect_only, TextDetector.EASYOCR, 1.0, tile_height, overlap)
+            for img_matrix in img_matrices
+        ]
+        cached: list[list[TextPolygon] | None] = [key and self.cache.get(key) for key in keys]
+        groups: TileGroups = self._group_tiles_by_size(
+            [img_matrix for img_matrix, polygons in zip(img_matrices, cached) if polygons is None],
+            [index for index, polygons in enumerate(cached) if polygons is None],
+            tile_height,
+            overlap
+        )
+
+        polygons: list[list[TextPolygon]] = [[] for _ in img_matrices]
+        with reader_pool.acquire(languages) if groups else nullcontext() as reader:
+            for (height, *_), tiles in groups.items():
+                for start in range(0, len(tiles), batch_size):
+                    batch: list[tuple[int, int]] = tiles[start:start + batch_size]
+                    batch_tiles: list[ImgMatrix] = [img_matrices[index][top:top + height] for index, top in batch]
+                    for (index, top), tile_polygons in zip(
+                            batch, self._get_tiles_polygons(reader, batch_tiles, detect_only, batch_size)
+                    ):
+                        offset: np.ndarray = np.array([0, top], dtype="int32")
+                        polygons[index].extend(polygon + offset for polygon in tile_polygons)
+
+        return [
+            self._get_image_polygons(img_matrix, *image_polygons, tile_height)
+            for img_matrix, *image_polygons in zip(img_matrices, polygons, cached, keys)
+        ]
+
+    def _group_tiles_by_size(
+            self,
+            img_matrices: list[ImgMatrix],
+            indexes: list[int],
+            tile_height: int,
+            overlap: int
+    ) -> TileGroups:
+        """Метод разбиения изображений на плитки, сгруппированные по размеру плитки.
+
+        Returns:
+            Словарь, где ключ - размер плитки, а значение - список номеров изображений и верхних границ плиток.
+        """
+        groups: TileGroups = {}
+        for index, img_matrix in zip(indexes, img_matrices):
+            for top, bottom in self.get_overlapping_tile_bounds(img_matrix.shape[0], tile_height, overlap):
+                groups.setdefault((bottom - top, *img_matrix.shape[1:]), []).append((index, top))
+        return groups
+
+    @staticmethod
+    def _get_tiles_polygons(
+            reader: OcrReader,
+            tiles: list[ImgMatrix],
+            detect_only: bool,
+            batch_size: int
+    ) -> list[list[TextPolygon]]:
+        """Метод поиска областей текста на пакете плиток одного размера за один вызов модели."""
+        if detect_only:
+            horizontal_list, free_list = reader.detect(np.stack(tiles), reformat=False)
+            return [
+                ImageCV._get_detected_polygons(horizontal, free) for horizontal, free in zip(horizontal_list, free_list)
+            ]
+        return [
+            ImageCV._get_recognized_polygons(result) for result in reader.readtext_batched(tiles, batch_size=batch_size)
+        ]
+
+    def _get_image_polygons(
+            self,
+            img_matrix: ImgMatrix,
+            polygons: list[TextPolygon],
+            cached: list[TextPolygon] | None,
+            key: CacheKey | None,
+            tile_height: int
+    ) -> list[TextPolygon]:
+        """Метод получения итоговых областей текста изображения по областям его плиток.
+        Области из кэша возвращаются как есть, найденные по плиткам очищаются от дублей перекрытий и кэшируются.
+        """
+        if cached is not None:
+            return cached
+        if img_matrix.shape[0] > tile_height:
+            polygons = self.deduplicate_text_polygons(polygons)
+        if key:
+            self.cache.set(key, polygons)
+        return polygons
+
+    def hide_text_on_images(
+            self,
+            img_matrices: list[ImgMatrix],
+            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH),
+            detect_only: bool = False,
+            batch_size: int = 8,
+            detector: TextDetector = TextDetector.EASYOCR
+    ) -> list[ImgMatrix] | NoReturn:
+        """Метод пакетного скрытия текста на нескольких изображениях.
+
+        Args:
+            img_matrices: Объекты изображений в виде попиксельных матриц, закрашиваются на месте.
+            languages: Языки текста на изображениях.
+            detect_only: Только найти области текста без его распознавания.
+            batch_size: Количество плиток в одном пакете.
+            detector: Способ поиска текста, OpenCV обрабатывает изображения по одному без модели.
+
+        Returns:
+            Объекты изображений с закрашенным текстом в порядке изображений.
+        """
+        if detector == TextDetector.OPENCV:
+            if not isinstance(img_matrices, list):
+                raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+            polygons: list[list[TextPolygon]] = [
+                self.get_text_polygons_by_tiles(img, languages, detect_only, detector=detector) for img in img_matrices
+            ]
+        else:
+            polygons = self.get_text_polygons_batch(img_matrices, languages, detect_only, batch_size)
+        return [
+            self.fill_text_polygons(img_matrix, img_polygons)
+            for img_matrix, img_polygons in zip(img_matrices, polygons)
+        ]
+
+    @staticmethod
+    def get_overlapping_tile_bounds(length: int, tile_size: int, overlap: int) -> list[TileBounds]:
+        """Метод разбиения отрезка на плитки, перекрывающиеся на заданную величину.
+
+        Args:
+            length: Длина отрезка.
+            tile_size: Размер плитки.
+            overlap: Размер перекрытия соседних плиток.
+
+        Returns:
+            Список границ плиток в виде (начало, конец).
+        """
+        if length <= tile_size:
+            return [(0, length)]
+        step: int = tile_size - overlap
+        bounds: list[TileBounds] = [(start, start + tile_size) for start in range(0, length - tile_size, step)]
+        bounds.append((length - tile_size, length))
+        return bounds
+
+    @staticmethod
+    def deduplicate_text_polygons(polygons: list[TextPolygon], threshold: float = 0.8) -> list[TextPolygon]:
+        """Метод удаления повторно найденных областей текста.
+        Область удаляется, если она больше чем на threshold лежит внутри уже оставленной области большего размера.
+
+        Args:
+            polygons: Список четырехугольников областей текста.
+            threshold: Доля площади области, при перекрытии которой область считается повтором.
+
+        Returns:
+            Список четырехугольников без повторов.
+        """
+        if not polygons:
+            return []
+        boxes: np.ndarray = np.array([[*polygon.min(axis=0), *polygon.max(axis=0)] for polygon in polygons])
+        areas: np.ndarray = np.maximum(boxes[:, 2] - boxes[:, 0], 1) * np.maximum(boxes[:, 3] - boxes[:, 1], 1)
+
+        kept: list[int] = []
+        for index in np.argsort(-areas, kind="stable"):
+            if kept:
+                others: np.ndarray = boxes[kept]
+                width = np.minimum(others[:, 2], boxes[index, 2]) - np.maximum(others[:, 0], boxes[index, 0])
+                height = np.minimum(others[:, 3], boxes[index, 3]) - np.maximum(others[:, 1], boxes[index, 1])
+                if (np.clip(width, 0, None) * np.clip(height, 0, None) > threshold * areas[index]).any():
+                    continue
+            kept.append(index)
+        return [polygons[index] for index in sorted(kept)]
+
+    def get_text_polygons_by_tiles(
+            self,
+            img_matrix: ImgMatrix,
+            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH),
+            detect_only: bool = False,
+            scale: float = 1.0,
+            tile_height: int = OCR_TILE_HEIGHT,
+            overlap: int = OCR_TILE_OVERLAP,
+            max_workers: int = 1,
+            detector: TextDetector = TextDetector.EASYOCR
+    ) -> list[TextPolygon]:
+        """Метод поиска областей текста на высоком изображении по горизонтальным плиткам.
+        Каждая плитка при необходимости уменьшается, найденные области переводятся в координаты
+        исходного изображения, а повторы из зон перекрытия удаляются. Потребление памяти
+        ограничено размером плитки и не зависит от высоты изображения. Области текста сохраняются
+        в кэш по хешу пикселей изображения и параметрам поиска, поэтому повторный поиск не выполняется.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            languages: Языки текста на изображении.
+            detect_only: Только найти области текста без его распознавания.
+            scale: Масштаб, к которому приводятся плитки перед поиском текста.
+            tile_height: Высота плитки в пикселях исходного изображения.
+            overlap: Перекрытие соседних плиток в пикселях, должно быть больше высоты строки текста.
+            max_workers: Количество потоков для одновременной обработки плиток.
+            detector: Способ поиска текста.
+
+        Returns:
+            Список четырехугольников областей текста в координатах исходного изображения.
+        """
+        if not isinstance(img_matrix, ImgMatrix):
+            raise self.exception(self.messages.IMG_MATRIX_TYPE_ERROR)
+        if not 0 <= overlap < tile_height:
+            raise self.exception(self.messages.INVALID_TILE_PARAMS_ERROR)
+
+        def get_tile_polygons(bounds: TileBounds) -> list[TextPolygon]:
+            top, bottom = bounds
+            tile: ImgMatrix = img_matrix[top:bottom]
+            if scale != 1.0:
+                tile = cv.resize(tile, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+            polygons: list[TextPolygon] = self.get_text_polygons(
+                tile, languages, detect_only, max_workers == 1, detector
+            )
+            offset: np.ndarray = np.array([0, top], dtype="int32")
+            return [(polygon / scale).round().astype("int32") + offset for polygon in polygons]
+
+        key: CacheKey | None = self.get_text_box_key(
+            img_matrix, languages, detect_only, detector, scale, tile_height, overlap
+        )
+        cached: list[TextPolygon] | None = key and self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        tiles: list[TileBounds] = self.get_overlapping_tile_bounds(img_matrix.shape[0], tile_height, overlap)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            polygons: list[TextPolygon] = [
+                polygon for tile_polygons in executor.map(get_tile_polygons, tiles) for polygon in tile_polygons
+            ]
+        if len(tiles) > 1:
+            polygons = self.deduplicate_text_polygons(polygons)
+        if key:
+            self.cache.set(key, polygons)
+        return polygons
+
+    @staticmethod
+    def fill_text_polygons(img_matrix: ImgMatrix, polygons: list[TextPolygon]) -> ImgMatrix:
+        """Метод закрашивания областей текста цветом FILL_TEXT_COLOR.
+
+        Args:
+            img_matrix: Объект изображения в виде попиксельной матрицы.
+            polygons: Список четырехугольников областей текста.
+
+        Returns:
+            Объект изображения в виде попиксельной матрицы с закрашенными областями.
+        """
+        if polygons:
+            cv.fillPoly(img_matrix, polygons, FILL_TEXT_COLOR)
+        return img_matrix
 
     def found_and_hide_text_on_image(
             self,
             img_path: ImgPath,
             save_path: ImgSavePath | None = None,
-            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH)
+            languages: list[Language] = (Language.RUSSIAN, Language.ENGLISH),
+            detect_only: bool = False,
+            scale: float = 1.0,
+            max_workers: int = 1,
+            detector: TextDetector = TextDetector.EASYOCR
     ) -> ImgSavePath | NoReturn:
         """Метод для происка и скрытия текста на изображении.
+        Высокие изображения обрабатываются по перекрывающимся горизонтальным плиткам.
 
         Args:
             img_path: Путь до изображения.
             save_path: Путь сохранения изображения.
             languages: Языки текста на изображении.
+            detect_only: Только найти области текста без его распознавания, что заметно быстрее.
+            scale: Масштаб, к которому приводится изображение перед поиском текста.
+            max_workers: Количество потоков для одновременной обработки плиток.
+            detector: Способ поиска текста, OpenCV работает без нейросети и быстрее, но менее точно.
         """
         img_matrix: ImgMatrix = self.read_image(img_path)
 
@@ -224,14 +1146,77 @@ class ImageCV:
             save_path = img_path.replace(file_name, f"{file_name}_text_hided")
 
         try:
-            reader = easyocr.Reader(languages)
-            results = reader.readtext(img_matrix)
-
-            for result in results:
-                box = result[0]
-                x1, y1 = int(box[0][0]), int(box[0][1])
-                x2, y2 = int(box[2][0]), int(box[2][1])
-                cv.rectangle(img_matrix, (x1, y1), (x2, y2), FILL_TEXT_COLOR, cv.FILLED)
+            polygons: list[TextPolygon] = self.get_text_polygons_by_tiles(
+                img_matrix, languages, detect_only, scale, max_workers=max_workers, detector=detector
+            )
+            self.fill_text_polygons(img_matrix, polygons)
         except Exception as e:
             raise self.exception(self.messages.IMG_FOUND_AND_HIDE_TEXT_ERROR.format(msg=e.__str__()))
         return self.save_image(img_matrix, save_path)
+
+
+@dataclass
+class ImageArtifact:
+    """Класс изображения, передаваемого между этапами проверки в декодированном виде.
+    Скриншоты и скомпонованные PSD сразу становятся матрицами, а в файл изображение
+    кодируется только при явном сохранении артефакта.
+
+    Attributes:
+        name: Название артефакта.
+        matrix: Объект изображения в виде попиксельной матрицы в формате BGR.
+        path: Путь до сохраненного файла, None - артефакт не сохранялся.
+    """
+    name: str
+    matrix: ImgMatrix
+    path: ImgSavePath | None = None
+
+    @classmethod
+    def from_bytes(cls, name: str, img_bytes: bytes) -> "ImageArtifact":
+        """Метод создания артефакта из закодированного изображения.
+
+        Args:
+            name: Название артефакта.
+            img_bytes: Закодированное изображение.
+
+        Returns:
+            Артефакт с декодированным изображением.
+        """
+        return cls(name, ImageCV(cache=None).decode_image(img_bytes))
+
+    @classmethod
+    def from_composite(cls, name: str, composite: CompositeImg) -> "ImageArtifact":
+        """Метод создания артефакта из скомпонованного изображения PSD.
+
+        Args:
+            name: Название артефакта.
+            composite: Скомпонованное изображение.
+
+        Returns:
+            Артефакт с изображением.
+        """
+        return cls(name, ImageCV.convert_composite_to_matrix(composite))
+
+    @classmethod
+    def from_file(cls, name: str, img_path: ImgPath) -> "ImageArtifact":
+        """Метод создания артефакта из файла изображения.
+
+        Args:
+            name: Название артефакта.
+            img_path: Путь до изображения.
+
+        Returns:
+            Артефакт с изображением.
+        """
+        return cls(name, ImageCV(cache=None).read_image(img_path), img_path)
+
+    def save(self, save_path: ImgSavePath) -> ImgSavePath | NoReturn:
+        """Метод сохранения артефакта в файл.
+
+        Args:
+            save_path: Путь сохранения изображения.
+
+        Returns:
+            Путь до сохраненного изображения.
+        """
+        self.path = ImageCV(cache=None).save_image(self.matrix, save_path)
+        return self.path
@@ -0,0 +1,66 @@
+import importlib
+import sys
+from threading import Lock
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Класс отложенного импорта модуля.
+    Модуль импортируется при первом обращении к его атрибуту, что позволяет не загружать тяжелые
+    библиотеки (Keras, EasyOCR, scikit-image) при старте Django и в запросах, где они не нужны.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            name: Полное название модуля.
+        """
+        self._name: str = name
+        self._module: ModuleType | None = None
+        self._lock: Lock = Lock()
+
+    def _load(self) -> ModuleType:
+        """Метод импорта модуля при первом обращении.
+
+        Returns:
+            Импортированный модуль.
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}' ({'loaded' if self.is_loaded else 'not loaded'})>"
+
+    @property
+    def is_loaded(self) -> bool:
+        """Свойство проверки, импортирован ли модуль.
+
+        Returns:
+            True, если модуль уже импортирован, иначе False.
+        """
+        return self._module is not None or self._name in sys.modules
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Функция отложенного импорта модуля.
+
+    Args:
+        name: Полное название модуля.
+
+    Returns:
+        Объект модуля, импортируемого при первом обращении к атрибуту.
+    """
+    return LazyModule(name)
+
+
+easyocr = lazy_import("easyocr")
+psd_tools = lazy_import("psd_tools")
+skimage_metrics = lazy_import("skimage.metrics")
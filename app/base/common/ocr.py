@@ -0,0 +1,182 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Iterable, Iterator, NoReturn
+
+from app.base.common.general import setup_logging
+from app.base.common.lazy import easyocr
+from app.base.constants import Language, OCR_READER_MAX_IDLE
+from app.base.exceptions import ReaderPoolException, ReaderPoolMessages
+from app.base.types import OcrLanguages, OcrReader
+
+
+@dataclass
+class PooledReader:
+    """Класс загруженной модели распознавания текста.
+
+    Attributes:
+        reader: Экземпляр модели EasyOCR.
+        last_used: Время последнего использования по монотонным часам.
+        lock: Блокировка монопольного использования модели.
+        users: Количество потоков, использующих модель не монопольно.
+        users_lock: Блокировка счетчика потоков.
+    """
+    reader: OcrReader
+    last_used: float = field(default_factory=monotonic)
+    lock: Lock = field(default_factory=Lock)
+    users: int = 0
+    users_lock: Lock = field(default_factory=Lock)
+
+    @property
+    def in_use(self) -> bool:
+        """Свойство проверки, используется ли модель.
+
+        Returns:
+            True, если модель сейчас используется, иначе False.
+        """
+        return self.lock.locked() or self.users > 0
+
+
+class ReaderPool:
+    """Класс пула моделей распознавания текста EasyOCR.
+    Для каждого набора языков модель загружается один раз на процесс и выгружается после долгого простоя.
+    """
+    exception = ReaderPoolException
+    messages = ReaderPoolMessages
+
+    def __init__(self, max_idle: float | None = OCR_READER_MAX_IDLE) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            max_idle: Время простоя в секундах, после которого модель выгружается, None - не выгружать.
+        """
+        self.max_idle: float | None = max_idle
+        self._logger = setup_logging()
+        self._lock: Lock = Lock()
+        self._readers: dict[OcrLanguages, PooledReader] = {}
+        self._load_locks: dict[OcrLanguages, Lock] = {}
+
+    @staticmethod
+    def get_key(languages: Iterable[str]) -> OcrLanguages:
+        """Метод формирования ключа пула по набору языков.
+        Порядок языков не влияет на ключ, чтобы один набор не загружал несколько моделей.
+
+        Args:
+            languages: Языки текста.
+
+        Returns:
+            Отсортированный кортеж с кодами языков.
+        """
+        return tuple(sorted({str(language) for language in languages}))
+
+    def _get_loaded_reader(self, languages: OcrLanguages) -> PooledReader | None:
+        """Метод получения уже загруженной модели из пула."""
+        with self._lock:
+            pooled: PooledReader | None = self._readers.get(languages)
+            if pooled is not None:
+                # a reader handed out must not look idle to a concurrent eviction
+                pooled.last_used = monotonic()
+            return pooled
+
+    def _get_reader(self, languages: OcrLanguages) -> PooledReader | NoReturn:
+        """Метод получения модели из пула. При первом обращении модель загружается.
+        Модель загружается под блокировкой своего набора языков, поэтому загрузка не задерживает
+        обращения к другим моделям пула.
+        """
+        if (pooled := self._get_loaded_reader(languages)) is not None:
+            return pooled
+        with self._lock:
+            load_lock: Lock = self._load_locks.setdefault(languages, Lock())
+
+        with load_lock:
+            if (pooled := self._get_loaded_reader(languages)) is not None:
+                return pooled
+
+            start: float = perf_counter()
+            try:
+                pooled = PooledReader(easyocr.Reader(list(languages)))
+            except Exception as e:
+                raise self.exception(self.messages.READER_LOAD_ERROR.format(languages=languages, msg=e.__str__()))
+            self._logger.info(
+                self.messages.READER_LOADED.format(languages=languages, load_time=perf_counter() - start)
+            )
+            with self._lock:
+                self._readers[languages] = pooled
+            return pooled
+
+    @contextmanager
+    def acquire(
+            self,
+            languages: Iterable[str] = (Language.ENGLISH, Language.RUSSIAN),
+            exclusive: bool = True
+    ) -> Iterator[OcrReader] | NoReturn:
+        """Метод получения модели распознавания текста для набора языков на время использования.
+
+        Args:
+            languages: Языки текста.
+            exclusive: Использовать модель монопольно. Без монопольного доступа модель может
+                одновременно использоваться несколькими потоками, например для поиска текста по плиткам.
+
+        Returns:
+            Экземпляр модели EasyOCR.
+        """
+        self.evict_idle()
+        pooled: PooledReader = self._get_reader(self.get_key(languages))
+        if not exclusive:
+            with pooled.users_lock:
+                pooled.users += 1
+        try:
+            if exclusive:
+                with pooled.lock:
+                    yield pooled.reader
+            else:
+                yield pooled.reader
+        finally:
+            pooled.last_used = monotonic()
+            if not exclusive:
+                with pooled.users_lock:
+                    pooled.users -= 1
+
+    def preload(self, languages_sets: Iterable[Iterable[str]]) -> None:
+        """Метод предварительной загрузки моделей, например при старте процесса.
+
+        Args:
+            languages_sets: Наборы языков.
+        """
+        for languages in languages_sets:
+            self._get_reader(self.get_key(languages))
+
+    def evict_idle(self) -> list[OcrLanguages]:
+        """Метод выгрузки моделей, простаивающих дольше max_idle.
+
+        Returns:
+            Наборы языков выгруженных моделей.
+        """
+        if self.max_idle is None:
+            return []
+        evicted: list[OcrLanguages] = []
+        with self._lock:
+            for languages, pooled in list(self._readers.items()):
+                if monotonic() - pooled.last_used > self.max_idle and not pooled.in_use:
+                    del self._readers[languages]
+                    evicted.append(languages)
+                    self._logger.info(self.messages.READER_EVICTED.format(languages=languages))
+        return evicted
+
+    @property
+    def languages(self) -> list[OcrLanguages]:
+        """Свойство получения наборов языков загруженных моделей.
+
+        Returns:
+            Список наборов языков.
+        """
+        return list(self._readers)
+
+    def clear(self) -> None:
+        """Метод выгрузки всех моделей."""
+        with self._lock:
+            self._readers.clear()
+
+
+reader_pool = ReaderPool()
@@ -1,9 +1,49 @@
+import asyncio
+import atexit
+import mimetypes
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import NoReturn
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from threading import Lock, Thread
+from typing import Any, Coroutine, Iterator, NoReturn
+from urllib.parse import urlsplit
 
+from playwright.async_api import TimeoutError as AsyncPlaywrightTimeoutError, async_playwright
+
+from app.base.common.cache import DiskCache
+from app.base.common.general import is_file_exists, setup_logging
+from app.base.common.image import ImageArtifact
+from app.base.constants import (
+    RouteAction,
+    ASSET_CACHE_PATH,
+    ASSET_CACHE_MAX_SIZE,
+    ROUTE_BLOCKED_RESOURCE_TYPES,
+    ROUTE_BLOCKED_HOSTS,
+    ROUTE_CACHED_RESOURCE_TYPES,
+    ROUTE_CACHED_HOSTS,
+    BROWSER_POOL_SIZE,
+    BROWSER_POOL_MAX_USES,
+    ASYNC_RENDER_CONCURRENCY,
+    ASYNC_RENDER_TIMEOUT,
+)
 from app.base.exceptions import PlayWrightActionException, PlayWrightActionMessages
-from app.base.types import Driver, Browser, Config, PageLocator, PlayWrightPage, ScreenSavePath
+from app.base.types import (
+    Driver,
+    Browser,
+    BrowserContext,
+    Config,
+    PageLocator,
+    PlayWrightPage,
+    ScreenSavePath,
+    AsyncDriver,
+    AsyncBrowser,
+    AsyncBrowserContext,
+    AsyncPage,
+    PageAsset,
+    Path,
+)
+from main.settings import ROUTE_ALLOW_NETWORK
 
 
 class WebDriver(ABC):
@@ -44,16 +84,734 @@ class PlaywrightSettings:
         return self.__dict__
 
 
+@dataclass
+class RouteSettings:
+    """Класс настроек перехвата запросов страницы при рендеринге.
+
+    Attributes:
+        blocked_resource_types: Типы ресурсов, запросы которых отменяются.
+        blocked_hosts: Хосты (вместе с поддоменами), запросы к которым отменяются.
+        cached_resource_types: Типы ресурсов, которые отдаются из кэша ресурсов.
+        cached_hosts: Хосты, все ресурсы которых отдаются из кэша ресурсов.
+        allow_network: Разрешены ли запросы в сеть, False - внешние ресурсы не из кэша отменяются.
+    """
+    blocked_resource_types: tuple[str, ...] = ROUTE_BLOCKED_RESOURCE_TYPES
+    blocked_hosts: tuple[str, ...] = ROUTE_BLOCKED_HOSTS
+    cached_resource_types: tuple[str, ...] = ROUTE_CACHED_RESOURCE_TYPES
+    cached_hosts: tuple[str, ...] = ROUTE_CACHED_HOSTS
+    allow_network: bool = ROUTE_ALLOW_NETWORK
+
+
+@dataclass
+class RouteStats:
+    """Класс счетчиков перехваченных запросов страницы.
+
+    Attributes:
+        blocked: Количество отмененных запросов.
+        served: Количество запросов, отданных из кэша ресурсов.
+        fetched: Количество запросов, загруженных из сети и сохраненных в кэш ресурсов.
+        continued: Количество запросов, пропущенных без изменений.
+    """
+    blocked: int = 0
+    served: int = 0
+    fetched: int = 0
+    continued: int = 0
+
+    def add(self, action: RouteAction) -> None:
+        """Метод учета обработанного запроса.
+
+        Args:
+            action: Действие, примененное к запросу.
+        """
+        counter: str = {
+            RouteAction.BLOCK: "blocked",
+            RouteAction.SERVE: "served",
+            RouteAction.FETCH: "fetched",
+            RouteAction.CONTINUE: "continued",
+        }[action]
+        setattr(self, counter, getattr(self, counter) + 1)
+
+
+class AssetCache(DiskCache):
+    """Класс дискового кэша внешних ресурсов страниц (шрифтов, css-фреймворков).
+    Запись хранит тип содержимого в первой строке файла, затем тело ответа.
+    """
+    extension: str = "asset"
+
+    def _dump(self, path: Path, value: PageAsset) -> None:
+        with open(path, "wb") as file:
+            file.write(value["content_type"].encode() + b"\n" + value["body"])
+
+    def _load(self, path: Path) -> PageAsset:
+        with open(path, "rb") as file:
+            content_type, body = file.read().split(b"\n", 1)
+        return {"content_type": content_type.decode(), "body": body}
+
+    def get_asset_key(self, url: PageLocator) -> str:
+        """Метод формирования ключа записи по адресу ресурса.
+
+        Args:
+            url: Адрес ресурса.
+
+        Returns:
+            Ключ записи.
+        """
+        return self.get_key(url)
+
+    def has(self, url: PageLocator) -> bool:
+        """Метод проверки наличия ресурса в кэше без его чтения.
+
+        Args:
+            url: Адрес ресурса.
+
+        Returns:
+            True, если ресурс есть в кэше, иначе False.
+        """
+        return is_file_exists(self.get_path(self.get_asset_key(url)))
+
+    def seed(self, folder: Path, scheme: str = "https") -> list[PageLocator]:
+        """Метод заполнения кэша ресурсами из папки, в которой путь файла повторяет адрес ресурса: <хост>/<путь>.
+        Так кэш заполняется заранее для рендеринга без доступа в сеть. Тип содержимого определяется
+        по расширению файла, ресурсы, которые уже есть в кэше, не перезаписываются.
+
+        Args:
+            folder: Путь до папки с ресурсами.
+            scheme: Схема адресов ресурсов.
+
+        Returns:
+            Адреса добавленных ресурсов.
+        """
+        urls: list[PageLocator] = []
+        for root, _, files in os.walk(folder):
+            for name in sorted(files):
+                path: Path = os.path.join(root, name)
+                url: PageLocator = f"{scheme}://{os.path.relpath(path, folder).replace(os.sep, '/')}"
+                if self.has(url):
+                    continue
+                with open(path, "rb") as file:
+                    body: bytes = file.read()
+                content_type: str = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                self.set(self.get_asset_key(url), {"content_type": content_type, "body": body})
+                urls.append(url)
+        self._logger.info(self.messages.CACHE_SEEDED.format(path=folder, count=len(urls)))
+        return urls
+
+
+asset_cache = AssetCache(ASSET_CACHE_PATH, ASSET_CACHE_MAX_SIZE)
+
+
+class RequestRouter:
+    """Класс перехвата запросов страницы при рендеринге макета.
+    Запросы трекеров и заблокированных типов отменяются, известные внешние ресурсы отдаются
+    из дискового кэша, поэтому страница не ждет сторонних серверов и не зависает без сети.
+    Ресурс известного хоста, которого нет в кэше, один раз загружается из сети и сохраняется в кэш,
+    ресурсы остальных хостов в кэш не попадают.
+    """
+
+    def __init__(self, settings: RouteSettings | None = None, cache: AssetCache | None = asset_cache) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            settings: Настройки перехвата запросов.
+            cache: Кэш внешних ресурсов, None - без кэширования.
+        """
+        self.settings: RouteSettings = settings or RouteSettings()
+        self.cache: AssetCache | None = cache
+
+    @staticmethod
+    def is_host_matched(host: str, hosts: tuple[str, ...]) -> bool:
+        """Метод проверки, что хост совпадает с одним из хостов или является его поддоменом.
+
+        Args:
+            host: Проверяемый хост.
+            hosts: Хосты для сравнения.
+
+        Returns:
+            True, если хост найден, иначе False.
+        """
+        return any(host == item or host.endswith(f".{item}") for item in hosts)
+
+    def get_action(self, url: PageLocator, resource_type: str) -> RouteAction:
+        """Метод выбора действия над запросом страницы.
+        Локальные файлы и встроенные данные (file:, data:) пропускаются без изменений.
+
+        Args:
+            url: Адрес запроса.
+            resource_type: Тип ресурса по классификации playwright.
+
+        Returns:
+            Действие над запросом.
+        """
+        parsed = urlsplit(url)
+        if parsed.scheme not in ("http", "https"):
+            return RouteAction.CONTINUE
+
+        host: str = parsed.hostname or ""
+        if resource_type in self.settings.blocked_resource_types or self.is_host_matched(
+                host, self.settings.blocked_hosts
+        ):
+            return RouteAction.BLOCK
+        if self.cache is not None and (
+                resource_type in self.settings.cached_resource_types
+                or self.is_host_matched(host, self.settings.cached_hosts)
+        ) and self.cache.has(url):
+            return RouteAction.SERVE
+        return self.get_uncached_action(host)
+
+    def get_uncached_action(self, host: str) -> RouteAction:
+        """Метод выбора действия над внешним запросом, который не отдается из кэша.
+        Из сети в кэш загружаются только ресурсы известных хостов, остальные запросы
+        пропускаются без изменений или отменяются без доступа к сети.
+
+        Args:
+            host: Хост запроса.
+
+        Returns:
+            Действие над запросом.
+        """
+        if not self.settings.allow_network:
+            return RouteAction.BLOCK
+        if self.cache is not None and self.is_host_matched(host, self.settings.cached_hosts):
+            return RouteAction.FETCH
+        return RouteAction.CONTINUE
+
+    def get_cached_asset(self, url: PageLocator) -> PageAsset | None:
+        """Метод получения ресурса из кэша.
+
+        Args:
+            url: Адрес ресурса.
+
+        Returns:
+            Ресурс, либо None, если его нет в кэше.
+        """
+        return self.cache.get(self.cache.get_asset_key(url))
+
+    def set_cached_asset(self, url: PageLocator, status: int, headers: dict[str, str], body: bytes) -> None:
+        """Метод сохранения успешно загруженного ресурса в кэш.
+
+        Args:
+            url: Адрес ресурса.
+            status: Код ответа.
+            headers: Заголовки ответа.
+            body: Тело ответа.
+        """
+        if 200 <= status < 300:
+            content_type: str = headers.get("content-type", "application/octet-stream")
+            self.cache.set(self.cache.get_asset_key(url), {"content_type": content_type, "body": body})
+
+    @staticmethod
+    def get_fulfill_params(asset: PageAsset) -> dict[str, Any]:
+        """Метод получения параметров ответа на запрос ресурсом из кэша.
+        Шрифты запрашиваются как кросс-доменные ресурсы, поэтому ответ разрешает любой источник.
+
+        Args:
+            asset: Ресурс из кэша.
+
+        Returns:
+            Параметры для route.fulfill.
+        """
+        return {
+            "status": 200,
+            "body": asset["body"],
+            "content_type": asset["content_type"],
+            "headers": {"access-control-allow-origin": "*"},
+        }
+
+    def handle(self, route: Any, stats: RouteStats) -> None:
+        """Метод обработки перехваченного запроса синхронного API playwright.
+
+        Args:
+            route: Перехваченный запрос.
+            stats: Счетчики запросов страницы.
+        """
+        url: PageLocator = route.request.url
+        action: RouteAction = self.get_action(url, route.request.resource_type)
+        asset: PageAsset | None = self.get_cached_asset(url) if action is RouteAction.SERVE else None
+        if action is RouteAction.SERVE and asset is None:
+            # the asset was evicted after the check
+            action = self.get_uncached_action(urlsplit(url).hostname or "")
+        if asset is not None:
+            route.fulfill(**self.get_fulfill_params(asset))
+        elif action is RouteAction.FETCH:
+            try:
+                response = route.fetch()
+                body: bytes = response.body()
+            except Exception:
+                route.abort()
+                action = RouteAction.BLOCK
+            else:
+                self.set_cached_asset(url, response.status, response.headers, body)
+                route.fulfill(response=response, body=body)
+        elif action is RouteAction.CONTINUE:
+            route.continue_()
+        else:
+            action = RouteAction.BLOCK
+            route.abort("blockedbyclient")
+        stats.add(action)
+
+    async def handle_async(self, route: Any, stats: RouteStats) -> None:
+        """Метод обработки перехваченного запроса асинхронного API playwright.
+
+        Args:
+            route: Перехваченный запрос.
+            stats: Счетчики запросов страницы.
+        """
+        url: PageLocator = route.request.url
+        # the disk cache reads and writes files and evicts records, so it runs in a thread
+        # and does not stall the other pages rendered by the event loop
+        action: RouteAction = await asyncio.to_thread(self.get_action, url, route.request.resource_type)
+        asset: PageAsset | None = (
+            await asyncio.to_thread(self.get_cached_asset, url) if action is RouteAction.SERVE else None
+        )
+        if action is RouteAction.SERVE and asset is None:
+            # the asset was evicted after the check
+            action = self.get_uncached_action(urlsplit(url).hostname or "")
+        if asset is not None:
+            await route.fulfill(**self.get_fulfill_params(asset))
+        elif action is RouteAction.FETCH:
+            try:
+                response = await route.fetch()
+                body: bytes = await response.body()
+            except Exception:
+                await route.abort()
+                action = RouteAction.BLOCK
+            else:
+                await asyncio.to_thread(self.set_cached_asset, url, response.status, response.headers, body)
+                await route.fulfill(response=response, body=body)
+        elif action is RouteAction.CONTINUE:
+            await route.continue_()
+        else:
+            action = RouteAction.BLOCK
+            await route.abort("blockedbyclient")
+        stats.add(action)
+
+    def attach(self, target: PlayWrightPage | BrowserContext) -> RouteStats:
+        """Метод подключения перехвата запросов к странице или контексту синхронного API playwright.
+
+        Args:
+            target: Страница или контекст браузера.
+
+        Returns:
+            Счетчики запросов, обновляемые по мере загрузки страницы.
+        """
+        stats: RouteStats = RouteStats()
+
+        def handler(route: Any) -> None:
+            self.handle(route, stats)
+
+        target.route("**/*", handler)
+        return stats
+
+    async def attach_async(self, target: AsyncPage | AsyncBrowserContext) -> RouteStats:
+        """Метод подключения перехвата запросов к странице или контексту асинхронного API playwright.
+
+        Args:
+            target: Страница или контекст браузера.
+
+        Returns:
+            Счетчики запросов, обновляемые по мере загрузки страницы.
+        """
+        stats: RouteStats = RouteStats()
+
+        async def handler(route: Any) -> None:
+            await self.handle_async(route, stats)
+
+        await target.route("**/*", handler)
+        return stats
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+    """Класс браузера из пула.
+
+    Attributes:
+        browser: Экземпляр браузера.
+        uses: Количество выданных браузером контекстов.
+        active: Количество открытых контекстов браузера.
+    """
+    browser: Browser | AsyncBrowser
+    uses: int = 0
+    active: int = 0
+
+    @property
+    def is_healthy(self) -> bool:
+        """Свойство проверки, что процесс браузера жив и подключен.
+
+        Returns:
+            True, если браузером можно пользоваться, иначе False.
+        """
+        try:
+            return self.browser.is_connected()
+        except Exception:
+            return False
+
+
+class BrowserPoolBase:
+    """Базовый класс пула долгоживущих браузеров Chromium.
+    Вместо запуска браузера на каждую проверку пул выдает новые изолированные контексты
+    уже запущенных браузеров. Браузер перезапускается после max_uses выданных контекстов,
+    упавший или отключившийся браузер заменяется новым. Браузеры запускаются по мере
+    необходимости, но не больше size.
+    """
+
+    exception = PlayWrightActionException
+    messages = PlayWrightActionMessages
+
+    def __init__(
+            self,
+            driver: Driver | AsyncDriver,
+            configure: PlaywrightSettings | None = None,
+            size: int = BROWSER_POOL_SIZE,
+            max_uses: int = BROWSER_POOL_MAX_USES
+    ) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            driver: Драйвер playwright.
+            configure: Настройки для запуска браузеров.
+            size: Максимальное количество одновременно запущенных браузеров.
+            max_uses: Количество контекстов, после выдачи которых браузер перезапускается.
+        """
+        if size < 1 or max_uses < 1:
+            raise self.exception(self.messages.BROWSER_POOL_PARAMS_ERROR)
+        self._driver: Driver | AsyncDriver = driver
+        self._configure: Config = (configure or PlaywrightSettings()).__dict__
+        self.size: int = size
+        self.max_uses: int = max_uses
+        self._browsers: list[PooledBrowser] = []
+        self._leases: dict[BrowserContext | AsyncBrowserContext, PooledBrowser] = {}
+        self._closed: bool = False
+
+    @property
+    def browsers(self) -> list[PooledBrowser]:
+        """Свойство получения запущенных браузеров пула.
+
+        Returns:
+            Список браузеров пула.
+        """
+        return list(self._browsers)
+
+    def get_stale_browsers(self) -> list[PooledBrowser]:
+        """Метод получения браузеров, которые нужно закрыть: упавших и свободных, исчерпавших число использований.
+
+        Returns:
+            Список браузеров пула.
+        """
+        return [
+            pooled for pooled in self._browsers
+            if not pooled.is_healthy or (pooled.uses >= self.max_uses and not pooled.active)
+        ]
+
+    def select_browser(self) -> PooledBrowser | None:
+        """Метод выбора наименее загруженного браузера для нового контекста.
+
+        Returns:
+            Браузер пула, либо None, если все браузеры заняты и пул не заполнен и нужно запустить новый.
+        """
+        available: list[PooledBrowser] = [pooled for pooled in self._browsers if pooled.uses < self.max_uses]
+        if len(self._browsers) < self.size and all(pooled.active for pooled in available):
+            return None
+        # when every browser is exhausted but busy, the least busy one serves until it is idle
+        return min(available or self._browsers, key=lambda pooled: pooled.active)
+
+    def add_lease(self, pooled: PooledBrowser, context: BrowserContext | AsyncBrowserContext) -> None:
+        """Метод учета выданного контекста браузера.
+
+        Args:
+            pooled: Браузер пула.
+            context: Контекст браузера.
+        """
+        pooled.uses += 1
+        pooled.active += 1
+        self._leases[context] = pooled
+
+    def remove_lease(self, context: BrowserContext | AsyncBrowserContext) -> PooledBrowser | None:
+        """Метод снятия учета возвращенного контекста браузера.
+
+        Args:
+            context: Контекст браузера, полученный из пула.
+
+        Returns:
+            Свободный браузер, исчерпавший число использований или упавший, который нужно закрыть, иначе None.
+        """
+        pooled: PooledBrowser | None = self._leases.pop(context, None)
+        if pooled is None:
+            return None
+        pooled.active -= 1
+        if not pooled.active and (pooled.uses >= self.max_uses or not pooled.is_healthy):
+            return pooled
+        return None
+
+
+class BrowserPool(BrowserPoolBase):
+    """Класс пула долгоживущих браузеров Chromium поверх синхронного API playwright.
+    Пул используется из потока, в котором создан драйвер.
+    """
+
+    def __enter__(self) -> 'BrowserPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def launch_browser(self) -> PooledBrowser:
+        """Метод запуска нового браузера в пуле.
+
+        Returns:
+            Запущенный браузер.
+        """
+        try:
+            browser: Browser = self._driver.chromium.launch(**self._configure)
+        except Exception as e:
+            raise self.exception(self.messages.BROWSER_LAUNCH_ERROR.format(msg=e.__str__()))
+        pooled: PooledBrowser = PooledBrowser(browser)
+        self._browsers.append(pooled)
+        return pooled
+
+    def close_browser(self, pooled: PooledBrowser) -> None:
+        """Метод закрытия браузера и удаления его из пула.
+
+        Args:
+            pooled: Браузер пула.
+        """
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        try:
+            pooled.browser.close()
+        except Exception:
+            # the process of a crashed browser may already be gone
+            pass
+
+    def get_browser(self) -> PooledBrowser:
+        """Метод выбора браузера для нового контекста.
+        Упавшие браузеры и свободные браузеры, исчерпавшие число использований, закрываются.
+        Выбирается наименее загруженный браузер, новый запускается, если все заняты и пул не заполнен.
+
+        Returns:
+            Браузер пула.
+        """
+        for pooled in self.get_stale_browsers():
+            self.close_browser(pooled)
+        return self.select_browser() or self.launch_browser()
+
+    def _new_context(self, pooled: PooledBrowser, options: dict[str, Any]) -> BrowserContext:
+        try:
+            return pooled.browser.new_context(**options)
+        except Exception as e:
+            raise self.exception(self.messages.BROWSER_CONTEXT_ERROR.format(msg=e.__str__()))
+
+    def new_context(self, **options) -> BrowserContext:
+        """Метод получения нового изолированного контекста браузера из пула.
+        Если браузер упал при создании контекста, он заменяется и попытка повторяется.
+        Контекст нужно вернуть в пул методом release.
+
+        Args:
+            **options: Параметры контекста playwright (viewport, locale и т.п.).
+
+        Returns:
+            Контекст браузера.
+        """
+        if self._closed:
+            raise self.exception(self.messages.BROWSER_POOL_CLOSED_ERROR)
+
+        pooled: PooledBrowser = self.get_browser()
+        try:
+            context: BrowserContext = self._new_context(pooled, options)
+        except self.exception:
+            if pooled.is_healthy:
+                raise
+            self.close_browser(pooled)
+            pooled = self.launch_browser()
+            context = self._new_context(pooled, options)
+
+        self.add_lease(pooled, context)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """Метод закрытия контекста и возвращения его браузера в пул.
+        Свободный браузер, исчерпавший число использований или упавший, закрывается.
+
+        Args:
+            context: Контекст браузера, полученный из пула.
+        """
+        pooled: PooledBrowser | None = self.remove_lease(context)
+        try:
+            context.close()
+        except Exception:
+            pass
+        if pooled is not None:
+            self.close_browser(pooled)
+
+    @contextmanager
+    def page(self, **options) -> Iterator[PlayWrightPage]:
+        """Метод получения страницы в новом контексте, который закрывается по выходу из блока.
+
+        Args:
+            **options: Параметры контекста playwright.
+
+        Returns:
+            Страница браузера.
+        """
+        context: BrowserContext = self.new_context(**options)
+        try:
+            yield context.new_page()
+        finally:
+            self.release(context)
+
+    def close(self) -> None:
+        """Метод закрытия всех контекстов и браузеров пула."""
+        self._closed = True
+        for context in list(self._leases):
+            self.release(context)
+        for pooled in self.browsers:
+            self.close_browser(pooled)
+
+
+class AsyncBrowserPool(BrowserPoolBase):
+    """Класс пула долгоживущих браузеров Chromium поверх асинхронного API playwright.
+    Пул используется из цикла событий, в котором создан драйвер.
+    """
+
+    def __init__(
+            self,
+            driver: AsyncDriver,
+            configure: PlaywrightSettings | None = None,
+            size: int = BROWSER_POOL_SIZE,
+            max_uses: int = BROWSER_POOL_MAX_USES
+    ) -> None:
+        """Инициализация параметров для запуска."""
+        super().__init__(driver, configure, size, max_uses)
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'AsyncBrowserPool':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def launch_browser(self) -> PooledBrowser:
+        """Метод запуска нового браузера в пуле.
+
+        Returns:
+            Запущенный браузер.
+        """
+        try:
+            browser: AsyncBrowser = await self._driver.chromium.launch(**self._configure)
+        except Exception as e:
+            raise self.exception(self.messages.BROWSER_LAUNCH_ERROR.format(msg=e.__str__()))
+        pooled: PooledBrowser = PooledBrowser(browser)
+        self._browsers.append(pooled)
+        return pooled
+
+    async def close_browser(self, pooled: PooledBrowser) -> None:
+        """Метод закрытия браузера и удаления его из пула.
+
+        Args:
+            pooled: Браузер пула.
+        """
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        try:
+            await pooled.browser.close()
+        except Exception:
+            # the process of a crashed browser may already be gone
+            pass
+
+    async def get_browser(self) -> PooledBrowser:
+        """Метод выбора браузера для нового контекста по тем же правилам, что и в синхронном пуле.
+
+        Returns:
+            Браузер пула.
+        """
+        for pooled in self.get_stale_browsers():
+            await self.close_browser(pooled)
+        return self.select_browser() or await self.launch_browser()
+
+    async def _new_context(self, pooled: PooledBrowser, options: dict[str, Any]) -> AsyncBrowserContext:
+        try:
+            return await pooled.browser.new_context(**options)
+        except Exception as e:
+            raise self.exception(self.messages.BROWSER_CONTEXT_ERROR.format(msg=e.__str__()))
+
+    async def new_context(self, **options) -> AsyncBrowserContext:
+        """Метод получения нового изолированного контекста браузера из пула.
+        Контексты выдаются по очереди, поэтому одновременные страницы не запускают браузеров больше size.
+        Контекст нужно вернуть в пул методом release.
+
+        Args:
+            **options: Параметры контекста playwright (viewport, locale и т.п.).
+
+        Returns:
+            Контекст браузера.
+        """
+        async with self._lock:
+            if self._closed:
+                raise self.exception(self.messages.BROWSER_POOL_CLOSED_ERROR)
+
+            pooled: PooledBrowser = await self.get_browser()
+            try:
+                context: AsyncBrowserContext = await self._new_context(pooled, options)
+            except self.exception:
+                if pooled.is_healthy:
+                    raise
+                await self.close_browser(pooled)
+                pooled = await self.launch_browser()
+                context = await self._new_context(pooled, options)
+
+            self.add_lease(pooled, context)
+            return context
+
+    async def release(self, context: AsyncBrowserContext) -> None:
+        """Метод закрытия контекста и возвращения его браузера в пул.
+        Свободный браузер, исчерпавший число использований или упавший, закрывается.
+
+        Args:
+            context: Контекст браузера, полученный из пула.
+        """
+        pooled: PooledBrowser | None = self.remove_lease(context)
+        try:
+            await context.close()
+        except Exception:
+            pass
+        if pooled is not None:
+            await self.close_browser(pooled)
+
+    async def close(self) -> None:
+        """Метод закрытия всех контекстов и браузеров пула."""
+        self._closed = True
+        for context in list(self._leases):
+            await self.release(context)
+        for pooled in self.browsers:
+            await self.close_browser(pooled)
+
+
 class PlayWrightBrowser(WebDriver):
     """Класс playwright веб-драйвера."""
 
     exception = PlayWrightActionException
     messages = PlayWrightActionMessages
 
-    def __init__(self, driver: Driver, configure: 'PlaywrightSettings' = None):
-        """Инициализация параметров для запуска."""
+    def __init__(
+            self,
+            driver: Driver,
+            configure: 'PlaywrightSettings' = None,
+            pool: BrowserPool | None = None,
+            router: RequestRouter | None = None
+    ):
+        """Инициализация параметров для запуска.
+
+        Args:
+            driver: Драйвер playwright.
+            configure: Настройки для инициализации браузера.
+            pool: Пул браузеров, None - запуск собственного браузера.
+            router: Перехват запросов новых страниц, None - без перехвата.
+        """
         super().__init__(driver)
-        self.initialize_browser(configure.__dict__)
+        self._pool: BrowserPool | None = pool
+        self.router: RequestRouter | None = router
+        self.route_stats: dict[PlayWrightPage, RouteStats] = {}
+        if pool is None:
+            self.initialize_browser(configure.__dict__)
 
     def initialize_browser(self, configure: Config) -> None:
         """Метод инициализации браузера.
@@ -85,17 +843,33 @@ class PlayWrightBrowser(WebDriver):
         Returns:
             Экземпляр страницы браузера.
         """
-        if not self._browser:
+        if self._pool is not None:
+            # the page lives in its own context, which goes back to the pool when the page is closed
+            context: BrowserContext = self._pool.new_context()
+            page: PlayWrightPage = context.new_page()
+            page.on("close", lambda _: self._pool.release(context))
+        elif not self._browser:
             raise self.exception(self.messages.INITIALIZE_BROWSER_ERROR)
-        return self.browser.new_page()
+        else:
+            page = self.browser.new_page()
+
+        if self.router is not None:
+            self.route_stats[page] = self.router.attach(page)
+        return page
 
 
 class PlayWrightAction(PlayWrightBrowser):
     """Класс для взаимодействия с playwright."""
 
-    def __init__(self, driver: Driver, configure: 'PlaywrightSettings' = None):
+    def __init__(
+            self,
+            driver: Driver,
+            configure: 'PlaywrightSettings' = None,
+            pool: BrowserPool | None = None,
+            router: RequestRouter | None = None
+    ):
         """Инициализация параметров для запуска."""
-        super().__init__(driver, configure)
+        super().__init__(driver, configure, pool, router)
 
     def goto_page(self, page: PlayWrightPage, url: PageLocator) -> PageLocator:
         """Метод перехода на страницу.
@@ -117,6 +891,19 @@ class PlayWrightAction(PlayWrightBrowser):
         except Exception as e:
             raise self.exception(self.messages.PAGE_LOCATOR_ERROR.format(msg=e.__str__()))
 
+    @staticmethod
+    def close_page(page: PlayWrightPage) -> None:
+        """Метод закрытия страницы браузера.
+
+        Args:
+            page: Инициализированная страница.
+        """
+        try:
+            page.close()
+        except Exception:
+            # the page of a crashed browser is already closed
+            pass
+
     def get_screenshot_page(
             self,
             page: PlayWrightPage,
@@ -125,6 +912,7 @@ class PlayWrightAction(PlayWrightBrowser):
             full_page: bool = True
     ) -> ScreenSavePath | NoReturn:
         """Метод получения скриншота страницы.
+        Страница закрывается после снимка, контекст страницы из пула при этом возвращается в пул.
 
         Args:
             page: Инициализированная страница.
@@ -137,9 +925,401 @@ class PlayWrightAction(PlayWrightBrowser):
         """
         if not isinstance(page, PlayWrightPage):
             raise self.exception(self.messages.PAGE_TYPE_ERROR)
-        self.goto_page(page, url)
         try:
+            self.goto_page(page, url)
             page.screenshot(path=screen_save_path, full_page=full_page)
             return screen_save_path
+        except self.exception:
+            raise
+        except Exception as e:
+            raise self.exception(self.messages.GET_SCREENSHOT_PAGE_ERROR.format(msg=e.__str__()))
+        finally:
+            self.close_page(page)
+
+    def get_screenshot_image(
+            self,
+            page: PlayWrightPage,
+            url: PageLocator,
+            name: str = "screenshot",
+            full_page: bool = True
+    ) -> ImageArtifact | NoReturn:
+        """Метод получения скриншота страницы в виде декодированного изображения без записи в файл.
+        Страница закрывается после снимка, контекст страницы из пула при этом возвращается в пул.
+
+        Args:
+            page: Инициализированная страница.
+            url: Локатор страницы.
+            name: Название артефакта скриншота.
+            full_page: сохранить страницу целиком.
+
+        Returns:
+            Артефакт с изображением страницы.
+        """
+        if not isinstance(page, PlayWrightPage):
+            raise self.exception(self.messages.PAGE_TYPE_ERROR)
+        try:
+            self.goto_page(page, url)
+            return ImageArtifact.from_bytes(name, page.screenshot(full_page=full_page))
+        except self.exception:
+            raise
+        except Exception as e:
+            raise self.exception(self.messages.GET_SCREENSHOT_PAGE_ERROR.format(msg=e.__str__()))
+        finally:
+            self.close_page(page)
+
+
+class AsyncPlayWrightAction:
+    """Класс одновременного получения скриншотов страниц через асинхронный API playwright.
+    Каждая страница открывается в собственном контексте браузера или пула браузеров, число одновременно
+    открытых страниц ограничено семафором, загрузка и снимок страницы - таймаутом. Поэтому
+    архив из многих страниц обрабатывается примерно за время самой медленной из них.
+    """
+
+    exception = PlayWrightActionException
+    messages = PlayWrightActionMessages
+
+    def __init__(
+            self,
+            driver: AsyncDriver,
+            configure: PlaywrightSettings | None = None,
+            concurrency: int = ASYNC_RENDER_CONCURRENCY,
+            timeout: float = ASYNC_RENDER_TIMEOUT,
+            router: RequestRouter | None = None,
+            pool: AsyncBrowserPool | None = None,
+            semaphore: asyncio.Semaphore | None = None
+    ) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            driver: Асинхронный драйвер playwright.
+            configure: Настройки для запуска браузера.
+            concurrency: Максимальное количество одновременно открытых страниц.
+            timeout: Время ожидания загрузки и снимка одной страницы в секундах.
+            router: Перехват запросов страниц, None - без перехвата.
+            pool: Пул браузеров, из которого берутся контексты страниц, None - запуск собственного браузера.
+            semaphore: Общий с другими вызовами семафор открытых страниц, None - собственный семафор на concurrency.
+        """
+        if concurrency < 1 or timeout <= 0:
+            raise self.exception(self.messages.ASYNC_RENDER_PARAMS_ERROR)
+        self._driver: AsyncDriver = driver
+        self._configure: Config = (configure or PlaywrightSettings()).__dict__
+        self.concurrency: int = concurrency
+        self.timeout: float = timeout
+        self.router: RequestRouter | None = router
+        self.route_stats: dict[str, RouteStats] = {}
+        self._semaphore: asyncio.Semaphore = semaphore or asyncio.Semaphore(concurrency)
+        self._logger = setup_logging()
+        self._pool: AsyncBrowserPool | None = pool
+        self._browser: AsyncBrowser | None = None
+
+    async def __aenter__(self) -> 'AsyncPlayWrightAction':
+        if self._pool is None:
+            await self.initialize_browser()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def initialize_browser(self) -> None:
+        """Метод запуска браузера."""
+        try:
+            self._browser = await self._driver.chromium.launch(**self._configure)
+        except Exception as e:
+            raise self.exception(self.messages.BROWSER_LAUNCH_ERROR.format(msg=e.__str__()))
+
+    @property
+    def browser(self) -> AsyncBrowser:
+        """Свойство получения экземпляра браузера.
+
+        Returns:
+            Экземпляр браузера.
+        """
+        if not self._browser:
+            raise self.exception(self.messages.INITIALIZE_BROWSER_ERROR)
+        return self._browser
+
+    async def close(self) -> None:
+        """Метод закрытия собственного браузера. Браузеры пула остаются запущенными."""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+
+    async def new_context(self) -> AsyncBrowserContext:
+        """Метод получения нового контекста из пула или собственного браузера.
+
+        Returns:
+            Контекст браузера.
+        """
+        if self._pool is not None:
+            return await self._pool.new_context()
+        return await self.browser.new_context()
+
+    async def release(self, context: AsyncBrowserContext) -> None:
+        """Метод закрытия контекста, контекст из пула возвращается в пул.
+
+        Args:
+            context: Контекст браузера.
+        """
+        if self._pool is not None:
+            await self._pool.release(context)
+        else:
+            await context.close()
+
+    @staticmethod
+    async def _take_screenshot(page: AsyncPage, url: PageLocator, full_page: bool) -> bytes:
+        await page.goto(url)
+        return await page.screenshot(full_page=full_page)
+
+    async def get_screenshot_image(
+            self,
+            url: PageLocator,
+            name: str = "screenshot",
+            full_page: bool = True
+    ) -> ImageArtifact | NoReturn:
+        """Метод получения скриншота страницы в отдельном контексте браузера.
+
+        Args:
+            url: Локатор страницы.
+            name: Название артефакта скриншота.
+            full_page: сохранить страницу целиком.
+
+        Returns:
+            Артефакт с изображением страницы.
+        """
+        if not isinstance(url, PageLocator):
+            raise self.exception(self.messages.PAGE_TYPE_LOCATOR_ERROR)
+
+        async with self._semaphore:
+            context: AsyncBrowserContext = await self.new_context()
+            stats: RouteStats | None = None
+            try:
+                if self.router is not None:
+                    stats = self.route_stats[name] = await self.router.attach_async(context)
+                page: AsyncPage = await context.new_page()
+                page.set_default_timeout(self.timeout * 1000)
+                screenshot: bytes = await asyncio.wait_for(
+                    self._take_screenshot(page, url, full_page), self.timeout
+                )
+            except (TimeoutError, AsyncPlaywrightTimeoutError):
+                raise self.exception(self.messages.PAGE_TIMEOUT_ERROR.format(url=url, timeout=self.timeout))
+            except Exception as e:
+                raise self.exception(self.messages.GET_SCREENSHOT_PAGE_ERROR.format(msg=e.__str__()))
+            finally:
+                await self.release(context)
+                if stats is not None:
+                    self._logger.info(self.messages.PAGE_ROUTE_STATS.format(name=name, **asdict(stats)))
+
+        # decoding runs in a thread, so the event loop keeps driving the other pages
+        try:
+            return await asyncio.to_thread(ImageArtifact.from_bytes, name, screenshot)
         except Exception as e:
             raise self.exception(self.messages.GET_SCREENSHOT_PAGE_ERROR.format(msg=e.__str__()))
+
+    async def get_screenshot_images(
+            self,
+            urls: list[PageLocator],
+            names: list[str] | None = None,
+            full_page: bool = True
+    ) -> list[ImageArtifact] | NoReturn:
+        """Метод одновременного получения скриншотов нескольких страниц.
+        Все страницы дорабатывают до конца, после чего выбрасывается первая по порядку ошибка.
+
+        Args:
+            urls: Локаторы страниц.
+            names: Названия артефактов, None - screenshot_<номер страницы>.
+            full_page: сохранить страницы целиком.
+
+        Returns:
+            Артефакты с изображениями страниц в порядке локаторов.
+        """
+        names = names if names is not None else [f"screenshot_{number}" for number in range(len(urls))]
+        if len(names) != len(urls):
+            raise self.exception(self.messages.PAGE_NAMES_COUNT_ERROR)
+
+        results: list[ImageArtifact | BaseException] = await asyncio.gather(
+            *(self.get_screenshot_image(url, name, full_page) for url, name in zip(urls, names)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    @classmethod
+    def render(
+            cls,
+            urls: list[PageLocator],
+            names: list[str] | None = None,
+            configure: PlaywrightSettings | None = None,
+            full_page: bool = True,
+            **kwargs
+    ) -> list[ImageArtifact] | NoReturn:
+        """Метод получения скриншотов страниц из синхронного кода.
+        Запускает драйвер и браузер на время вызова в новом цикле событий, поэтому подходит
+        для разовых вызовов. Для повторяющихся проверок используется page_renderer.
+
+        Args:
+            urls: Локаторы страниц.
+            names: Названия артефактов, None - screenshot_<номер страницы>.
+            configure: Настройки для запуска браузера.
+            full_page: сохранить страницы целиком.
+            **kwargs: Параметры concurrency, timeout и router.
+
+        Returns:
+            Артефакты с изображениями страниц в порядке локаторов.
+        """
+        async def run() -> list[ImageArtifact]:
+            async with async_playwright() as driver, cls(driver, configure, **kwargs) as action:
+                return await action.get_screenshot_images(urls, names, full_page)
+
+        return asyncio.run(run())
+
+
+class PageRenderer:
+    """Класс долгоживущего получения скриншотов страниц из синхронного кода.
+    Цикл событий, драйвер playwright и пул браузеров запускаются один раз на процесс в фоновом потоке
+    при первом вызове и переиспользуются следующими вызовами, на каждую страницу создаются только
+    новые контекст и страница. Браузеры пула перезапускаются после max_uses контекстов или падения.
+    Число одновременно открытых страниц ограничено одним семафором на все вызовы из всех потоков.
+    """
+
+    exception = PlayWrightActionException
+    messages = PlayWrightActionMessages
+
+    def __init__(
+            self,
+            configure: PlaywrightSettings | None = None,
+            size: int = BROWSER_POOL_SIZE,
+            max_uses: int = BROWSER_POOL_MAX_USES,
+            concurrency: int = ASYNC_RENDER_CONCURRENCY
+    ) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            configure: Настройки для запуска браузеров.
+            size: Максимальное количество одновременно запущенных браузеров.
+            max_uses: Количество контекстов, после выдачи которых браузер перезапускается.
+            concurrency: Максимальное количество одновременно открытых страниц всех вызовов.
+        """
+        if size < 1 or max_uses < 1:
+            raise self.exception(self.messages.BROWSER_POOL_PARAMS_ERROR)
+        if concurrency < 1:
+            raise self.exception(self.messages.ASYNC_RENDER_PARAMS_ERROR)
+        self._configure: PlaywrightSettings | None = configure
+        self.size: int = size
+        self.max_uses: int = max_uses
+        self.concurrency: int = concurrency
+        self._lock: Lock = Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._driver: AsyncDriver | None = None
+        self._pool: AsyncBrowserPool | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Свойство проверки, что фоновый поток с циклом событий запущен.
+
+        Returns:
+            True, если поток запущен, иначе False.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pool(self) -> AsyncBrowserPool | None:
+        """Свойство получения пула браузеров.
+
+        Returns:
+            Пул браузеров, None - пул еще не запущен.
+        """
+        return self._pool
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Метод выполнения корутины в цикле событий фонового потока с ожиданием результата.
+
+        Args:
+            coroutine: Корутина.
+
+        Returns:
+            Результат корутины.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def start(self) -> None:
+        """Метод запуска фонового потока с циклом событий, драйвера playwright и пула браузеров."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self._loop.run_forever, name="page-renderer", daemon=True)
+            self._thread.start()
+            try:
+                self.run(self._start())
+            except Exception as e:
+                self._stop_loop()
+                raise self.exception(self.messages.BROWSER_LAUNCH_ERROR.format(msg=e.__str__()))
+
+    async def _start(self) -> None:
+        self._driver = await async_playwright().start()
+        self._pool = AsyncBrowserPool(self._driver, self._configure, self.size, self.max_uses)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def _render(
+            self,
+            urls: list[PageLocator],
+            names: list[str] | None,
+            full_page: bool,
+            **kwargs
+    ) -> list[ImageArtifact]:
+        action = AsyncPlayWrightAction(self._driver, pool=self._pool, semaphore=self._semaphore, **kwargs)
+        return await action.get_screenshot_images(urls, names, full_page)
+
+    def render(
+            self,
+            urls: list[PageLocator],
+            names: list[str] | None = None,
+            full_page: bool = True,
+            **kwargs
+    ) -> list[ImageArtifact] | NoReturn:
+        """Метод получения скриншотов страниц через пул долгоживущих браузеров.
+        Может вызываться из нескольких потоков, страницы всех вызовов обрабатываются одним циклом событий.
+
+        Args:
+            urls: Локаторы страниц.
+            names: Названия артефактов, None - screenshot_<номер страницы>.
+            full_page: сохранить страницы целиком.
+            **kwargs: Параметры timeout и router.
+
+        Returns:
+            Артефакты с изображениями страниц в порядке локаторов.
+        """
+        self.start()
+        return self.run(self._render(urls, names, full_page, **kwargs))
+
+    async def _close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        if self._driver is not None:
+            await self._driver.stop()
+            self._driver = None
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop, self._thread = None, None
+
+    def close(self) -> None:
+        """Метод закрытия пула браузеров, драйвера и фонового потока."""
+        with self._lock:
+            if not self.is_running:
+                return
+            try:
+                self.run(self._close())
+            finally:
+                self._stop_loop()
+
+
+page_renderer = PageRenderer()
+atexit.register(page_renderer.close)
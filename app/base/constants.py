@@ -1,10 +1,109 @@
+import os
+
 from app.base.common.general import StringEnum
+from main.settings import DISK_CACHE_PATH, ROUTE_EXTRA_BLOCKED_HOSTS, ROUTE_EXTRA_CACHED_HOSTS
 
 # text color coloring of words on the page, GREEN color
 FILL_TEXT_COLOR = (0, 255, 0)  # GREEN color
 
+# on-disk cache of neural network feature vectors
+EMBEDDING_CACHE_PATH = os.path.join(DISK_CACHE_PATH, "embeddings")
+EMBEDDING_CACHE_MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+# on-disk cache of composited PSD templates
+COMPOSITE_CACHE_PATH = os.path.join(DISK_CACHE_PATH, "composites")
+COMPOSITE_CACHE_MAX_SIZE = 512 * 1024 * 1024  # bytes
+
+# on-disk cache of text regions found on images
+TEXT_BOX_CACHE_PATH = os.path.join(DISK_CACHE_PATH, "text_boxes")
+TEXT_BOX_CACHE_MAX_SIZE = 64 * 1024 * 1024  # bytes
+
+# on-disk cache of external page assets (fonts, css frameworks) served while rendering layouts
+ASSET_CACHE_PATH = os.path.join(DISK_CACHE_PATH, "assets")
+ASSET_CACHE_MAX_SIZE = 128 * 1024 * 1024  # bytes
+
+# text recognition readers unused for longer than this are unloaded
+OCR_READER_MAX_IDLE = 30 * 60  # seconds
+
+# text search on tall screenshots runs over horizontal tiles overlapping by more than a text line
+OCR_TILE_HEIGHT = 2048  # pixels
+OCR_TILE_OVERLAP = 128  # pixels
+
+# classical text detector: letters are joined into words by a horizontal closing, components outside
+# the height range or filled less than the ratio (frames, photos, lines) are not text
+OPENCV_TEXT_KERNEL_SIZE = (9, 1)  # pixels, width and height
+OPENCV_TEXT_MIN_SIZE = 8  # pixels
+OPENCV_TEXT_MAX_HEIGHT = 80  # pixels
+OPENCV_TEXT_MIN_FILL_RATIO = 0.3
+
+# streaming comparison of tall images reads both images by horizontal bands of this height
+STREAM_BAND_HEIGHT = 1024  # pixels
+
+# pool of long-lived browsers: a browser is relaunched after handing out this many contexts
+BROWSER_POOL_SIZE = 2
+BROWSER_POOL_MAX_USES = 50
+
+# concurrent rendering of pages: number of simultaneously open pages and a load and screenshot limit per page
+ASYNC_RENDER_CONCURRENCY = 4
+ASYNC_RENDER_TIMEOUT = 30  # seconds
+
+# request routing while rendering: requests of blocked types or to trackers are aborted,
+# fonts, stylesheets and files of known cdn hosts are served from the asset cache;
+# network access and additional hosts are configured in the settings
+ROUTE_BLOCKED_RESOURCE_TYPES = ("media", "websocket", "eventsource")
+ROUTE_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "mc.yandex.ru",
+    "hotjar.com",
+    *ROUTE_EXTRA_BLOCKED_HOSTS,
+)
+ROUTE_CACHED_RESOURCE_TYPES = ("font", "stylesheet")
+ROUTE_CACHED_HOSTS = (
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "cdn.jsdelivr.net",
+    "cdnjs.cloudflare.com",
+    "unpkg.com",
+    "stackpath.bootstrapcdn.com",
+    "maxcdn.bootstrapcdn.com",
+    *ROUTE_EXTRA_CACHED_HOSTS,
+)
+
+# perceptual hash prefilter: pairs further apart than this Hamming distance (of 64 bits) are not similar
+PERCEPTUAL_HASH_SIZE = 64  # bits
+PERCEPTUAL_HASH_MAX_DISTANCE = 20
+
 class Language(StringEnum):
     """Класс с языками."""
 
     ENGLISH = 'en'
     RUSSIAN = 'ru'
+
+
+class NeuralNetwork(StringEnum):
+    """Класс с моделями нейросетей."""
+
+    VGG16 = 'vgg16'
+    MOBILENET_V2 = 'mobilenet_v2'
+    MOBILENET_V3 = 'mobilenet_v3'
+    EFFICIENTNET_B0 = 'efficientnet_b0'
+    RESNET50 = 'resnet50'
+
+
+class TextDetector(StringEnum):
+    """Класс со способами поиска текста на изображении."""
+
+    EASYOCR = 'easyocr'
+    OPENCV = 'opencv'
+
+
+class RouteAction(StringEnum):
+    """Класс с действиями над запросами страницы при рендеринге."""
+
+    BLOCK = 'block'
+    SERVE = 'serve'
+    FETCH = 'fetch'
+    CONTINUE = 'continue'
@@ -15,6 +15,15 @@ class PlayWrightActionMessages(StringEnum):
     PAGE_LOCATOR_ERROR: str = "Ошибка при переходе на страницу браузера: {msg}!"
     PAGE_TYPE_ERROR: str = "Неверный тип страницы!"
     GET_SCREENSHOT_PAGE_ERROR: str = "Ошибка при получении скриншота страницы: {msg}!"
+    BROWSER_POOL_PARAMS_ERROR: str = "Размер пула и число использований браузера должны быть положительными!"
+    BROWSER_POOL_CLOSED_ERROR: str = "Пул браузеров закрыт!"
+    BROWSER_CONTEXT_ERROR: str = "Ошибка при создании контекста браузера: {msg}!"
+    ASYNC_RENDER_PARAMS_ERROR: str = "Число одновременно открытых страниц и таймаут должны быть положительными!"
+    PAGE_NAMES_COUNT_ERROR: str = "Количество названий не совпадает с количеством страниц!"
+    PAGE_TIMEOUT_ERROR: str = "Превышено время ожидания страницы {url}: {timeout} с!"
+    PAGE_ROUTE_STATS: str = (
+        "Запросы страницы {name}: отменено {blocked}, из кэша {served}, загружено {fetched}, пропущено {continued}"
+    )
 
 
 class ImageException(FormException):
@@ -45,7 +54,12 @@ class ImageCVMessages(StringEnum):
     IMG_MATRIX_TYPE_ERROR: str = "Ошибка типа изображения!"
     IMG_IS_SAME_TYPE_ERROR: str = "Ошибка типа при сравнении изображений!"
     IMG_SIZE_TYPE_ERROR: str = "Ошибка типа изменения изображения!"
+    INVALID_TILE_PARAMS_ERROR: str = "Перекрытие плиток должно быть неотрицательным и меньше их высоты!"
+    INVALID_REDUCE_FACTOR_ERROR: str = "Коэффициент уменьшения при считывании должен быть 1, 2, 4 или 8!"
+    IMG_SIZE_MISMATCH_ERROR: str = "Размеры изображений не совпадают!"
     IMG_READ_ERROR: str = "Ошибка при считывании изображения: {msg}!"
+    IMG_BYTES_TYPE_ERROR: str = "Некорректный тип закодированного изображения!"
+    IMG_DECODE_ERROR: str = "Не удалось декодировать изображение!"
     IMG_SAVE_ERROR: str = "Ошибка при сохранении изображения: {msg}!"
     IMG_RESIZE_ERROR: str = "Ошибка при изменении разрешения изображения: {msg}!"
     IMG_CONVERT_RGB_ERROR: str = "Ошибка при конвертации изображения к RGB-формату: {msg}!"
@@ -60,6 +74,50 @@ class ComparatorMessages(StringEnum):
     """Сообщения для класса Comparator."""
 
     INVALID_IMG_TYPE_ERROR: str = "Некорректный тип изображения!"
+    INVALID_IMGS_TYPE_ERROR: str = "Некорректный тип списка изображений!"
+    UNKNOWN_BACKBONE_ERROR: str = "Неизвестная сверточная нейросеть: {backbone}!"
     PREPARE_IMG_TYPE_ERROR: str = "Ошибка типа при подготовке к сравнению изображений!"
     PREPARE_IMG: str = "Подготовка изображения к сравнению..."
     RESULT_COMPARATOR: str = "Изображения похожи на {percent} процента"
+    PYRAMID_LEVEL_DECIDED: str = "Схожесть определена на уровне пирамиды {level}"
+    PERCEPTUAL_HASH_DISTANCE: str = "Расстояние между перцептивными хешами изображений: {distance}"
+    STREAMING_METHOD_ERROR: str = "Методы не поддерживают потоковое сравнение: {methods}!"
+    STREAMING_IMG_SIZE_ERROR: str = "Изображения слишком малы для потокового сравнения!"
+
+
+class ModelRegistryException(FormException):
+    """Исключение ModelRegistry."""
+
+
+class ModelRegistryMessages(StringEnum):
+    """Сообщения для класса ModelRegistry."""
+
+    UNKNOWN_MODEL_ERROR: str = "Неизвестная модель нейросети: {name}!"
+    MODEL_LOAD_ERROR: str = "Ошибка при загрузке модели нейросети {name}: {msg}!"
+    MODEL_LOADED: str = "Модель {name} загружена за {load_time:.2f} с, размер весов {weights_size} байт"
+    MODEL_WARM_UP: str = "Прогрев модели {name}..."
+
+
+class ReaderPoolException(FormException):
+    """Исключение ReaderPool."""
+
+
+class ReaderPoolMessages(StringEnum):
+    """Сообщения для класса ReaderPool."""
+
+    READER_LOAD_ERROR: str = "Ошибка при загрузке модели распознавания текста для языков {languages}: {msg}!"
+    READER_LOADED: str = "Модель распознавания текста для языков {languages} загружена за {load_time:.2f} с"
+    READER_EVICTED: str = "Модель распознавания текста для языков {languages} выгружена после простоя"
+
+
+class CacheException(FormException):
+    """Исключение DiskCache."""
+
+
+class CacheMessages(StringEnum):
+    """Сообщения для класса DiskCache."""
+
+    CACHE_READ_ERROR: str = "Ошибка при чтении записи кэша {path}: {msg}!"
+    CACHE_WRITE_ERROR: str = "Ошибка при записи в кэш {path}: {msg}!"
+    CACHE_EVICT: str = "Запись кэша {path} удалена при вытеснении"
+    CACHE_SEEDED: str = "В кэш добавлено записей из папки {path}: {count}"
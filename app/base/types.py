@@ -1,8 +1,15 @@
-from typing import Any, Literal, TypedDict
+from typing import Any, Callable, Literal, TypedDict
 
 from numpy import ndarray
-from playwright.sync_api._generated import Browser, Page
+from PIL.Image import Image as PILImage
+from playwright.sync_api._generated import Browser, BrowserContext, Page
 from playwright.sync_api import Playwright
+from playwright.async_api import (
+    Browser as AsyncPlaywrightBrowser,
+    BrowserContext as AsyncPlaywrightContext,
+    Page as AsyncPlaywrightPage,
+    Playwright as AsyncPlaywright,
+)
 
 Path = str
 
@@ -10,10 +17,16 @@ Path = str
 Config = dict[str, Any]
 Driver = Playwright
 Browser = Browser
+BrowserContext = BrowserContext
 ScreenSavePath = Path
 PageLocator = str
 PlaywrightConfig = dict[str, Any]
 PlayWrightPage = Page
+AsyncDriver = AsyncPlaywright
+AsyncBrowser = AsyncPlaywrightBrowser
+AsyncBrowserContext = AsyncPlaywrightContext
+AsyncPage = AsyncPlaywrightPage
+PageAsset = dict[str, bytes | str]
 
 # typing for Image class
 ImgPath = Path
@@ -22,6 +35,11 @@ ImgSize = tuple[int, int]
 FromFormatImg = Literal["psd"]
 ToFormatImg = Literal["png"]
 ImgMatrix = ndarray
+PerceptualHash = str
+CompositeImg = PILImage
+LayerBox = tuple[int, int, int, int]
+TextPolygon = ndarray
+TileGroups = dict[tuple[int, ...], list[tuple[int, int]]]
 
 # typing for Comparator class
 Similarity = float | int
@@ -29,6 +47,36 @@ SimilarityResult = float
 ToGrayscale = float
 FeatureMatrix = ndarray
 
+
 class ComparatorResult(TypedDict):
     is_similar: str
     percent: float
+
+
+class TiledComparatorResult(ComparatorResult):
+    tiles: list[list[float]]
+
+
+ComparatorResults = dict[str, ComparatorResult]
+TileBounds = tuple[int, int]
+
+# typing for DiskCache class
+CacheKey = str
+ImgHash = str
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    count: int
+    size: int
+
+
+# typing for ReaderPool class
+OcrLanguages = tuple[str, ...]
+OcrReader = Any
+
+# typing for ModelRegistry class
+ModelName = str
+NeuralNetworkModel = Any
+ModelLoader = Callable[[], NeuralNetworkModel]
@@ -1,31 +1,50 @@
-from abc import ABC
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
+import cv2 as cv
 import numpy as np
-from keras.src.applications.vgg16 import VGG16, preprocess_input
-from skimage.metrics import structural_similarity
-from sklearn.metrics.pairwise import cosine_similarity
 
-from app.base.common.general import setup_logging, StringEnum
+from app.base.common.general import setup_logging, StringEnum, get_hamming_distance
 from app.base.common.image import ImageCV
+from app.base.common.lazy import skimage_metrics
+from app.base.constants import NeuralNetwork, PERCEPTUAL_HASH_MAX_DISTANCE, PERCEPTUAL_HASH_SIZE, STREAM_BAND_HEIGHT
 from app.base.exceptions import ComparatorException, ComparatorMessages
 from app.base.types import (
     ImgPath,
     Similarity,
     ImgMatrix,
     ComparatorResult,
+    ComparatorResults,
+    TiledComparatorResult,
+    TileBounds,
     SimilarityResult,
     ImgSize,
+    ImgSavePath,
+    PerceptualHash,
     ToGrayscale,
-    FeatureMatrix
+    FeatureMatrix,
+    ModelName,
+    Path
 )
+from app.compare.neural_network import BACKBONES, FeatureExtractor
+
 
 class IsSimilar(StringEnum):
     YES: str = "yes"
     NO: str = "no"
 
 
+class ComparisonMethod(StringEnum):
+    MSE: str = "mse"
+    SSIM: str = "ssim"
+    VGG16: str = "vgg16"
+    NEURAL_NETWORK: str = "neural_network"
+
+
 @dataclass
 class ComparatorData:
     """Класс с данными для класса Comparator."""
@@ -33,7 +52,14 @@ class ComparatorData:
     img_second: ImgPath | ImgMatrix
 
 
-class ComparatorBase(ComparatorData, ABC):
+@dataclass
+class BatchComparatorData:
+    """Класс с данными для класса BatchComparator."""
+    img_reference: ImgPath | ImgMatrix
+    imgs_compared: list[ImgPath | ImgMatrix]
+
+
+class ComparatorBase(ABC):
     """Базовый класс сравнения."""
     exception = ComparatorException
     messages = ComparatorMessages
@@ -42,19 +68,78 @@ class ComparatorBase(ComparatorData, ABC):
         """Инициализация параметров для запуска."""
         super().__init__(**kwargs)
         self._logger = setup_logging()
+        self.image_cv: ImageCV = ImageCV()
         self._validate_params()
 
+    @abstractmethod
     def _validate_params(self) -> None:
-        self._validate_img(self.img_first)
-        self._validate_img(self.img_second)
+        """Метод для валидации параметров сравнения."""
 
     def _validate_img(self, img: Any) -> None:
         """Метод для валидации значения изображения."""
         if not isinstance(img, (ImgPath, ImgMatrix)):
             raise self.exception(self.messages.INVALID_IMG_TYPE_ERROR)
 
+    def get_image_matrix(
+            self,
+            img: ImgPath | ImgMatrix,
+            img_shape: ImgSize | None = None,
+            to_grayscale: ToGrayscale = False
+    ) -> ImgMatrix:
+        """Метод получения матрицы изображения.
+        Изображение из файла сразу декодируется в черно-белом формате и уменьшенным настолько,
+        насколько позволяет итоговый размер img_shape.
+
+        Args:
+            img: Путь до изображения или матрица изображения.
+            img_shape: Итоговый размер изображения, None - размер не известен заранее.
+            to_grayscale: Считать изображение в черно-белом формате.
+
+        Returns:
+            Матрица изображения.
+        """
+        if not isinstance(img, (ImgPath, ImgMatrix)):
+            raise self.exception(self.messages.PREPARE_IMG_TYPE_ERROR)
+        if isinstance(img, ImgMatrix):
+            return img
+        reduce: int = self.image_cv.get_reduce_factor(img, img_shape) if img_shape else 1
+        return self.image_cv.read_image(img, to_grayscale, reduce)
+
+    def get_features(self, img_matrices: list[ImgMatrix], backbone: ModelName) -> FeatureMatrix:
+        """Метод получения векторов признаков изображений сверточной нейросетью.
+        Матрицы OpenCV хранятся в формате BGR, а предобработка моделей Keras ожидает RGB,
+        поэтому цветные изображения переводятся в RGB, как и в движке сравнения.
+
+        Args:
+            img_matrices: Матрицы изображений, приведенные к размеру входа нейросети.
+            backbone: Название сверточной нейросети.
+
+        Returns:
+            Матрица признаков, по одной строке на изображение.
+        """
+        return FeatureExtractor(backbone).get_features([
+            self.image_cv.convert_image_to_rgb(img_matrix) if img_matrix.ndim == 3 else img_matrix
+            for img_matrix in img_matrices
+        ])
+
+    def return_comparison_results(self, result: SimilarityResult, similarity: Similarity) -> ComparatorResult:
+        """Метод форматирования результатов сравнения.
+
+        Args:
+            result: Результат сравнения.
+            similarity: Порог схожести.
+
+        Returns:
+            Результат сравнения в виде словаря.
+        """
+        percent: float = result * 100
+        is_similar: str = IsSimilar.YES if result >= similarity else IsSimilar.NO
+        results: ComparatorResult = {"is_similar": is_similar, "percent": percent}
+        self._logger.info(self.messages.RESULT_COMPARATOR.format(percent=percent))
+        return results
+
 
-class Comparator(ComparatorBase):
+class Comparator(ComparatorBase, ComparatorData):
     """Класс сравнения.
     Для начала сравнения двух изображений необходимо:
     1. Представить изображения в виде попиксельной матрицы.
@@ -63,23 +148,12 @@ class Comparator(ComparatorBase):
     После этого уже проводить сравнения.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        """Инициализация параметров для запуска."""
-        super().__init__(**kwargs)
-        self.image_cv: ImageCV = ImageCV()
-
-    def get_image_matrix(self, img: ImgPath | ImgMatrix) -> ImgMatrix:
-        """Метод выполнения основной логики сравнения двух изображений на схожесть.
-
-        Args:
-            img: Путь до изображения или матрица изображения.
+    hash_first: PerceptualHash | None = None
+    hash_second: PerceptualHash | None = None
 
-        Returns:
-            Матрица изображения.
-        """
-        if not isinstance(img, (ImgPath, ImgMatrix)):
-            raise self.exception(self.messages.PREPARE_IMG_TYPE_ERROR)
-        return self.image_cv.read_image(img) if isinstance(img, ImgPath) else img
+    def _validate_params(self) -> None:
+        self._validate_img(self.img_first)
+        self._validate_img(self.img_second)
 
     def normalize_image_size(self, img_matrix_first, img_matrix_second) -> tuple[ImgMatrix, ImgMatrix]:
         """Метод нормализации размера изображений.
@@ -92,35 +166,35 @@ class Comparator(ComparatorBase):
             Кортеж с матрицей первого нормализированного изображения и второго.
         """
         img_first_shape = img_matrix_first.shape
-        img_second_shape = img_matrix_first.shape
+        img_second_shape = img_matrix_second.shape
         if img_first_shape[0] * img_first_shape[1] < img_second_shape[0] * img_second_shape[1]:
             img_matrix_second = self.image_cv.resize_image(img_matrix_second, (img_first_shape[1], img_first_shape[0]))
         else:
             img_matrix_first = self.image_cv.resize_image(img_matrix_first, (img_second_shape[1], img_second_shape[0]))
         return img_matrix_first, img_matrix_second
 
-    def prepare_images(
+    def prepare_image_matrices(
             self,
+            img_matrix_first: ImgMatrix,
+            img_matrix_second: ImgMatrix,
             img_shape: ImgSize | None = None,
             to_grayscale: ToGrayscale = True
     ) -> tuple[ImgMatrix, ImgMatrix]:
-        """Метод подготовки изображений для сравнения.
+        """Метод подготовки уже считанных матриц изображений для сравнения.
 
         Args:
+            img_matrix_first: Матрица первого изображения.
+            img_matrix_second: Матрица второго изображения.
             img_shape: Размер изображения.
             to_grayscale: Преобразовать изображения в черно-белые.
 
         Returns:
             Кортеж с матрицей первого и второго изображений.
         """
-        self._logger.info(self.messages.PREPARE_IMG)
-        # transformation into matrix
-        img_matrix_first: ImgMatrix = self.get_image_matrix(self.img_first)
-        img_matrix_second: ImgMatrix = self.get_image_matrix(self.img_second)
-
-        if to_grayscale:
-            # convert to grayscale
+        # convert to grayscale, images read from files are already decoded in grayscale
+        if to_grayscale and img_matrix_first.ndim == 3:
             img_matrix_first: ImgMatrix = self.image_cv.convert_image_to_grayscale(img_matrix_first)
+        if to_grayscale and img_matrix_second.ndim == 3:
             img_matrix_second: ImgMatrix = self.image_cv.convert_image_to_grayscale(img_matrix_second)
 
         # normalize size
@@ -129,28 +203,89 @@ class Comparator(ComparatorBase):
             img_matrix_second = self.image_cv.resize_image(img_matrix_second, img_shape)
             return img_matrix_first, img_matrix_second
 
-        if img_matrix_first.shape[0] * img_matrix_first.shape[1] < img_matrix_second.shape[0] * img_matrix_second.shape[1]:
-            img_matrix_second = self.image_cv.resize_image(img_matrix_second, (img_matrix_first.shape[1], img_matrix_first.shape[0]))
-        else:
-            img_matrix_first = self.image_cv.resize_image(img_matrix_first, (img_matrix_second.shape[1], img_matrix_second.shape[0]))
-
-        return img_matrix_first, img_matrix_second
+        return self.normalize_image_size(img_matrix_first, img_matrix_second)
 
-    def return_comparison_results(self, result: SimilarityResult, similarity: Similarity) -> ComparatorResult:
-        """Метод форматирования результатов сравнения.
+    def prepare_images(
+            self,
+            img_shape: ImgSize | None = None,
+            to_grayscale: ToGrayscale = True
+    ) -> tuple[ImgMatrix, ImgMatrix]:
+        """Метод подготовки изображений для сравнения.
 
         Args:
-            result: Результат сравнения.
-            similarity: Порог схожести.
+            img_shape: Размер изображения.
+            to_grayscale: Преобразовать изображения в черно-белые.
 
         Returns:
-            Результат сравнения в виде словаря.
+            Кортеж с матрицей первого и второго изображений.
         """
-        percent: float = result * 100
-        is_similar: str = IsSimilar.YES if result >= similarity else IsSimilar.NO
-        results: ComparatorResult = {"is_similar": is_similar, "percent": percent}
-        self._logger.info(self.messages.RESULT_COMPARATOR.format(percent=percent))
-        return results
+        self._logger.info(self.messages.PREPARE_IMG)
+        # transformation into matrix
+        img_matrix_first: ImgMatrix = self.get_image_matrix(self.img_first, img_shape, to_grayscale)
+        img_matrix_second: ImgMatrix = self.get_image_matrix(self.img_second, img_shape, to_grayscale)
+
+        return self.prepare_image_matrices(img_matrix_first, img_matrix_second, img_shape, to_grayscale)
+
+    def _compare_by_mean_squared_error(
+            self,
+            img_first: ImgMatrix,
+            img_second: ImgMatrix,
+            similarity: Similarity
+    ) -> ComparatorResult:
+        """Метод сравнения подготовленных изображений по методу среднеквадратичной ошибки."""
+        error: float = self.image_cv.get_squared_error(img_first, img_second)
+        if error == 0:
+            return {"is_similar": IsSimilar.YES, "percent": 100.0}
+
+        error /= float(img_first.shape[0] * img_first.shape[1])
+        result: SimilarityResult = round(1 - error / 255**2, 2)
+
+        return self.return_comparison_results(result, similarity)
+
+    def _compare_by_structural_similarity_index(
+            self,
+            img_first: ImgMatrix,
+            img_second: ImgMatrix,
+            similarity: Similarity,
+            pyramid_levels: int = 0,
+            pyramid_margin: float = 0.05
+    ) -> ComparatorResult:
+        """Метод сравнения подготовленных изображений по индексу структурного сходства.
+        При pyramid_levels > 0 индекс сначала вычисляется на уменьшенных копиях изображений и
+        уточняется на следующем уровне пирамиды, только если он ближе pyramid_margin к порогу схожести."""
+        if self.image_cv.is_images_the_same_pixels(img_first, img_second):
+            return {"is_similar": IsSimilar.YES, "percent": 100.0}
+
+        pyramid_first: list[ImgMatrix] = self.image_cv.get_image_pyramid(img_first, pyramid_levels)
+        pyramid_second: list[ImgMatrix] = self.image_cv.get_image_pyramid(img_second, pyramid_levels)
+        for level in range(len(pyramid_first) - 1, 0, -1):
+            result: np.float64 | float = skimage_metrics.structural_similarity(
+                pyramid_first[level], pyramid_second[level]
+            )
+            if abs(result - similarity) > pyramid_margin:
+                self._logger.info(self.messages.PYRAMID_LEVEL_DECIDED.format(level=level))
+                break
+        else:
+            result: np.float64 | float = skimage_metrics.structural_similarity(img_first, img_second)
+        result: SimilarityResult = round(float(result), 2)
+
+        return self.return_comparison_results(result, similarity)
+
+    def _compare_by_neural_network(
+            self,
+            img_first: ImgMatrix,
+            img_second: ImgMatrix,
+            similarity: Similarity,
+            backbone: ModelName
+    ) -> ComparatorResult:
+        """Метод сравнения подготовленных изображений на основе сверточной нейросети."""
+        if self.image_cv.is_images_the_same_pixels(img_first, img_second):
+            return {"is_similar": IsSimilar.YES, "percent": 100.0}
+
+        features: FeatureMatrix = self.get_features([img_first, img_second], backbone)
+        result: SimilarityResult = FeatureExtractor.get_cosine_similarities(features[0], features[1:])[0].item()
+
+        return self.return_comparison_results(result, similarity)
 
     def compare_by_mean_squared_error(self, similarity: Similarity = 0.85) -> ComparatorResult:
         """Метод определения схожести изображений по методу среднеквадратичной ошибки (Mean Squared Error - MSE).
@@ -162,58 +297,468 @@ class Comparator(ComparatorBase):
             Результат сравнения в виде словаря.
         """
         img_first, img_second = self.prepare_images()
-        if self.image_cv.is_images_the_same_pixels(img_first, img_second):
+        return self._compare_by_mean_squared_error(img_first, img_second, similarity)
+
+    def _compare_by_perceptual_hash(
+            self,
+            img_matrix_first: ImgMatrix,
+            img_matrix_second: ImgMatrix,
+            max_distance: int
+    ) -> ComparatorResult | None:
+        """Метод предварительного сравнения изображений по перцептивному хешу.
+        Вычисленные хеши сохраняются в атрибутах hash_first и hash_second."""
+        self.hash_first = self.image_cv.get_perceptual_hash(img_matrix_first)
+        self.hash_second = self.image_cv.get_perceptual_hash(img_matrix_second)
+        distance: int = get_hamming_distance(self.hash_first, self.hash_second)
+        self._logger.info(self.messages.PERCEPTUAL_HASH_DISTANCE.format(distance=distance))
+
+        if distance == 0:
             return {"is_similar": IsSimilar.YES, "percent": 100.0}
+        if distance > max_distance:
+            return {"is_similar": IsSimilar.NO, "percent": round((1 - distance / PERCEPTUAL_HASH_SIZE) * 100, 2)}
+        return None
 
-        error = np.sum((img_first.astype("float") - img_second.astype("float")) ** 2)
-        error /= float(img_first.shape[0] * img_first.shape[1])
-        result: SimilarityResult = round(1 - error / 255**2, 2).item()
+    def compare_by_perceptual_hash(self, max_distance: int = PERCEPTUAL_HASH_MAX_DISTANCE) -> ComparatorResult | None:
+        """Метод быстрого определения схожести изображений по перцептивному хешу.
+        Совпадающие хеши означают практически одинаковые изображения, расстояние больше
+        допустимого - заведомо разные изображения. В остальных случаях вердикта нет.
 
-        return self.return_comparison_results(result, similarity)
+        Args:
+            max_distance: Допустимое расстояние Хэмминга между хешами.
+
+        Returns:
+            Результат сравнения в виде словаря, либо None, если требуется точное сравнение.
+        """
+        img_matrix_first: ImgMatrix = self.get_image_matrix(self.img_first)
+        img_matrix_second: ImgMatrix = self.get_image_matrix(self.img_second)
+        return self._compare_by_perceptual_hash(img_matrix_first, img_matrix_second, max_distance)
 
-    def compare_by_structural_similarity_index(self, similarity: Similarity = 0.55) -> ComparatorResult:
+    def compare_by_structural_similarity_index(
+            self,
+            similarity: Similarity = 0.55,
+            max_hash_distance: int | None = None,
+            pyramid_levels: int = 0,
+            pyramid_margin: float = 0.05
+    ) -> ComparatorResult:
         """Метод определения схожести изображений по методу измерения индекса структурного сходства
         (Structural Similarity Index Measure - SSIM).
+        Режим пирамиды выключен по умолчанию. Индекс уменьшенных изображений лишь приближает индекс
+        полного разрешения, поэтому при решении на грубом уровне вердикт и процент берутся с этого уровня,
+        а запас pyramid_margin выбирается вызывающим кодом под свои изображения.
 
         Args:
             similarity: Порог схожести.
+            max_hash_distance: Допустимое расстояние между перцептивными хешами, None - без предварительной проверки.
+            pyramid_levels: Количество уменьшенных уровней пирамиды, 0 - сравнение только в полном разрешении.
+            pyramid_margin: Близость индекса к порогу схожести, при которой сравнение уточняется на следующем уровне.
 
         Returns:
             Результат сравнения в виде словаря.
         """
+        if max_hash_distance is not None and (result := self.compare_by_perceptual_hash(max_hash_distance)):
+            return result
         img_first, img_second = self.prepare_images()
-        if self.image_cv.is_images_the_same_pixels(img_first, img_second):
-            return {"is_similar": IsSimilar.YES, "percent": 100.0}
+        return self._compare_by_structural_similarity_index(
+            img_first, img_second, similarity, pyramid_levels, pyramid_margin
+        )
 
-        result: np.float64 | float = structural_similarity(img_first, img_second)
-        result: SimilarityResult = round(result, 2).item() if not isinstance(result, float) else result
+    def compare_by_neural_network(
+            self,
+            similarity: Similarity = 0.85,
+            backbone: ModelName = NeuralNetwork.VGG16,
+            max_hash_distance: int | None = None
+    ) -> ComparatorResult:
+        """Метод определения схожести изображений на основе сверточной нейросети.
 
-        return self.return_comparison_results(result, similarity)
+        Args:
+            similarity: Порог схожести.
+            backbone: Название сверточной нейросети для получения признаков.
+            max_hash_distance: Допустимое расстояние между перцептивными хешами, None - без предварительной проверки.
 
-    def compare_by_neural_network_vgg16(self, similarity: Similarity = 0.85) -> ComparatorResult:
-        """Метод определения схожести изображений на основе сверточной нейросети VGG16).
+        Returns:
+            Результат сравнения в виде словаря.
+        """
+        if backbone not in BACKBONES:
+            raise self.exception(self.messages.UNKNOWN_BACKBONE_ERROR.format(backbone=backbone))
+        if max_hash_distance is not None and (result := self.compare_by_perceptual_hash(max_hash_distance)):
+            return result
+        img_first, img_second = self.prepare_images(img_shape=BACKBONES[backbone].input_size, to_grayscale=False)
+        return self._compare_by_neural_network(img_first, img_second, similarity, backbone)
+
+    def compare_by_neural_network_vgg16(
+            self,
+            similarity: Similarity = 0.85,
+            max_hash_distance: int | None = None
+    ) -> ComparatorResult:
+        """Метод определения схожести изображений на основе сверточной нейросети VGG16.
 
         Args:
             similarity: Порог схожести.
+            max_hash_distance: Допустимое расстояние между перцептивными хешами, None - без предварительной проверки.
 
         Returns:
             Результат сравнения в виде словаря.
         """
-        img_first, img_second = self.prepare_images(img_shape=(224, 224), to_grayscale=False)
-        if self.image_cv.is_images_the_same_pixels(img_first, img_second):
-            return {"is_similar": IsSimilar.YES, "percent": 100.0}
+        return self.compare_by_neural_network(similarity, NeuralNetwork.VGG16, max_hash_distance)
 
-        img_first: ImgMatrix = np.expand_dims(img_first, axis=0)
-        img_second: ImgMatrix = np.expand_dims(img_second, axis=0)
+    @staticmethod
+    def get_tile_bounds(length: int, tile_size: int, min_tile_size: int = 7) -> list[TileBounds]:
+        """Метод разбиения отрезка на плитки.
+        Остаток меньше минимального размера плитки присоединяется к последней плитке.
 
-        img_first: ImgMatrix = preprocess_input(img_first)
-        img_second: ImgMatrix = preprocess_input(img_second)
+        Args:
+            length: Длина отрезка.
+            tile_size: Размер плитки.
+            min_tile_size: Минимальный размер плитки.
 
-        model = VGG16(weights='imagenet', include_top=False, input_shape=(224, 224, 3))
+        Returns:
+            Список границ плиток.
+        """
+        starts: list[int] = list(range(0, length, tile_size))
+        if len(starts) > 1 and length - starts[-1] < min_tile_size:
+            starts.pop()
+        return [(start, end) for start, end in zip(starts, [*starts[1:], length])]
 
-        img_first_feature: FeatureMatrix = model.predict(img_first).reshape(1, -1)
-        img_second_feature: FeatureMatrix = model.predict(img_second).reshape(1, -1)
+    def align_images(self, img_matrix_first: ImgMatrix, img_matrix_second: ImgMatrix) -> tuple[ImgMatrix, ImgMatrix]:
+        """Метод выравнивания изображений: приведение к общей ширине с сохранением пропорций
+        и дополнение более короткого изображения черными строками до общей высоты.
 
-        result: SimilarityResult = cosine_similarity(img_first_feature, img_second_feature)[0][0]
+        Args:
+            img_matrix_first: Матрица первого изображения.
+            img_matrix_second: Матрица второго изображения.
 
-        return self.return_comparison_results(result, similarity)
+        Returns:
+            Кортеж с матрицами первого и второго изображений одинакового размера.
+        """
+        width: int = min(img_matrix_first.shape[1], img_matrix_second.shape[1])
+        img_matrix_first = self.image_cv.resize_image_to_width(img_matrix_first, width)
+        img_matrix_second = self.image_cv.resize_image_to_width(img_matrix_second, width)
+
+        height: int = max(img_matrix_first.shape[0], img_matrix_second.shape[0])
+        return (
+            self.image_cv.pad_image_to_height(img_matrix_first, height),
+            self.image_cv.pad_image_to_height(img_matrix_second, height),
+        )
+
+    def compare_by_tiled_structural_similarity_index(
+            self,
+            similarity: Similarity = 0.55,
+            tile_size: int = 512,
+            max_workers: int | None = None,
+            heatmap_path: ImgSavePath | None = None
+    ) -> TiledComparatorResult:
+        """Метод определения схожести изображений по индексу структурного сходства (SSIM) по плиткам.
+        Изображения сравниваются в исходном разрешении без сжатия, плитки обрабатываются параллельно
+        в пуле потоков (OpenCV и NumPy освобождают GIL). Итоговый индекс - среднее по плиткам,
+        взвешенное по их площади.
+
+        Args:
+            similarity: Порог схожести.
+            tile_size: Размер стороны плитки в пикселях.
+            max_workers: Количество потоков, None - по количеству ядер.
+            heatmap_path: Путь сохранения тепловой карты различий, None - не сохранять.
+
+        Returns:
+            Результат сравнения в виде словаря с сеткой индексов по плиткам.
+        """
+        self._logger.info(self.messages.PREPARE_IMG)
+        img_first, img_second = self.align_images(
+            self.image_cv.convert_image_to_grayscale(self.get_image_matrix(self.img_first)),
+            self.image_cv.convert_image_to_grayscale(self.get_image_matrix(self.img_second)),
+        )
+        rows: list[TileBounds] = self.get_tile_bounds(img_first.shape[0], tile_size)
+        columns: list[TileBounds] = self.get_tile_bounds(img_first.shape[1], tile_size)
+
+        def compare_tile(tile: tuple[TileBounds, TileBounds]) -> tuple[float, ImgMatrix]:
+            (top, bottom), (left, right) = tile
+            tile_first: ImgMatrix = img_first[top:bottom, left:right]
+            tile_second: ImgMatrix = img_second[top:bottom, left:right]
+            if self.image_cv.is_images_the_same_pixels(tile_first, tile_second):
+                return 1.0, np.ones(tile_first.shape, dtype="float64")
+            score, ssim_map = skimage_metrics.structural_similarity(tile_first, tile_second, full=True)
+            return float(score), ssim_map
+
+        tiles: list[tuple[TileBounds, TileBounds]] = [(row, column) for row in rows for column in columns]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tile_results: list[tuple[float, ImgMatrix]] = list(executor.map(compare_tile, tiles))
+
+        scores: np.ndarray = np.array([score for score, _ in tile_results]).reshape(len(rows), len(columns))
+        areas: np.ndarray = np.outer([end - start for start, end in rows], [end - start for start, end in columns])
+        result: SimilarityResult = round(float(np.sum(scores * areas) / np.sum(areas)), 2)
+
+        if heatmap_path:
+            difference_map: ImgMatrix = np.zeros(img_first.shape, dtype="float64")
+            for ((top, bottom), (left, right)), (_, ssim_map) in zip(tiles, tile_results):
+                difference_map[top:bottom, left:right] = 1 - ssim_map
+            self.image_cv.save_image(self.image_cv.convert_map_to_heatmap(difference_map), heatmap_path)
+
+        results: TiledComparatorResult = {
+            **self.return_comparison_results(result, similarity),
+            "tiles": np.round(scores, 2).tolist(),
+        }
+        return results
+
+    @staticmethod
+    def get_structural_similarity_map(
+            img_first: ImgMatrix,
+            img_second: ImgMatrix,
+            win_size: int = 7,
+            data_range: float = 255
+    ) -> ImgMatrix:
+        """Метод вычисления карты индекса структурного сходства с равномерным окном.
+        Формулы совпадают с skimage.metrics.structural_similarity, поэтому среднее карты без полосы
+        шириной win_size // 2 по краям изображения равно индексу SSIM.
+
+        Args:
+            img_first: Матрица первого изображения в формате float64.
+            img_second: Матрица второго изображения в формате float64.
+            win_size: Размер окна.
+            data_range: Диапазон значений пикселей.
+
+        Returns:
+            Карта индекса структурного сходства.
+        """
+        def mean_filter(img_matrix: ImgMatrix) -> ImgMatrix:
+            return cv.boxFilter(img_matrix, cv.CV_64F, (win_size, win_size), borderType=cv.BORDER_REFLECT)
+
+        cov_norm: float = win_size ** 2 / (win_size ** 2 - 1)
+        mean_first, mean_second = mean_filter(img_first), mean_filter(img_second)
+        var_first: ImgMatrix = cov_norm * (mean_filter(img_first * img_first) - mean_first * mean_first)
+        var_second: ImgMatrix = cov_norm * (mean_filter(img_second * img_second) - mean_second * mean_second)
+        covariance: ImgMatrix = cov_norm * (mean_filter(img_first * img_second) - mean_first * mean_second)
+
+        c1, c2 = (0.01 * data_range) ** 2, (0.03 * data_range) ** 2
+        numerator: ImgMatrix = (2 * mean_first * mean_second + c1) * (2 * covariance + c2)
+        denominator: ImgMatrix = (mean_first ** 2 + mean_second ** 2 + c1) * (var_first + var_second + c2)
+        return numerator / denominator
+
+    @staticmethod
+    def read_band(img_matrix: ImgMatrix, top: int, bottom: int) -> ImgMatrix:
+        """Метод чтения полосы строк изображения в формате float64.
+
+        Args:
+            img_matrix: Матрица изображения, в том числе отображенная в память.
+            top: Первая строка полосы.
+            bottom: Строка после последней строки полосы.
+
+        Returns:
+            Матрица полосы изображения.
+        """
+        return np.asarray(img_matrix[top:bottom], dtype="float64")
+
+    def compare_streaming(
+            self,
+            similarities: dict[ComparisonMethod, Similarity],
+            band_height: int = STREAM_BAND_HEIGHT,
+            storage_path: Path | None = None,
+            win_size: int = 7
+    ) -> ComparatorResults:
+        """Метод потокового сравнения высоких изображений по MSE и SSIM с ограниченным потреблением памяти.
+        Изображения приводятся к общему размеру так же, как при обычном сравнении: большее по площади
+        изображение сжимается до размера меньшего. Затем они сохраняются в черно-белом формате в файлы npy,
+        отображаемые в память, и читаются горизонтальными полосами. Статистики MSE и SSIM
+        накапливаются по полосам, поэтому объем памяти зависит от ширины и высоты полосы,
+        а не от высоты страницы.
+
+        Args:
+            similarities: Пороги схожести для методов MSE и SSIM.
+            band_height: Высота полосы в пикселях.
+            storage_path: Папка для временных файлов npy, None - системная временная папка.
+            win_size: Размер окна SSIM.
+
+        Returns:
+            Результаты сравнения в виде словаря по методам.
+        """
+        unsupported: set[ComparisonMethod] = set(similarities) - {ComparisonMethod.MSE, ComparisonMethod.SSIM}
+        if unsupported:
+            raise self.exception(self.messages.STREAMING_METHOD_ERROR.format(methods=", ".join(sorted(unsupported))))
+
+        self._logger.info(self.messages.PREPARE_IMG)
+        pad: int = win_size // 2
+        squared_error: float = 0.0
+        ssim_sum: float = 0.0
+        ssim_count: int = 0
+        with tempfile.TemporaryDirectory(dir=storage_path) as storage:
+            size_first, size_second = (
+                (img.shape[1], img.shape[0]) if isinstance(img, ImgMatrix) else self.image_cv.get_image_size(img)
+                for img in (self.img_first, self.img_second)
+            )
+            # the same rule as normalize_image_size: the larger image is resized to the smaller one
+            img_size: ImgSize = (
+                size_first if size_first[0] * size_first[1] < size_second[0] * size_second[1] else size_second
+            )
+            img_first: ImgMatrix = self.image_cv.convert_image_to_memmap(
+                self.img_first, os.path.join(storage, "first.npy"), img_size
+            )
+            img_second: ImgMatrix = self.image_cv.convert_image_to_memmap(
+                self.img_second, os.path.join(storage, "second.npy"), img_size
+            )
+            width, height = img_size
+            if min(height, width) < win_size:
+                raise self.exception(self.messages.STREAMING_IMG_SIZE_ERROR)
+
+            for top in range(0, height, band_height):
+                bottom: int = min(top + band_height, height)
+                # the band is read with a margin of half a window, so the local statistics match the whole image
+                halo_top, halo_bottom = max(top - pad, 0), min(bottom + pad, height)
+                band_first: ImgMatrix = self.read_band(img_first, halo_top, halo_bottom)
+                band_second: ImgMatrix = self.read_band(img_second, halo_top, halo_bottom)
+
+                if ComparisonMethod.MSE in similarities:
+                    inner: slice = slice(top - halo_top, bottom - halo_top)
+                    squared_error += float(np.square(band_first[inner] - band_second[inner]).sum())
+                if ComparisonMethod.SSIM in similarities:
+                    rows: slice = slice(max(top, pad) - halo_top, min(bottom, height - pad) - halo_top)
+                    ssim_map: ImgMatrix = self.get_structural_similarity_map(band_first, band_second, win_size)
+                    cropped: ImgMatrix = ssim_map[rows, pad:width - pad]
+                    ssim_sum += float(cropped.sum())
+                    ssim_count += cropped.size
+            del img_first, img_second
+
+        results: ComparatorResults = {}
+        if ComparisonMethod.MSE in similarities:
+            if squared_error == 0:
+                results[ComparisonMethod.MSE] = {"is_similar": IsSimilar.YES, "percent": 100.0}
+            else:
+                result: SimilarityResult = round(1 - squared_error / (height * width) / 255 ** 2, 2)
+                results[ComparisonMethod.MSE] = self.return_comparison_results(
+                    result, similarities[ComparisonMethod.MSE]
+                )
+        if ComparisonMethod.SSIM in similarities:
+            result = round(ssim_sum / ssim_count, 2)
+            results[ComparisonMethod.SSIM] = self.return_comparison_results(
+                result, similarities[ComparisonMethod.SSIM]
+            )
+        return results
+
+    def compare_all(
+            self,
+            similarities: dict[ComparisonMethod, Similarity],
+            max_hash_distance: int | None = None,
+            backbone: ModelName = NeuralNetwork.VGG16
+    ) -> ComparatorResults:
+        """Метод определения схожести изображений сразу несколькими методами.
+        Каждое изображение считывается и приводится к черно-белому один раз,
+        подготовленные матрицы переиспользуются всеми методами. Если сравнение нейросетью
+        не запрошено, изображения сразу декодируются в черно-белом формате.
+
+        Args:
+            similarities: Пороги схожести для каждого из запрошенных методов.
+            max_hash_distance: Допустимое расстояние между перцептивными хешами, None - без предварительной проверки.
+                При наличии вердикта по хешу SSIM и сравнение нейросетью не вычисляются.
+            backbone: Название сверточной нейросети для метода NEURAL_NETWORK.
+
+        Returns:
+            Результаты сравнения в виде словаря по методам.
+        """
+        self._logger.info(self.messages.PREPARE_IMG)
+        to_grayscale: ToGrayscale = not {ComparisonMethod.VGG16, ComparisonMethod.NEURAL_NETWORK} & similarities.keys()
+        img_matrix_first: ImgMatrix = self.get_image_matrix(self.img_first, to_grayscale=to_grayscale)
+        img_matrix_second: ImgMatrix = self.get_image_matrix(self.img_second, to_grayscale=to_grayscale)
+
+        results: ComparatorResults = {}
+        if max_hash_distance is not None and (
+                result := self._compare_by_perceptual_hash(img_matrix_first, img_matrix_second, max_hash_distance)
+        ):
+            similarities = dict(similarities)
+            for method in (ComparisonMethod.SSIM, ComparisonMethod.VGG16, ComparisonMethod.NEURAL_NETWORK):
+                if similarities.pop(method, None) is not None:
+                    results[method] = dict(result)
+
+        if ComparisonMethod.MSE in similarities or ComparisonMethod.SSIM in similarities:
+            img_first, img_second = self.prepare_image_matrices(img_matrix_first, img_matrix_second)
+            if ComparisonMethod.MSE in similarities:
+                results[ComparisonMethod.MSE] = self._compare_by_mean_squared_error(
+                    img_first, img_second, similarities[ComparisonMethod.MSE]
+                )
+            if ComparisonMethod.SSIM in similarities:
+                results[ComparisonMethod.SSIM] = self._compare_by_structural_similarity_index(
+                    img_first, img_second, similarities[ComparisonMethod.SSIM]
+                )
+
+        backbones: dict[ComparisonMethod, ModelName] = {
+            ComparisonMethod.VGG16: NeuralNetwork.VGG16,
+            ComparisonMethod.NEURAL_NETWORK: backbone,
+        }
+        for method, name in backbones.items():
+            if method not in similarities:
+                continue
+            if name not in BACKBONES:
+                raise self.exception(self.messages.UNKNOWN_BACKBONE_ERROR.format(backbone=name))
+            img_first, img_second = self.prepare_image_matrices(
+                img_matrix_first, img_matrix_second, img_shape=BACKBONES[name].input_size, to_grayscale=False
+            )
+            results[method] = self._compare_by_neural_network(img_first, img_second, similarities[method], name)
+        return results
+
+
+class BatchComparator(ComparatorBase, BatchComparatorData):
+    """Класс пакетного сравнения одного эталонного изображения с набором изображений.
+    Эталон обрабатывается один раз, а все сравниваемые изображения передаются в нейросеть одним пакетом.
+    """
+
+    def _validate_params(self) -> None:
+        self._validate_img(self.img_reference)
+        if not isinstance(self.imgs_compared, list):
+            raise self.exception(self.messages.INVALID_IMGS_TYPE_ERROR)
+        for img in self.imgs_compared:
+            self._validate_img(img)
+
+    def prepare_images(self, img_shape: ImgSize) -> tuple[ImgMatrix, list[ImgMatrix]]:
+        """Метод подготовки изображений для сравнения.
+
+        Args:
+            img_shape: Размер изображения.
+
+        Returns:
+            Кортеж с матрицей эталонного изображения и списком матриц сравниваемых изображений.
+        """
+        self._logger.info(self.messages.PREPARE_IMG)
+        img_reference: ImgMatrix = self.image_cv.resize_image(
+            self.get_image_matrix(self.img_reference, img_shape), img_shape
+        )
+        imgs_compared: list[ImgMatrix] = [
+            self.image_cv.resize_image(self.get_image_matrix(img, img_shape), img_shape) for img in self.imgs_compared
+        ]
+        return img_reference, imgs_compared
+
+    def compare_by_neural_network(
+            self,
+            similarity: Similarity = 0.85,
+            backbone: ModelName = NeuralNetwork.VGG16
+    ) -> list[ComparatorResult]:
+        """Метод определения схожести эталона с каждым изображением на основе сверточной нейросети.
+
+        Args:
+            similarity: Порог схожести.
+            backbone: Название сверточной нейросети для получения признаков.
+
+        Returns:
+            Результаты сравнения в виде словарей в порядке сравниваемых изображений.
+        """
+        if backbone not in BACKBONES:
+            raise self.exception(self.messages.UNKNOWN_BACKBONE_ERROR.format(backbone=backbone))
+        if not self.imgs_compared:
+            return []
+        img_reference, imgs_compared = self.prepare_images(img_shape=BACKBONES[backbone].input_size)
+
+        features: FeatureMatrix = self.get_features([img_reference, *imgs_compared], backbone)
+        results: FeatureMatrix = FeatureExtractor.get_cosine_similarities(features[0], features[1:])
+
+        return [
+            {"is_similar": IsSimilar.YES, "percent": 100.0}
+            if self.image_cv.is_images_the_same_pixels(img_reference, img)
+            else self.return_comparison_results(result.item(), similarity)
+            for img, result in zip(imgs_compared, results)
+        ]
+
+    def compare_by_neural_network_vgg16(self, similarity: Similarity = 0.85) -> list[ComparatorResult]:
+        """Метод определения схожести эталона с каждым изображением на основе сверточной нейросети VGG16.
+
+        Args:
+            similarity: Порог схожести.
+
+        Returns:
+            Результаты сравнения в виде словарей в порядке сравниваемых изображений.
+        """
+        return self.compare_by_neural_network(similarity, NeuralNetwork.VGG16)
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Iterable, NoReturn
+
+import numpy as np
+
+from app.base.common.general import setup_logging, get_memory_usage
+from app.base.exceptions import ModelRegistryException, ModelRegistryMessages
+from app.base.types import ModelName, ModelLoader, NeuralNetworkModel
+
+
+@dataclass
+class ModelInfo:
+    """Класс со сведениями о загруженной модели нейросети.
+
+    Attributes:
+        name: Название модели.
+        load_time: Время загрузки модели в секундах.
+        weights_size: Размер весов модели в байтах.
+        memory_usage: Прирост резидентной памяти процесса после загрузки модели в байтах.
+    """
+    name: ModelName
+    load_time: float
+    weights_size: int
+    memory_usage: int
+
+
+class ModelRegistry:
+    """Класс реестра моделей нейросетей.
+    Каждая модель загружается один раз на процесс и переиспользуется всеми сравнениями.
+    """
+    exception = ModelRegistryException
+    messages = ModelRegistryMessages
+
+    def __init__(self) -> None:
+        """Инициализация параметров для запуска."""
+        self._logger = setup_logging()
+        self._lock: Lock = Lock()
+        self._loaders: dict[ModelName, ModelLoader] = {}
+        self._models: dict[ModelName, NeuralNetworkModel] = {}
+        self._info: dict[ModelName, ModelInfo] = {}
+
+    def register(self, name: ModelName, loader: ModelLoader) -> None:
+        """Метод регистрации загрузчика модели.
+
+        Args:
+            name: Название модели.
+            loader: Функция, создающая экземпляр модели.
+        """
+        with self._lock:
+            self._loaders[name] = loader
+
+    def get_model(self, name: ModelName) -> NeuralNetworkModel | NoReturn:
+        """Метод получения модели. При первом обращении модель загружается.
+
+        Args:
+            name: Название модели.
+
+        Returns:
+            Экземпляр модели.
+        """
+        model: NeuralNetworkModel | None = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            # the model could have been loaded by another thread while waiting for the lock
+            if name in self._models:
+                return self._models[name]
+            if name not in self._loaders:
+                raise self.exception(self.messages.UNKNOWN_MODEL_ERROR.format(name=name))
+
+            memory_before: int = get_memory_usage()
+            start: float = perf_counter()
+            try:
+                model = self._loaders[name]()
+            except Exception as e:
+                raise self.exception(self.messages.MODEL_LOAD_ERROR.format(name=name, msg=e.__str__()))
+
+            info = ModelInfo(
+                name=name,
+                load_time=perf_counter() - start,
+                weights_size=model.count_params() * np.dtype("float32").itemsize,
+                memory_usage=max(get_memory_usage() - memory_before, 0),
+            )
+            self._logger.info(self.messages.MODEL_LOADED.format(**info.__dict__))
+            self._info[name] = info
+            self._models[name] = model
+            return model
+
+    def warm_up(self, names: Iterable[ModelName]) -> list[ModelInfo]:
+        """Метод прогрева моделей: загрузка и пробный прогон на пустом изображении.
+
+        Args:
+            names: Названия моделей.
+
+        Returns:
+            Сведения о загруженных моделях.
+        """
+        names: list[ModelName] = list(names)
+        for name in names:
+            self._logger.info(self.messages.MODEL_WARM_UP.format(name=name))
+            model: NeuralNetworkModel = self.get_model(name)
+            model.predict(np.zeros((1, *model.input_shape[1:]), dtype="float32"), verbose=0)
+        return [self._info[name] for name in names]
+
+    @property
+    def info(self) -> dict[ModelName, ModelInfo]:
+        """Свойство получения сведений о загруженных моделях.
+
+        Returns:
+            Словарь со сведениями о загруженных моделях.
+        """
+        return dict(self._info)
+
+    def clear(self) -> None:
+        """Метод выгрузки всех загруженных моделей."""
+        with self._lock:
+            self._models.clear()
+            self._info.clear()
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from app.base.common.cache import DiskCache
+from app.base.common.image import ImageCV
+from app.base.common.lazy import lazy_import
+from app.base.constants import NeuralNetwork, EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_SIZE
+from app.base.types import (
+    ImgMatrix,
+    ImgSize,
+    FeatureMatrix,
+    ModelName,
+    ModelLoader,
+    NeuralNetworkModel,
+    CacheKey,
+    Path,
+)
+from app.compare.model_registry import model_registry
+
+efficientnet = lazy_import("keras.src.applications.efficientnet")
+mobilenet_v2 = lazy_import("keras.src.applications.mobilenet_v2")
+mobilenet_v3 = lazy_import("keras.src.applications.mobilenet_v3")
+resnet = lazy_import("keras.src.applications.resnet")
+vgg16 = lazy_import("keras.src.applications.vgg16")
+
+
+@dataclass
+class Backbone:
+    """Класс с описанием сверточной нейросети для получения признаков изображений.
+
+    Attributes:
+        name: Название модели.
+        input_size: Размер входного изображения.
+        loader: Функция, создающая экземпляр модели без классификатора.
+        preprocess: Функция предобработки пакета изображений для модели.
+    """
+    name: ModelName
+    input_size: ImgSize
+    loader: ModelLoader
+    preprocess: Callable[[ImgMatrix], ImgMatrix]
+
+
+BACKBONES: dict[ModelName, Backbone] = {
+    backbone.name: backbone for backbone in (
+        Backbone(
+            name=NeuralNetwork.VGG16,
+            input_size=(224, 224),
+            loader=lambda: vgg16.VGG16(weights="imagenet", include_top=False, input_shape=(224, 224, 3)),
+            preprocess=lambda batch: vgg16.preprocess_input(batch),
+        ),
+        Backbone(
+            name=NeuralNetwork.MOBILENET_V2,
+            input_size=(224, 224),
+            loader=lambda: mobilenet_v2.MobileNetV2(weights="imagenet", include_top=False, input_shape=(224, 224, 3)),
+            preprocess=lambda batch: mobilenet_v2.preprocess_input(batch),
+        ),
+        Backbone(
+            name=NeuralNetwork.MOBILENET_V3,
+            input_size=(224, 224),
+            loader=lambda: mobilenet_v3.MobileNetV3Small(
+                weights="imagenet", include_top=False, input_shape=(224, 224, 3)
+            ),
+            preprocess=lambda batch: mobilenet_v3.preprocess_input(batch),
+        ),
+        Backbone(
+            name=NeuralNetwork.EFFICIENTNET_B0,
+            input_size=(224, 224),
+            loader=lambda: efficientnet.EfficientNetB0(
+                weights="imagenet", include_top=False, input_shape=(224, 224, 3)
+            ),
+            preprocess=lambda batch: efficientnet.preprocess_input(batch),
+        ),
+        Backbone(
+            name=NeuralNetwork.RESNET50,
+            input_size=(224, 224),
+            loader=lambda: resnet.ResNet50(weights="imagenet", include_top=False, input_shape=(224, 224, 3)),
+            preprocess=lambda batch: resnet.preprocess_input(batch),
+        ),
+    )
+}
+
+for backbone in BACKBONES.values():
+    model_registry.register(backbone.name, backbone.loader)
+
+
+class EmbeddingCache(DiskCache):
+    """Класс дискового кэша векторов признаков изображений.
+    Векторы хранятся в сжатом виде во float16.
+    """
+    extension: str = "npz"
+    dtype: str = "float16"
+
+    @classmethod
+    def quantize(cls, value: FeatureMatrix) -> FeatureMatrix:
+        """Метод приведения вектора признаков к точности хранения в кэше.
+        Только что вычисленный вектор округляется так же, как прочитанный из кэша,
+        поэтому первое и повторные сравнения одной пары дают одинаковый результат.
+
+        Args:
+            value: Вектор признаков.
+
+        Returns:
+            Вектор признаков во float32 с точностью хранения.
+        """
+        return value.astype(cls.dtype).astype("float32")
+
+    def _dump(self, path: Path, value: FeatureMatrix) -> None:
+        np.savez_compressed(path, feature=value.astype(self.dtype))
+
+    def _load(self, path: Path) -> FeatureMatrix:
+        with np.load(path) as file:
+            return file["feature"].astype("float32")
+
+
+embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_SIZE)
+
+
+class FeatureExtractor:
+    """Класс получения векторов признаков изображений с помощью сверточной нейросети.
+    Векторы берутся из кэша, если изображение уже обрабатывалось, остальные изображения
+    обрабатываются за один вызов predict.
+    """
+
+    def __init__(
+            self,
+            name: ModelName = NeuralNetwork.VGG16,
+            cache: EmbeddingCache | None = embedding_cache
+    ) -> None:
+        """Инициализация параметров для запуска.
+
+        Args:
+            name: Название модели нейросети.
+            cache: Кэш векторов признаков, None - без кэширования.
+        """
+        if name not in BACKBONES:
+            raise model_registry.exception(model_registry.messages.UNKNOWN_MODEL_ERROR.format(name=name))
+        self.name: ModelName = name
+        self.backbone: Backbone = BACKBONES[name]
+        self.cache: EmbeddingCache | None = cache
+        self.image_cv: ImageCV = ImageCV()
+
+    @property
+    def model(self) -> NeuralNetworkModel:
+        """Свойство получения модели нейросети из реестра.
+
+        Returns:
+            Экземпляр модели.
+        """
+        return model_registry.get_model(self.name)
+
+    def get_cache_key(self, img_matrix: ImgMatrix) -> CacheKey:
+        """Метод формирования ключа кэша для изображения.
+        Изображение уже приведено к размеру входа нейросети, поэтому хеш его пикселей вместе
+        с размером однозначно определяет вектор признаков.
+
+        Args:
+            img_matrix: Матрица изображения.
+
+        Returns:
+            Ключ кэша.
+        """
+        return self.cache.get_key(self.image_cv.get_image_hash(img_matrix), self.name, img_matrix.shape)
+
+    def predict(self, img_matrices: list[ImgMatrix]) -> FeatureMatrix:
+        """Метод получения векторов признаков изображений нейросетью.
+
+        Args:
+            img_matrices: Матрицы изображений, приведенные к размеру входа нейросети.
+
+        Returns:
+            Матрица признаков, по одной строке на изображение.
+        """
+        batch: ImgMatrix = self.backbone.preprocess(np.stack(img_matrices).astype("float32"))
+        features: FeatureMatrix = self.model.predict(batch, verbose=0)
+        return features.reshape(len(img_matrices), -1)
+
+    def get_features(self, img_matrices: list[ImgMatrix]) -> FeatureMatrix:
+        """Метод получения векторов признаков изображений с использованием кэша.
+
+        Args:
+            img_matrices: Матрицы изображений, приведенные к размеру входа нейросети.
+
+        Returns:
+            Матрица признаков, по одной строке на изображение.
+        """
+        if self.cache is None:
+            return self.predict(img_matrices)
+
+        keys: list[CacheKey] = [self.get_cache_key(img_matrix) for img_matrix in img_matrices]
+        features: list[FeatureMatrix | None] = [self.cache.get(key) for key in keys]
+
+        missed: list[int] = [index for index, feature in enumerate(features) if feature is None]
+        if missed:
+            predicted: FeatureMatrix = self.predict([img_matrices[index] for index in missed])
+            for index, feature in zip(missed, predicted):
+                self.cache.set(keys[index], feature)
+                features[index] = self.cache.quantize(feature)
+        return np.stack(features)
+
+    @staticmethod
+    def get_cosine_similarities(feature: FeatureMatrix, features: FeatureMatrix) -> FeatureMatrix:
+        """Метод вычисления косинусной схожести одного вектора признаков с набором векторов.
+
+        Args:
+            feature: Вектор признаков эталонного изображения.
+            features: Матрица признаков сравниваемых изображений.
+
+        Returns:
+            Вектор косинусной схожести для каждого сравниваемого изображения.
+        """
+        feature = feature.reshape(-1)
+        norms: FeatureMatrix = np.linalg.norm(features, axis=1) * np.linalg.norm(feature)
+        return features @ feature / np.maximum(norms, np.finfo("float32").eps)
@@ -2,6 +2,14 @@
 MSE_THRESHOLD = 0.45
 SSIM_THRESHOLD = 0.5
 VGG16_THRESHOLD = 0.8
+# cosine similarity of features differs between networks, so the neural network boundary is set per backbone
+NEURAL_NETWORK_THRESHOLDS = {
+    'vgg16': VGG16_THRESHOLD,
+    'mobilenet_v2': 0.8,
+    'mobilenet_v3': 0.8,
+    'efficientnet_b0': 0.8,
+    'resnet50': 0.8,
+}
 
 # text color coloring of words on the page, GREEN color
 FILL_TEXT_COLOR = (0, 255, 0)
@@ -16,8 +24,22 @@ MODEL_FILE_TYPE = (
     ('jpeg', 'JPEG Image'),
 )
 
+MODEL_BACKBONE = (
+    ('vgg16', 'VGG16'),
+    ('mobilenet_v2', 'MobileNetV2'),
+    ('mobilenet_v3', 'MobileNetV3 Small'),
+    ('efficientnet_b0', 'EfficientNetB0'),
+    ('resnet50', 'ResNet50'),
+)
+
+# neural network results are stored under the name of the backbone that produced them
 MODEL_COMPARISON_METHOD = (
     ('mse', 'Mean Squared Error (MSE)'),
     ('ssim', 'Structural Similarity Index (SSIM)'),
-    ('vgg16', 'Neural Network vvgg VGG16'),
+    *((name, f'Neural Network {label}') for name, label in MODEL_BACKBONE),
+)
+
+MODEL_TEXT_DETECTOR = (
+    ('easyocr', 'EasyOCR'),
+    ('opencv', 'OpenCV'),
 )
@@ -1,19 +1,23 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from numpy import ndarray, mean, expand_dims
-from skimage.metrics import structural_similarity
-from sklearn.metrics.pairwise import cosine_similarity
-from keras.src.applications.vgg16 import VGG16, preprocess_input
+from typing import Union
 
+from numpy import ndarray, mean
+
+from app.base.common.lazy import skimage_metrics
+from app.base.constants import NeuralNetwork
+from app.compare.model_registry import model_registry
+from app.compare.neural_network import BACKBONES, FeatureExtractor
 from app.engine.image_helper import ImageHelper
 
 
 @dataclass
 class ComparatorInterface(ABC):
-    """Interface for comparing image similarity."""
-    reference_image_path: str
-    image_path: str
+    """Interface for comparing image similarity.
+    Images are given as paths or as already decoded pixel matrices."""
+    reference_image_path: Union[str, ndarray]
+    image_path: Union[str, ndarray]
 
     @staticmethod
     @abstractmethod
@@ -66,30 +70,32 @@ class ComparatorBase(ComparatorInterface):
         # TODO add unit test
         return compare_index >= self.similarity_threshold
 
-    def prepare_comparison_image(self, image_path: str,
+    def prepare_comparison_image(self, image_path: Union[str, ndarray],
                                  image_size: tuple[int, int],
                                  convert_grayscale: bool = True) -> ndarray:
         """Method for preparing an image for comparison.
-        1. Represent the image as an array.
-        2. Convert to grayscale.
-        3. Normalize size.
+        1. Represent the image as an array, decoded straight to grayscale and reduced as far as the size allows.
+        2. Normalize size.
 
         Args:
-            image_path: path to image.
+            image_path: path to image or decoded pixel matrix.
             image_size: image size.
             convert_grayscale: convert image to grayscale.
 
         Returns:
             Pre-processed image(pixel matrix) is ready for comparison.
         """
-        image = self.image_helper.read_image(image_path)
-
-        image = self.image_helper.convert_image_bgr_to_rgb(image)
-        image = self.image_helper.resize_image(image, image_size)
+        if isinstance(image_path, ndarray):
+            image = image_path
+            if convert_grayscale and image.ndim == 3:
+                image = self.image_helper.convert_image_to_grayscale(image)
+        else:
+            reduce = self.image_helper.get_reduce_factor(image_path, image_size)
+            image = self.image_helper.read_image(image_path, grayscale=convert_grayscale, reduce=reduce)
 
-        if convert_grayscale:
-            image = self.image_helper.convert_image_to_grayscale(image)
-        return image
+        if not convert_grayscale:
+            image = self.image_helper.convert_image_bgr_to_rgb(image)
+        return self.image_helper.resize_image(image, image_size)
 
 
 @dataclass
@@ -123,14 +129,20 @@ class ComparatorStructuralSimilarityIndex(ComparatorBase):
         """
         reference_image = self.prepare_comparison_image(self.reference_image_path, image_size=self.image_size)
         image = self.prepare_comparison_image(self.image_path, image_size=self.image_size)
-        return structural_similarity(reference_image, image)
+        return skimage_metrics.structural_similarity(reference_image, image)
 
 
 @dataclass
-class ComparatorNeuralNetworkVGG16(ComparatorBase):
-    """Class for comparing the similarity of two images based on the VGG16 neural network."""
+class ComparatorNeuralNetwork(ComparatorBase):
+    """Class for comparing the similarity of two images based on a convolutional neural network backbone."""
     image_size: tuple[int, int] = (224, 224)
     similarity_threshold: float = 0.8
+    backbone: str = NeuralNetwork.VGG16
+
+    def __post_init__(self):
+        if self.backbone not in BACKBONES:
+            raise model_registry.exception(model_registry.messages.UNKNOWN_MODEL_ERROR.format(name=self.backbone))
+        self.image_size = BACKBONES[self.backbone].input_size
 
     def compare_exec(self) -> float:
         """Method for performing image similarity comparison..
@@ -145,14 +157,29 @@ class ComparatorNeuralNetworkVGG16(ComparatorBase):
                                               image_size=self.image_size,
                                               convert_grayscale=False)
 
-        cnn = VGG16(weights='imagenet', include_top=False, input_shape=tuple([*self.image_size, 3]))
+        extractor = FeatureExtractor(self.backbone)
+        features = extractor.get_features([reference_image, image])
+        return extractor.get_cosine_similarities(features[0], features[1:])[0].item()
+
+    def compare_batch_exec(self, image_paths: list[Union[str, ndarray]]) -> list[float]:
+        """Method for performing similarity comparison of the reference image with several images at once.
+        The reference image is embedded once and all images are passed to the network in one batch.
+
+        Args:
+            image_paths: paths to images or decoded pixel matrices.
+
+        Returns:
+            Image similarity indexes in the order of image paths.
+        """
+        images = [self.prepare_comparison_image(image_path, image_size=self.image_size, convert_grayscale=False)
+                  for image_path in [self.reference_image_path, *image_paths]]
 
-        reference_image = expand_dims(reference_image, axis=0)
-        image = expand_dims(image, axis=0)
+        extractor = FeatureExtractor(self.backbone)
+        features = extractor.get_features(images)
+        return extractor.get_cosine_similarities(features[0], features[1:]).tolist()
 
-        reference_image = preprocess_input(reference_image)
-        image = preprocess_input(image)
 
-        features1 = cnn.predict(reference_image)
-        features2 = cnn.predict(image)
-        return cosine_similarity(features1.reshape(1, -1), features2.reshape(1, -1))[0][0]
+@dataclass
+class ComparatorNeuralNetworkVGG16(ComparatorNeuralNetwork):
+    """Class for comparing the similarity of two images based on the VGG16 neural network."""
+    backbone: str = NeuralNetwork.VGG16
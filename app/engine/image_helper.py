@@ -1,13 +1,14 @@
 from abc import ABC
 from enum import Enum
+from typing import Union
 
 import cv2
-import easyocr
 from PIL import Image
-from psd_tools import PSDImage
 from numpy import ndarray
 
-from app.constants import FILL_TEXT_COLOR
+from app.base.common.image import Image as PSDHelper, ImageCV
+from app.base.constants import TextDetector
+from app.base.exceptions import ImageException, ImageCVException
 
 
 class Language(str, Enum):
@@ -26,15 +27,21 @@ class ImageHelper(ImageHelperBase):
     """Class for interacting with images."""
 
     @staticmethod
-    def convert_psd_to_image(psd_path: str, save_image_path: str) -> None:
+    def convert_psd_to_image(psd_path: str, save_image_path: str, hide_text: bool = False) -> None:
         """Method for converting psd to png format.
+        The composite is cached by the psd file content, so repeated checks skip compositing.
 
         Args:
             psd_path: path to psd file.
             save_image_path: save path image.
+            hide_text: fill the text layers of the psd with the text color instead of recognizing text.
         """
+        if not isinstance(psd_path, str):
+            raise ImageHelperTypeException
         try:
-            PSDImage.open(psd_path).composite().save(save_image_path)
+            PSDHelper().get_composite_image(psd_path, hide_text=hide_text).save(save_image_path)
+        except ImageException:
+            raise ImageHelperPSDPathHException
         except TypeError:
             raise ImageHelperTypeException
         except ValueError:
@@ -42,6 +49,39 @@ class ImageHelper(ImageHelperBase):
         except (FileNotFoundError, PermissionError, IsADirectoryError):
             raise ImageHelperPSDPathHException
 
+    @staticmethod
+    def get_psd_image(psd_path: str, hide_text: bool = False) -> ndarray:
+        """Method for compositing psd straight to a pixel matrix without writing a png.
+
+        Args:
+            psd_path: path to psd file.
+            hide_text: fill the text layers of the psd with the text color instead of recognizing text.
+
+        Returns:
+            Pixel matrix.
+        """
+        if not isinstance(psd_path, str):
+            raise ImageHelperTypeException
+        try:
+            return PSDHelper().get_composite_matrix(psd_path, hide_text=hide_text)
+        except ImageException:
+            raise ImageHelperPSDPathHException
+
+    @staticmethod
+    def decode_image(image_bytes: bytes) -> ndarray:
+        """Method for decoding an encoded image, e.g. a png screenshot, without writing a file.
+
+        Args:
+            image_bytes: encoded image.
+
+        Returns:
+            Pixel matrix.
+        """
+        try:
+            return ImageCV(cache=None).decode_image(image_bytes)
+        except ImageCVException:
+            raise ImageHelperDecodeImageException
+
     @staticmethod
     def get_image_object(image_path: str):
         """Method to get an image object.
@@ -58,6 +98,19 @@ class ImageHelper(ImageHelperBase):
         except (FileNotFoundError, AttributeError, IsADirectoryError):
             raise ImageHelperGetImagePathException
 
+    @staticmethod
+    def get_reduce_factor(image_path: str, size: tuple[int, int]) -> int:
+        """Method for choosing the largest decode reduction that keeps the image not smaller than the size.
+
+        Args:
+            image_path: path to image.
+            size: final image size.
+
+        Returns:
+            Reduce factor 1, 2, 4 or 8.
+        """
+        return ImageCV.get_reduce_factor(image_path, size)
+
     def get_image_resolution(self, image_path: str) -> tuple[int, int]:
         """Image resolution method.
 
@@ -70,16 +123,47 @@ class ImageHelper(ImageHelperBase):
         return self.get_image_object(image_path).size
 
     @staticmethod
-    def read_image(image_path: str) -> ndarray:
+    def get_perceptual_hash(image: Union[str, ndarray]) -> str:
+        """Method for getting the perceptual hash (dHash) of an image.
+
+        Args:
+            image: path to image or pixel matrix.
+
+        Returns:
+            64-bit hash as a hex string.
+        """
+        if isinstance(image, str):
+            image = ImageHelper.read_image(image, grayscale=True)
+        return ImageCV(cache=None).get_perceptual_hash(image)
+
+    @staticmethod
+    def get_image_hash(image: Union[str, ndarray]) -> str:
+        """Method for getting the content hash of an image, equal only for identical pixels.
+
+        Args:
+            image: path to image or pixel matrix.
+
+        Returns:
+            sha256 hash as a hex string.
+        """
+        if isinstance(image, str):
+            image = ImageHelper.read_image(image)
+        return ImageCV(cache=None).get_image_hash(image)
+
+    @staticmethod
+    def read_image(image_path: str, grayscale: bool = False, reduce: int = 1) -> ndarray:
         """Method for reading an image.
+        Grayscale and reduced images are produced by the decoder, which saves decode time and memory.
 
         Args:
             image_path: path to image.
+            grayscale: decode the image straight to grayscale.
+            reduce: decode the image reduced by 1, 2, 4 or 8 times.
 
         Returns:
             Pixel matrix.
         """
-        image = cv2.imread(image_path)
+        image = cv2.imread(image_path, ImageCV().get_read_flag(grayscale, reduce))
         if image is None:
             raise ImageHelperGetImagePathException
         return image
@@ -140,48 +224,75 @@ class ImageHelper(ImageHelperBase):
         return cv2.cvtColor(image_matrix, cv2.COLOR_BGR2GRAY)
 
     @staticmethod
-    def hide_text(image_matrix: ndarray, languages=(Language.english, Language.russian)) -> ndarray:
+    def hide_text(image_matrix: ndarray, languages=(Language.english, Language.russian),
+                  detect_only: bool = False, detector: str = TextDetector.EASYOCR) -> ndarray:
         """Method to find text in an image and hide it.
 
         Args:
             image_matrix: image pixel matrix.
             languages: cortege with languages.
+            detect_only: only detect text regions without recognizing the text, which is much faster.
+            detector: text detector, 'opencv' finds text regions without a neural network.
 
         Returns:
             Pixel matrix.
         """
         # TODO Add refactor unit test
-        reader = easyocr.Reader(languages)
-        results = reader.readtext(image_matrix)
-
-        for result in results:
-            bbox = result[0]
-            x1, y1 = int(bbox[0][0]), int(bbox[0][1])
-            x2, y2 = int(bbox[2][0]), int(bbox[2][1])
-            cv2.rectangle(image_matrix, (x1, y1), (x2, y2), FILL_TEXT_COLOR, cv2.FILLED)
-        return image_matrix
+        polygons = ImageCV().get_text_polygons_by_tiles(image_matrix, languages, detect_only, detector=detector)
+        return ImageCV.fill_text_polygons(image_matrix, polygons)
 
-    def hide_text(self, image_path: str, save_image_path: str, languages=(Language.english, Language.russian)) -> None:
+    def hide_text(self, image_path: str, save_image_path: str, languages=(Language.english, Language.russian),
+                  detect_only: bool = False, detector: str = TextDetector.EASYOCR) -> None:
         """Method to find text in an image and hide it.
 
         Args:
             image_path: path to image.
             save_image_path: save path image.
             languages: cortege with languages.
+            detect_only: only detect text regions without recognizing the text, which is much faster.
+            detector: text detector, 'opencv' finds text regions without a neural network.
         """
         image = self.read_image(image_path)
 
-        reader = easyocr.Reader(languages)
-        results = reader.readtext(image)
-
-        for result in results:
-            bbox = result[0]
-            x1, y1 = int(bbox[0][0]), int(bbox[0][1])
-            x2, y2 = int(bbox[2][0]), int(bbox[2][1])
-            cv2.rectangle(image, (x1, y1), (x2, y2), FILL_TEXT_COLOR, cv2.FILLED)
+        polygons = ImageCV().get_text_polygons_by_tiles(image, languages, detect_only, detector=detector)
+        ImageCV.fill_text_polygons(image, polygons)
 
         cv2.imwrite(save_image_path, image)
 
+    def hide_text_batch(self, image_paths: list[str], languages=(Language.english, Language.russian),
+                        detect_only: bool = False, detector: str = TextDetector.EASYOCR) -> list[str]:
+        """Method to find and hide text on several images at once, the images are overwritten.
+        Text is searched in batches, so the model is dispatched once per batch instead of once per image.
+
+        Args:
+            image_paths: paths to images.
+            languages: cortege with languages.
+            detect_only: only detect text regions without recognizing the text, which is much faster.
+            detector: text detector, 'opencv' finds text regions without a neural network.
+
+        Returns:
+            Paths to images.
+        """
+        images = ImageCV().hide_text_on_images([self.read_image(image_path) for image_path in image_paths],
+                                               languages, detect_only, detector=detector)
+        return [self.write_image(image, image_path) for image, image_path in zip(images, image_paths)]
+
+    @staticmethod
+    def hide_text_images(images: list[ndarray], languages=(Language.english, Language.russian),
+                         detect_only: bool = False, detector: str = TextDetector.EASYOCR) -> list[ndarray]:
+        """Method to find and hide text on several pixel matrices at once, the matrices are filled in place.
+
+        Args:
+            images: image pixel matrices.
+            languages: cortege with languages.
+            detect_only: only detect text regions without recognizing the text, which is much faster.
+            detector: text detector, 'opencv' finds text regions without a neural network.
+
+        Returns:
+            Pixel matrices.
+        """
+        return ImageCV().hide_text_on_images(list(images), languages, detect_only, detector=detector)
+
 
 class ImageHelperTypeException(Exception):
 
@@ -205,3 +316,9 @@ class ImageHelperGetImagePathException(Exception):
 
     def __str__(self):
         return 'Failed to get image.'
+
+
+class ImageHelperDecodeImageException(Exception):
+
+    def __str__(self):
+        return 'Failed to decode image.'
@@ -3,10 +3,13 @@ from os import path, getcwd
 from dataclasses import dataclass, field
 from typing import Optional
 
+from numpy import ndarray
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver import Chrome
 
+from app.engine.image_helper import ImageHelper
+
 
 @dataclass
 class SeleniumOptionsBase(ABC):
@@ -118,6 +121,21 @@ class SeleniumManager(SeleniumManagerBase):
         self.driver.save_screenshot(save_image_path)
         return save_image_path
 
+    def get_full_screenshot_image(self, page_path: str) -> ndarray:
+        """Getting a screenshot of the whole page as a decoded image without writing a file.
+
+        Args:
+            page_path: page path.
+
+        Returns:
+            Pixel matrix of the page.
+        """
+        self.driver.get(page_path)
+        total_width = self.driver.execute_script("return document.body.offsetWidth")
+        total_height = self.driver.execute_script("return document.body.scrollHeight")
+        self.driver.set_window_size(total_width, total_height)
+        return ImageHelper.decode_image(self.driver.get_screenshot_as_png())
+
 
 class SeleniumDriverException(Exception):
 
@@ -1,17 +1,27 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Union, Type
 
+from numpy import ndarray
+
+from app.base.common.general import get_hamming_distance
+from app.base.common.image import ImageArtifact
+from app.base.common.web_driver import RequestRouter, page_renderer
+from app.base.constants import PERCEPTUAL_HASH_SIZE
+from app.compare.model_registry import model_registry
+from app.constants import MSE_THRESHOLD, SSIM_THRESHOLD, NEURAL_NETWORK_THRESHOLDS
 from app.engine.comparator import (
     ComparatorMeanSquaredError,
     ComparatorStructuralSimilarityIndex,
-    ComparatorNeuralNetworkVGG16
+    ComparatorNeuralNetwork
 )
 from app.engine.image_helper import ImageHelper
 from app.engine.selenium_manager import SeleniumManager
 from app.engine.util import unzip, find_files_with_name, remove_folder_or_file, join_path
-from app.models import UserSettings, Comparison, UserSession
-from main.settings import CACHE_PATH, MSE_THRESHOLD, SSIM_THRESHOLD, VGG16_THRESHOLD
+from app.models import UserSettings, ComparisonResults, UserSession
+from app.utils.common import get_uuid
+from main.settings import CACHE_PATH, PERCEPTUAL_HASH_MAX_DISTANCE
 
 
 @dataclass
@@ -42,7 +52,7 @@ class CompareController(CompareControllerBase):
 
     @property
     def user_comparison_model(self):
-        return Comparison.objects.get(user_id=self.user_id)
+        return ComparisonResults.objects.filter(username_id=self.user_id)
 
     @property
     def cache_path_folder(self) -> str:
@@ -64,59 +74,164 @@ class CompareController(CompareControllerBase):
         remove_folder_or_file(folder_path)
         return images
 
-    def get_reference_image_path(self):
+    def get_rendered_sits_images(self) -> list[ImageArtifact]:
+        # screenshots are decoded in memory, so no png is written and read back
+        archive_path = find_files_with_name(self.cache_path_folder, 'archive', inclusion=True)[0]
+        folder_path = unzip(archive_path)
+        remove_folder_or_file(archive_path)
+
+        indexes = find_files_with_name(folder_path, 'index', inclusion=True)
+
+        # pages are rendered concurrently by the browser pool of the worker, so the archive takes about
+        # the time of its slowest page; trackers are blocked and known fonts and css frameworks are served
+        # from the local asset cache
+        try:
+            images = page_renderer.render(
+                [Path(index_path).absolute().as_uri() for index_path in indexes],
+                [f'site_image_{number}' for number in range(len(indexes))],
+                router=RequestRouter(),
+            )
+        finally:
+            remove_folder_or_file(folder_path)
+        return images
+
+    def get_reference_image_path(self, hide_text: bool = False):
         # TODO add exceptions + tests
         # TODO remove hardcode style: template
         template_path = find_files_with_name(self.cache_path_folder, 'template', inclusion=True)[0]
         save_image_path = join_path([self.cache_path_folder, 'reference_image.png'])
-        self.image_helper.convert_psd_to_image(template_path, save_image_path)
+        self.image_helper.convert_psd_to_image(template_path, save_image_path, hide_text=hide_text)
 
         remove_folder_or_file(template_path)
         return save_image_path
 
+    def get_reference_image(self, hide_text: bool = False) -> ImageArtifact:
+        # the psd composite goes straight to a pixel matrix without a png round-trip
+        template_path = find_files_with_name(self.cache_path_folder, 'template', inclusion=True)[0]
+        image = ImageArtifact('reference_image', self.image_helper.get_psd_image(template_path, hide_text=hide_text))
+
+        remove_folder_or_file(template_path)
+        return image
+
+    @staticmethod
+    def get_method_threshold(comparator: Type[Union['ComparatorMeanSquaredError',
+                                                    'ComparatorStructuralSimilarityIndex',
+                                                    'ComparatorNeuralNetwork']],
+                             kwargs: dict) -> tuple[str, float]:
+        if comparator is ComparatorMeanSquaredError:
+            return 'mse', MSE_THRESHOLD
+        if comparator is ComparatorStructuralSimilarityIndex:
+            return 'ssim', SSIM_THRESHOLD
+        if issubclass(comparator, ComparatorNeuralNetwork):
+            # results are recorded under the backbone that produced them and judged by its own boundary
+            backbone = str(kwargs.get('backbone', comparator.backbone))
+            if backbone not in NEURAL_NETWORK_THRESHOLDS:
+                raise model_registry.exception(model_registry.messages.UNKNOWN_MODEL_ERROR.format(name=backbone))
+            kwargs['similarity_threshold'] = NEURAL_NETWORK_THRESHOLDS[backbone]
+            return backbone, NEURAL_NETWORK_THRESHOLDS[backbone]
+        raise Exception
+
+    def get_image_hashes(self, image: Union[str, ndarray]) -> tuple[str, str]:
+        return self.image_helper.get_perceptual_hash(image), self.image_helper.get_image_hash(image)
+
+    @staticmethod
+    def get_hash_verdict(reference_hash: str, image_hash: str) -> tuple[float, bool] | None:
+        # identical perceptual hashes mean practically the same page, hashes beyond the bound a different one,
+        # the index of a different page is the share of matching hash bits
+        distance = get_hamming_distance(reference_hash, image_hash)
+        if distance == 0:
+            return 1.0, True
+        if distance > PERCEPTUAL_HASH_MAX_DISTANCE:
+            return 1 - distance / PERCEPTUAL_HASH_SIZE, False
+        return None
+
+    def get_indexes(self,
+                    comparator: Type[Union['ComparatorMeanSquaredError',
+                                           'ComparatorStructuralSimilarityIndex',
+                                           'ComparatorNeuralNetwork']],
+                    method: str,
+                    reference_image: Union[str, ndarray],
+                    reference_hashes: tuple[str, str],
+                    images: list[Union[str, ndarray]],
+                    hashes: list[tuple[str, str]],
+                    indexes: list[float | None],
+                    **kwargs) -> list[float]:
+        # pairs the user has already compared in any session reuse the stored index, so SSIM and the neural
+        # network only run for new pages; MSE is cheaper than the lookup
+        if comparator is not ComparatorMeanSquaredError:
+            for number, image_hashes in enumerate(hashes):
+                if indexes[number] is None:
+                    previous = ComparisonResults.objects.find_previous(
+                        self.user_id, method, reference_hashes[0], image_hashes[0], reference_hashes[1], image_hashes[1]
+                    )
+                    indexes[number] = None if previous is None else previous.value
+
+        missed = [number for number, index in enumerate(indexes) if index is None]
+        if missed:
+            missed_images = [images[number] for number in missed]
+            if issubclass(comparator, ComparatorNeuralNetwork):
+                # the reference is embedded once and all rendered pages are scored in one batch
+                computed = comparator(reference_image, missed_images[0], **kwargs).compare_batch_exec(missed_images)
+            else:
+                computed = [comparator(reference_image, image, **kwargs).compare_exec() for image in missed_images]
+            for number, index in zip(missed, computed):
+                indexes[number] = index
+        return indexes
+
     def compare_exec(self,
                      comparator: Type[Union['ComparatorMeanSquaredError',
                                             'ComparatorStructuralSimilarityIndex',
-                                            'ComparatorNeuralNetworkVGG16']],
-                     reference_image_path: str,
-                     image_paths: list):
-        if comparator is ComparatorMeanSquaredError:
-            method, threshold = 'MSE', MSE_THRESHOLD
-        elif comparator is ComparatorStructuralSimilarityIndex:
-            method, threshold = 'SSIM', SSIM_THRESHOLD
-        elif comparator is ComparatorNeuralNetworkVGG16:
-            method, threshold = 'VGG16', VGG16_THRESHOLD
-        else:
-            raise Exception
-
-        for image_path in image_paths:
-            comparator = comparator(reference_image_path, image_path)
-            index = comparator.compare_exec()
-
-            Comparison.objects.create(
-                user_session=self.user_session_model,
+                                            'ComparatorNeuralNetwork']],
+                     reference_image: Union[str, ndarray],
+                     images: list[Union[str, ndarray]],
+                     **kwargs):
+        method, threshold = self.get_method_threshold(comparator, kwargs)
+        if not images:
+            return
+
+        reference_hashes = self.get_image_hashes(reference_image)
+        hashes = [self.get_image_hashes(image) for image in images]
+
+        verdicts = [None] * len(images)
+        if comparator is not ComparatorMeanSquaredError:
+            verdicts = [self.get_hash_verdict(reference_hashes[0], image_hashes[0]) for image_hashes in hashes]
+        indexes = self.get_indexes(
+            comparator, method, reference_image, reference_hashes, images, hashes,
+            [None if verdict is None else verdict[0] for verdict in verdicts], **kwargs
+        )
+
+        for image, image_hashes, index, verdict in zip(images, hashes, indexes, verdicts):
+            image_comparator = comparator(reference_image, image, **kwargs)
+
+            # images are identified by their content, so the hash index keeps one row per distinct image
+            ComparisonResults.objects.add(
+                username_id=self.user_id,
+                uuid_reference=get_uuid(reference_hashes[1]),
+                uuid_compared=get_uuid(image_hashes[1]),
+                hash_reference=reference_hashes[0],
+                hash_compared=image_hashes[0],
+                content_hash_reference=reference_hashes[1],
+                content_hash_compared=image_hashes[1],
                 method=method,
-                threshold=threshold,
                 value=index,
-                percentages=comparator.get_similarity_percentages(index),
-                is_similar=comparator.are_images_similar(index)
+                threshold=threshold,
+                is_similar=image_comparator.are_images_similar(index) if verdict is None else verdict[1]
             )
 
     def exec(self):
-        reference_image_path = self.get_reference_image_path()
-
-        if self.user_settings_model.hide_text:
-            # TODO add rewrite image method, delete old image, add new
-            image = self.image_helper.read_image(reference_image_path)
-            image = self.image_helper.hide_text(image)
-            reference_image_path = self.image_helper.write_image(image, reference_image_path)
+        # text of the reference is hidden by its psd type layers, so no text recognition is needed
+        reference_image = self.get_reference_image(hide_text=self.user_settings_model.hide_text).matrix
 
-        image_paths = self.get_rendered_sits_image_paths()
+        # images are passed between the stages as decoded matrices, nothing is encoded to disk
+        images = [image.matrix for image in self.get_rendered_sits_images()]
+        if self.user_settings_model.hide_text and images:
+            self.image_helper.hide_text_images(images, detector=self.user_settings_model.text_detector)
 
         # TODO Add tests + catch exceptions
         if self.user_settings_model.mse:
-            self.compare_exec(ComparatorMeanSquaredError, reference_image_path, image_paths)
+            self.compare_exec(ComparatorMeanSquaredError, reference_image, images)
         if self.user_settings_model.ssim:
-            self.compare_exec(ComparatorStructuralSimilarityIndex, reference_image_path, image_paths)
+            self.compare_exec(ComparatorStructuralSimilarityIndex, reference_image, images)
         if self.user_settings_model.vgg16:
-            self.compare_exec(ComparatorNeuralNetworkVGG16, reference_image_path, image_paths)
+            self.compare_exec(ComparatorNeuralNetwork, reference_image, images,
+                              backbone=self.user_settings_model.backbone)
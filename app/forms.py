@@ -49,7 +49,7 @@ class UserSettingsForm(forms.ModelForm):
 
     class Meta:
         model = UserSettings
-        fields = ['clear_cache', 'hide_text', 'mse', 'ssim', 'vgg16']
+        fields = ['clear_cache', 'hide_text', 'text_detector', 'mse', 'ssim', 'vgg16', 'backbone']
 
     def __init__(self, *args, **kwargs):
         self.username = kwargs.pop('username', None)
@@ -60,8 +60,12 @@ class UserSettingsForm(forms.ModelForm):
 
         form.username = self.username
         for setting in self.Meta.fields:
-            if self.data.get(setting):
+            if not self.data.get(setting):
+                continue
+            if isinstance(self.fields[setting], forms.BooleanField):
                 setattr(form, setting, True)
+            else:
+                setattr(form, setting, self.data[setting])
 
         if commit:
             form.save()
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageHash',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.CharField(max_length=36)),
+                ('timestamp', models.DateTimeField(auto_now=True)),
+                ('value', models.CharField(db_index=True, max_length=16)),
+                ('band_0', models.CharField(db_index=True, max_length=4)),
+                ('band_1', models.CharField(db_index=True, max_length=4)),
+                ('band_2', models.CharField(db_index=True, max_length=4)),
+                ('band_3', models.CharField(db_index=True, max_length=4)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='comparisonresults',
+            name='hash_compared',
+            field=models.CharField(blank=True, db_index=True, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='comparisonresults',
+            name='hash_reference',
+            field=models.CharField(blank=True, db_index=True, max_length=16),
+        ),
+    ]
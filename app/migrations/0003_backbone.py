@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_perceptual_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='backbone',
+            field=models.CharField(choices=[('vgg16', 'VGG16'), ('mobilenet_v2', 'MobileNetV2'), ('mobilenet_v3', 'MobileNetV3 Small'), ('efficientnet_b0', 'EfficientNetB0'), ('resnet50', 'ResNet50')], default='vgg16', max_length=15),
+        ),
+    ]
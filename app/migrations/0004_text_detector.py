@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_backbone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='text_detector',
+            field=models.CharField(choices=[('easyocr', 'EasyOCR'), ('opencv', 'OpenCV')], default='easyocr', max_length=15),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_text_detector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comparisonresults',
+            name='method',
+            field=models.CharField(choices=[('mse', 'Mean Squared Error (MSE)'), ('ssim', 'Structural Similarity Index (SSIM)'), ('vgg16', 'Neural Network VGG16'), ('mobilenet_v2', 'Neural Network MobileNetV2'), ('mobilenet_v3', 'Neural Network MobileNetV3 Small'), ('efficientnet_b0', 'Neural Network EfficientNetB0'), ('resnet50', 'Neural Network ResNet50')], max_length=15),
+        ),
+    ]
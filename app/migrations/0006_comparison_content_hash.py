@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_comparison_method_backbone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comparisonresults',
+            name='content_hash_compared',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='comparisonresults',
+            name='content_hash_reference',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
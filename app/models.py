@@ -3,7 +3,8 @@ from django.contrib.auth.models import PermissionsMixin
 
 from django.db import models
 
-from app.constants import MODEL_FILE_TYPE, MODEL_COMPARISON_METHOD
+from app.base.common.general import get_hamming_distance
+from app.constants import MODEL_FILE_TYPE, MODEL_COMPARISON_METHOD, MODEL_BACKBONE, MODEL_TEXT_DETECTOR
 from app.utils.validators import EmailValidator, UsernameValidator
 
 
@@ -63,27 +64,33 @@ class UserSettings(models.Model):
         username: The user to whom the settings belong.
         clear_cache: Flag indicating whether to clear the cache.
         hide_text: Flag indicating whether text on an image should be hidden.
+        text_detector: Text detector used to hide text, EasyOCR or the model-free OpenCV detector.
         mse: Flag indicating whether to use Mean Squared Error as a comparator.
         ssim: Flag indicating whether to use Structural Similarity Index as a comparator.
         vgg16: Flag indicating whether to use the VGG16 neural network as a comparator.
+        backbone: Convolutional neural network used by the neural network comparator.
     """
     username = models.ForeignKey(AuthUser, on_delete=models.CASCADE, primary_key=True)
 
     clear_cache = models.BooleanField(default=False)
     hide_text = models.BooleanField(default=False)
+    text_detector = models.CharField(choices=MODEL_TEXT_DETECTOR, max_length=15, default='easyocr')
 
     mse = models.BooleanField(default=False)
     ssim = models.BooleanField(default=False)
     vgg16 = models.BooleanField(default=False)
+    backbone = models.CharField(choices=MODEL_BACKBONE, max_length=15, default='vgg16')
 
     def __str__(self):
         return (
             'Current settings: '
             f'clear_cache is {self.clear_cache}, '
             f'hide_text is {self.hide_text}, '
+            f'text_detector is {self.text_detector}, '
             f'mse is {self.mse}, '
             f'ssim is {self.ssim}, '
-            f'vgg16 is {self.vgg16}'
+            f'vgg16 is {self.vgg16}, '
+            f'backbone is {self.backbone}'
         )
 
 
@@ -103,6 +110,40 @@ class UserUploadFile(models.Model):
         return f'{self.uuid} ({self.file_type}/{self.timestamp})'
 
 
+class ComparisonResultsManager(models.Manager):
+
+    def add(self, **fields) -> 'ComparisonResults':
+        """Creates a comparison result and indexes the hashes of both images for lookups in later sessions."""
+        result = self.create(**fields)
+        images = ((result.uuid_reference, result.hash_reference), (result.uuid_compared, result.hash_compared))
+        for uuid, value in images:
+            if value:
+                ImageHash.objects.add(uuid, value)
+        return result
+
+    def find_previous(
+            self,
+            username_id: int,
+            method: str,
+            hash_reference: str,
+            hash_compared: str,
+            content_hash_reference: str,
+            content_hash_compared: str
+    ) -> 'ComparisonResults | None':
+        """Finds the latest result of the method for a pair of images the user has already compared in any session.
+        The pair is looked up by the indexed perceptual hashes and confirmed by the exact content hashes,
+        so images that only look alike are compared anew.
+        """
+        return self.filter(
+            username_id=username_id,
+            method=method,
+            hash_reference=hash_reference,
+            hash_compared=hash_compared,
+            content_hash_reference=content_hash_reference,
+            content_hash_compared=content_hash_compared,
+        ).order_by('-timestamp').first()
+
+
 class ComparisonResults(models.Model):
     """Represents a comparison operation initiated by a user.
     This model is used to store information about comparisons performed by users,
@@ -114,8 +155,67 @@ class ComparisonResults(models.Model):
     uuid_reference = models.CharField(max_length=36)
     uuid_compared = models.CharField(max_length=36)
 
-    method = models.CharField(choices=MODEL_COMPARISON_METHOD, max_length=5)
+    hash_reference = models.CharField(max_length=16, blank=True, db_index=True)
+    hash_compared = models.CharField(max_length=16, blank=True, db_index=True)
+    content_hash_reference = models.CharField(max_length=64, blank=True)
+    content_hash_compared = models.CharField(max_length=64, blank=True)
+
+    method = models.CharField(choices=MODEL_COMPARISON_METHOD, max_length=15)
     value = models.FloatField()
     threshold = models.FloatField()
 
     is_similar = models.BooleanField()
+
+    objects = ComparisonResultsManager()
+
+
+class ImageHashManager(models.Manager):
+    BANDS_COUNT: int = 4
+
+    @classmethod
+    def get_bands(cls, value: str) -> dict[str, str]:
+        band_size = len(value) // cls.BANDS_COUNT
+        return {
+            f'band_{number}': value[number * band_size:(number + 1) * band_size] for number in range(cls.BANDS_COUNT)
+        }
+
+    def add(self, uuid: str, value: str) -> 'ImageHash':
+        return self.get_or_create(uuid=uuid, value=value, defaults=self.get_bands(value))[0]
+
+    def find_similar(self, value: str, max_distance: int = 0) -> list['ImageHash']:
+        """Finds previously seen images whose perceptual hash is within the Hamming distance.
+        If two hashes differ in fewer bits than there are bands, at least one band matches exactly,
+        so only the rows sharing a band have to be checked.
+        """
+        if max_distance == 0:
+            return list(self.filter(value=value))
+
+        candidates = self.all()
+        if max_distance < self.BANDS_COUNT:
+            query = models.Q()
+            for band, band_value in self.get_bands(value).items():
+                query |= models.Q(**{band: band_value})
+            candidates = candidates.filter(query)
+        return [
+            image_hash for image_hash in candidates if get_hamming_distance(image_hash.value, value) <= max_distance
+        ]
+
+
+class ImageHash(models.Model):
+    """Represents a perceptual hash of a reference or rendered image.
+    This model is used as an index of previously seen images across sessions.
+    The hash is additionally split into bands, each of them indexed, for fast near-duplicate lookup.
+    """
+    uuid = models.CharField(max_length=36)
+    timestamp = models.DateTimeField(auto_now=True)
+
+    value = models.CharField(max_length=16, db_index=True)
+    band_0 = models.CharField(max_length=4, db_index=True)
+    band_1 = models.CharField(max_length=4, db_index=True)
+    band_2 = models.CharField(max_length=4, db_index=True)
+    band_3 = models.CharField(max_length=4, db_index=True)
+
+    objects = ImageHashManager()
+
+    def __str__(self):
+        return f'{self.uuid} ({self.value})'
@@ -0,0 +1,3 @@
+from app.utils.common import setup_environment
+
+setup_environment()
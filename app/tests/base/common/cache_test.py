@@ -0,0 +1,93 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.base.common.cache import DiskCache
+from app.base.types import Path
+
+
+class TextCache(DiskCache):
+    extension: str = "txt"
+
+    def _dump(self, path: Path, value: str) -> None:
+        with open(path, "w") as file:
+            file.write(value)
+
+    def _load(self, path: Path) -> str:
+        with open(path) as file:
+            return file.read()
+
+
+class TestDiskCache(TestCase):
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.instance = TextCache(self.cache_dir.name, max_size=10)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
+    def test_get_key(self) -> None:
+        with self.subTest("Same parts"):
+            self.assertEqual(self.instance.get_key("a", 1), self.instance.get_key("a", 1))
+
+        with self.subTest("Different parts"):
+            self.assertNotEqual(self.instance.get_key("a", 1), self.instance.get_key("a", 2))
+
+    def test_get_and_set(self) -> None:
+        key = self.instance.get_key("test")
+
+        with self.subTest("Miss"):
+            self.assertIsNone(self.instance.get(key))
+            self.assertEqual(1, self.instance.stats["misses"])
+
+        with self.subTest("Hit"):
+            self.instance.set(key, "value")
+            self.assertEqual("value", self.instance.get(key))
+            self.assertEqual(1, self.instance.stats["hits"])
+            self.assertEqual(1, self.instance.stats["count"])
+
+    def test_evict(self) -> None:
+        old_key, new_key = self.instance.get_key("old"), self.instance.get_key("new")
+        self.instance.set(old_key, "12345")
+        os.utime(self.instance.get_path(old_key), (0, 0))
+        self.instance.set(new_key, "678901")
+
+        self.assertIsNone(self.instance.get(old_key))
+        self.assertEqual("678901", self.instance.get(new_key))
+        self.assertLessEqual(self.instance.stats["size"], 10)
+
+    def test_concurrent_set(self) -> None:
+        instance = TextCache(self.cache_dir.name, max_size=1024 * 1024)
+        key = instance.get_key("shared")
+        values = [str(number) * 100 for number in range(10)]
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(lambda value: instance.set(key, value), values * 5))
+
+        with self.subTest("Complete value of one writer"):
+            self.assertIn(instance.get(key), values)
+
+        with self.subTest("No temporary files left"):
+            self.assertEqual([os.path.basename(instance.get_path(key))], os.listdir(self.cache_dir.name))
+
+    def test_record_removed_by_another_process(self) -> None:
+        self.instance.set(self.instance.get_key("first"), "12345")
+        self.instance.set(self.instance.get_key("second"), "678")
+        records = self.instance._get_records()
+        os.remove(records[0].path)
+
+        with patch.object(self.instance, "_get_records", return_value=records):
+            with self.subTest("Stats"):
+                self.assertEqual(1, self.instance.stats["count"])
+
+            with self.subTest("Evict"):
+                self.instance.evict()
+
+    def test_clear(self) -> None:
+        self.instance.set(self.instance.get_key("test"), "value")
+        self.instance.clear()
+
+        self.assertEqual({"hits": 0, "misses": 0, "count": 0, "size": 0}, self.instance.stats)
@@ -1,10 +1,17 @@
+import tempfile
+from typing import Callable
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, Mock, patch
 
+import cv2 as cv
+import numpy as np
 from psd_tools import PSDImage
+from psd_tools.constants import Resource
+from psd_tools.psd.image_resources import ImageResources, VersionInfo
 
 from app.base.common.general import merge_path_elements, get_current_path, remove_file_or_folder, is_file_exists
-from app.base.common.image import Image, ImageCV
+from app.base.common.image import Image, ImageCV, ImageArtifact, CompositeCache, CompositeSource, TextBoxCache
+from app.base.constants import FILL_TEXT_COLOR, Language, TextDetector
 from app.base.types import Path, ImgPath, ImageMatrix, ImgSavePath, ImgSize
 
 
@@ -14,10 +21,14 @@ class TestImage(TestCase):
         self.dir_data_path: Path = merge_path_elements([get_current_path(), "app", "tests", "data"])
         self.img_path: ImgPath = merge_path_elements([self.dir_data_path, "template_test.psd"])
 
-        self.instance = Image()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.instance = Image(cache=CompositeCache(self.cache_dir.name, max_size=1024 ** 3))
         self.exception = self.instance.exception
         self.messages = self.instance.messages
 
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
     def test_open_image(self) -> None:
         with self.subTest("Open image"):
             self.assertIsInstance(self.instance.open_image( self.img_path), PSDImage)
@@ -43,14 +54,94 @@ class TestImage(TestCase):
             _ = self.instance.convert_format_image(img_path, to_format="test")
         self.assertEqual(self.messages.UNKNOWN_TO_FORMAT_ERROR, e.exception.message)
 
+        self.instance.cache.clear()
         with (
             self.subTest("Image composite error"),
             patch('psd_tools.PSDImage.composite', side_effect=Exception("Mocked composite error")),
             self.assertRaises(self.exception) as e,
         ):
-            _ = self.instance.convert_format_image(img_path)
+            _ = self.instance.convert_format_image(img_path, use_preview=False)
         self.assertIn(self.messages.IMG_COMPOSITE_ERROR[:-10], e.exception.message)
 
+    def test_get_composite_image(self) -> None:
+        composite = self.instance.get_composite_image(self.img_path)
+
+        with self.subTest("Composite cached"):
+            self.assertEqual(1, self.instance.cache.stats["count"])
+            self.assertEqual(1, self.instance.cache.stats["misses"])
+
+        with self.subTest("Cache hit skips composite"), patch("psd_tools.PSDImage.composite") as mock:
+            cached = self.instance.get_composite_image(self.img_path)
+            mock.assert_not_called()
+            self.assertEqual(CompositeSource.CACHE, self.instance.composite_source)
+            self.assertEqual(composite.size, cached.size)
+            self.assertEqual(composite.tobytes(), cached.convert(composite.mode).tobytes())
+
+        with self.subTest("Without cache"):
+            self.assertEqual(composite.size, Image(cache=None).get_composite_image(self.img_path).size)
+
+        with self.subTest("Invalid image path"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_composite_image("test")
+        self.assertEqual(self.messages.INVALID_IMG_PATH_ERROR, e.exception.message)
+
+    def test_get_composite_image_preview(self) -> None:
+        instance = Image(cache=None)
+
+        with self.subTest("Merged image used"), patch("psd_tools.PSDImage.composite") as mock:
+            preview = instance.get_composite_image(self.img_path)
+            mock.assert_not_called()
+            self.assertEqual(CompositeSource.PREVIEW, instance.composite_source)
+
+        get_data = ImageResources.get_data
+
+        def get_version_info(version_info: VersionInfo | None) -> Callable:
+            return lambda resources, key, *args: (
+                version_info if key == Resource.VERSION_INFO else get_data(resources, key, *args)
+            )
+
+        with self.subTest("Fallback without merged image"), patch.object(
+                ImageResources, "get_data", get_version_info(VersionInfo(has_composite=False))
+        ):
+            composite = instance.get_composite_image(self.img_path)
+            self.assertEqual(CompositeSource.COMPOSITE, instance.composite_source)
+            self.assertEqual(preview.size, composite.size)
+
+        with self.subTest("Fallback without version info"), patch.object(
+                ImageResources, "get_data", get_version_info(None)
+        ):
+            _ = instance.get_composite_image(self.img_path)
+            self.assertEqual(CompositeSource.COMPOSITE, instance.composite_source)
+
+        with self.subTest("Fallback on merged image of wrong size"), patch(
+                "psd_tools.PSDImage.topil", return_value=preview.resize((10, 10))
+        ):
+            _ = instance.get_composite_image(self.img_path)
+            self.assertEqual(CompositeSource.COMPOSITE, instance.composite_source)
+
+        with self.subTest("Preview disabled"):
+            _ = instance.get_composite_image(self.img_path, use_preview=False)
+            self.assertEqual(CompositeSource.COMPOSITE, instance.composite_source)
+
+    def test_get_composite_image_hide_text(self) -> None:
+        instance = Image(cache=None)
+        boxes = instance.get_text_layer_boxes(instance.open_image(self.img_path))
+
+        with self.subTest("Text layer boxes"):
+            self.assertEqual([(78, 48, 274, 85)], boxes)
+
+        with self.subTest("Text layers filled"), patch("easyocr.Reader") as mock:
+            composite = instance.get_composite_image(self.img_path, hide_text=True)
+            mock.assert_not_called()
+            left, top, right, bottom = boxes[0]
+            self.assertEqual(FILL_TEXT_COLOR, composite.getpixel((left, top))[:3])
+            self.assertEqual(FILL_TEXT_COLOR, composite.getpixel((right - 1, bottom - 1))[:3])
+            self.assertNotEqual(FILL_TEXT_COLOR, composite.getpixel((right, bottom))[:3])
+
+        with self.subTest("Separate cache entry"):
+            _ = self.instance.get_composite_image(self.img_path)
+            _ = self.instance.get_composite_image(self.img_path, hide_text=True)
+            self.assertEqual(2, self.instance.cache.stats["count"])
+
 
 class TestImageCV(TestCase):
 
@@ -58,7 +149,7 @@ class TestImageCV(TestCase):
         self.dir_data_path: Path = merge_path_elements([get_current_path(), "app", "tests", "data"])
         self.img_with_text_path = merge_path_elements([self.dir_data_path, 'img_page_test.png'])
 
-        self.instance = ImageCV()
+        self.instance = ImageCV(cache=None)
         self.exception = self.instance.exception
         self.messages = self.instance.messages
 
@@ -70,6 +161,29 @@ class TestImageCV(TestCase):
             _ = self.instance.read_image("test")
         self.assertEqual(self.messages.INVALID_IMG_PATH_ERROR, e.exception.message)
 
+    def test_read_image_reduced(self) -> None:
+        img_path: ImgPath = merge_path_elements([self.dir_data_path, 'img_page.png'])
+        height, width = self.instance.read_image(img_path).shape[:2]
+
+        with self.subTest("Grayscale"):
+            self.assertEqual((height, width), self.instance.read_image(img_path, grayscale=True).shape)
+
+        with self.subTest("Reduced"):
+            img_matrix: ImageMatrix = self.instance.read_image(img_path, reduce=4)
+            self.assertEqual((height // 4, width // 4, 3), img_matrix.shape)
+            img_matrix = self.instance.read_image(img_path, grayscale=True, reduce=2)
+            self.assertEqual((height // 2, width // 2), img_matrix.shape)
+
+        with self.subTest("Reduce factor"):
+            self.assertEqual(4, self.instance.get_reduce_factor(img_path, (width // 5, height // 5)))
+            self.assertEqual(2, self.instance.get_reduce_factor(img_path, (width // 2, 100)))
+            self.assertEqual(1, self.instance.get_reduce_factor(img_path, (width, height)))
+            self.assertEqual(1, self.instance.get_reduce_factor("test", (10, 10)))
+
+        with self.subTest("Invalid reduce factor"), self.assertRaises(self.exception) as e:
+            _ = self.instance.read_image(img_path, reduce=3)
+        self.assertEqual(self.messages.INVALID_REDUCE_FACTOR_ERROR, e.exception.message)
+
     def test_save_image(self) -> None:
         save_path: Path = merge_path_elements([self.dir_data_path, 'test_img.png'])
         img_matrix: ImageMatrix = self.instance.read_image(self.img_with_text_path)
@@ -104,6 +218,20 @@ class TestImageCV(TestCase):
             _ = self.instance.resize_image(img_matrix, None)
         self.assertEqual(self.messages.IMG_SIZE_TYPE_ERROR, e.exception.message)
 
+    def test_get_image_pyramid(self) -> None:
+        img_matrix: ImageMatrix = np.zeros((128, 96, 3), dtype="uint8")
+
+        with self.subTest("Levels are halved"):
+            pyramid = self.instance.get_image_pyramid(img_matrix, 2)
+            self.assertEqual([(128, 96), (64, 48), (32, 24)], [level.shape[:2] for level in pyramid])
+
+        with self.subTest("Levels are limited by min size"):
+            self.assertEqual(1, len(self.instance.get_image_pyramid(img_matrix[:20, :20], 3)))
+
+        with self.subTest("Image type error"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_image_pyramid(None, 2)
+        self.assertEqual(self.messages.IMG_MATRIX_TYPE_ERROR, e.exception.message)
+
     def test_convert_image_to_grayscale(self) -> None:
         img_matrix: ImageMatrix = self.instance.read_image(self.img_with_text_path)
 
@@ -129,6 +257,39 @@ class TestImageCV(TestCase):
             _ = self.instance.convert_image_to_rgb("test")
         self.assertEqual(self.messages.IMG_MATRIX_TYPE_ERROR, e.exception.message)
 
+    def test_get_image_hash(self) -> None:
+        img_matrix: ImageMatrix = self.instance.read_image(self.img_with_text_path)
+
+        with self.subTest("Same pixels"):
+            self.assertEqual(self.instance.get_image_hash(img_matrix), self.instance.get_image_hash(img_matrix.copy()))
+
+        with self.subTest("Different pixels"):
+            img_matrix_changed: ImageMatrix = img_matrix.copy()
+            img_matrix_changed[0, 0] = img_matrix_changed[0, 0] + 1
+            self.assertNotEqual(
+                self.instance.get_image_hash(img_matrix), self.instance.get_image_hash(img_matrix_changed)
+            )
+
+        with self.subTest("Image type error"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_image_hash("test")
+        self.assertEqual(self.messages.IMG_MATRIX_TYPE_ERROR, e.exception.message)
+
+    def test_get_perceptual_hash(self) -> None:
+        img_matrix: ImageMatrix = self.instance.read_image(self.img_with_text_path)
+
+        with self.subTest("Hash format"):
+            self.assertEqual(16, len(self.instance.get_perceptual_hash(img_matrix)))
+
+        with self.subTest("Resized image has the same hash"):
+            img_resized: ImageMatrix = self.instance.resize_image(img_matrix, (300, 300))
+            self.assertEqual(
+                self.instance.get_perceptual_hash(img_matrix), self.instance.get_perceptual_hash(img_resized)
+            )
+
+        with self.subTest("Image type error"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_perceptual_hash("test")
+        self.assertEqual(self.messages.IMG_MATRIX_TYPE_ERROR, e.exception.message)
+
     def test_is_images_the_same_pixels(self):
         img_text_path: Path = merge_path_elements([self.dir_data_path, 'img_with_text_test.png'])
         img_text_hided_path: Path = merge_path_elements([self.dir_data_path, 'img_with_text_hided.png'])
@@ -152,6 +313,212 @@ class TestImageCV(TestCase):
             _ = self.instance.is_images_the_same_pixels(None, img_text_path)
         self.assertEqual(self.messages.IMG_IS_SAME_TYPE_ERROR, e.exception.message)
 
+    def test_get_squared_error(self) -> None:
+        img_matrix: ImageMatrix = self.instance.read_image(self.img_with_text_path)
+
+        with self.subTest("The same images"):
+            self.assertEqual(0, self.instance.get_squared_error(img_matrix, img_matrix.copy()))
+
+        with self.subTest("Different images"):
+            img_matrix_changed: ImageMatrix = img_matrix.copy()
+            img_matrix_changed[0, 0] = 0
+            expected: float = float(((img_matrix[0, 0].astype("float") - img_matrix_changed[0, 0]) ** 2).sum())
+            self.assertEqual(expected, self.instance.get_squared_error(img_matrix, img_matrix_changed))
+
+        with self.subTest("Size mismatch"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_squared_error(img_matrix, img_matrix[1:])
+        self.assertEqual(self.messages.IMG_SIZE_MISMATCH_ERROR, e.exception.message)
+
+    def test_get_text_polygons(self) -> None:
+        img_matrix: ImageMatrix = np.full((50, 100, 3), 255, dtype="uint8")
+        reader = Mock()
+        reader.readtext.return_value = [([[10, 10], [40, 10], [40, 20], [10, 20]], "text", 0.9)]
+        reader.detect.return_value = ([[[10, 40, 10, 20]]], [[[[50, 30], [90, 30], [90, 45], [50, 45]]]])
+        pool = MagicMock()
+        pool.acquire.return_value.__enter__.return_value = reader
+
+        with patch("app.base.common.image.reader_pool", pool):
+            with self.subTest("Recognition"):
+                polygons = self.instance.get_text_polygons(img_matrix)
+                reader.detect.assert_not_called()
+                self.assertEqual([[10, 10], [40, 10], [40, 20], [10, 20]], polygons[0].tolist())
+
+            with self.subTest("Detection only"):
+                polygons = self.instance.get_text_polygons(img_matrix, detect_only=True)
+                reader.detect.assert_called_once()
+                self.assertEqual(2, len(polygons))
+                self.assertEqual([[10, 10], [40, 10], [40, 20], [10, 20]], polygons[0].tolist())
+                self.assertEqual([[50, 30], [90, 30], [90, 45], [50, 45]], polygons[1].tolist())
+
+        with self.subTest("Fill text polygons"):
+            img_matrix = self.instance.fill_text_polygons(img_matrix, polygons)
+            self.assertEqual(list(FILL_TEXT_COLOR), img_matrix[15, 25].tolist())
+            self.assertEqual(list(FILL_TEXT_COLOR), img_matrix[40, 70].tolist())
+            self.assertEqual([255, 255, 255], img_matrix[5, 5].tolist())
+
+    def test_get_text_polygons_opencv(self) -> None:
+        img_matrix: ImageMatrix = np.full((200, 400, 3), 255, dtype="uint8")
+        cv.putText(img_matrix, "Hello world", (20, 50), cv.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        cv.rectangle(img_matrix, (20, 100), (380, 190), (0, 0, 0), -1)
+        pool = MagicMock()
+
+        with patch("app.base.common.image.reader_pool", pool):
+            polygons = self.instance.get_text_polygons(img_matrix, detector=TextDetector.OPENCV)
+        pool.acquire.assert_not_called()
+
+        with self.subTest("Text is found"):
+            mask: ImageMatrix = cv.fillPoly(np.zeros((200, 400), dtype="uint8"), polygons, 255)
+            self.assertTrue(mask[40, 40])
+            self.assertTrue(all(polygon.shape == (4, 2) for polygon in polygons))
+
+        with self.subTest("Solid block is not text"):
+            self.assertFalse(mask[140:150, 100:300].any())
+
+        with self.subTest("Hide text on images"):
+            images = self.instance.hide_text_on_images([img_matrix.copy()], detector=TextDetector.OPENCV)
+            self.assertEqual(list(FILL_TEXT_COLOR), images[0][40, 40].tolist())
+            self.assertEqual([0, 0, 0], images[0][145, 200].tolist())
+
+    def test_get_overlapping_tile_bounds(self) -> None:
+        with self.subTest("Single tile"):
+            self.assertEqual([(0, 100)], self.instance.get_overlapping_tile_bounds(100, 200, 20))
+
+        with self.subTest("Overlapping tiles"):
+            self.assertEqual(
+                [(0, 100), (80, 180), (150, 250)],
+                self.instance.get_overlapping_tile_bounds(250, 100, 20),
+            )
+
+    def test_deduplicate_text_polygons(self) -> None:
+        def get_polygon(left: int, top: int, right: int, bottom: int) -> np.ndarray:
+            return np.array([[left, top], [right, top], [right, bottom], [left, bottom]], dtype="int32")
+
+        polygons = [get_polygon(0, 0, 100, 20), get_polygon(0, 2, 60, 19), get_polygon(0, 30, 100, 50)]
+        kept = self.instance.deduplicate_text_polygons(polygons)
+
+        self.assertEqual(2, len(kept))
+        self.assertIs(polygons[0], kept[0])
+        self.assertIs(polygons[2], kept[1])
+
+    def test_get_text_polygons_by_tiles(self) -> None:
+        img_matrix: ImageMatrix = np.zeros((250, 50, 3), dtype="uint8")
+        # each row stores its own index, so the first pixel of a tile tells its top
+        img_matrix[:, :, 0] = np.arange(250)[:, None]
+        # the text line at rows 90-95 lies in the overlap of the first two tiles and is found twice
+        tile_polygons = {
+            0: [np.array([[0, 90], [40, 90], [40, 95], [0, 95]])],
+            80: [np.array([[0, 10], [40, 10], [40, 15], [0, 15]])],
+        }
+
+        def get_text_polygons(tile, languages, detect_only, exclusive, detector):
+            return tile_polygons.get(int(tile[0, 0, 0]), [])
+
+        with self.subTest("Polygons mapped back and deduplicated"), patch.object(
+                ImageCV, "get_text_polygons", side_effect=get_text_polygons
+        ) as mock:
+            polygons = self.instance.get_text_polygons_by_tiles(img_matrix, tile_height=100, overlap=20)
+            self.assertEqual(3, mock.call_count)
+            self.assertEqual([[[0, 90], [40, 90], [40, 95], [0, 95]]], [polygon.tolist() for polygon in polygons])
+
+        with self.subTest("Downscaled tiles"), patch.object(
+                ImageCV, "get_text_polygons", return_value=[np.array([[0, 10], [20, 10], [20, 15], [0, 15]])]
+        ) as mock:
+            polygons = self.instance.get_text_polygons_by_tiles(img_matrix, scale=0.5, tile_height=500)
+            self.assertEqual((125, 25, 3), mock.call_args[0][0].shape)
+            self.assertEqual([[0, 20], [40, 20], [40, 30], [0, 30]], polygons[0].tolist())
+
+        with self.subTest("Concurrent tiles"), patch.object(ImageCV, "get_text_polygons", return_value=[]) as mock:
+            _ = self.instance.get_text_polygons_by_tiles(img_matrix, tile_height=100, overlap=20, max_workers=4)
+            self.assertEqual(3, mock.call_count)
+            self.assertFalse(mock.call_args[0][3])
+
+        with self.subTest("Invalid overlap"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_text_polygons_by_tiles(img_matrix, tile_height=100, overlap=100)
+        self.assertEqual(self.messages.INVALID_TILE_PARAMS_ERROR, e.exception.message)
+
+    def test_get_text_polygons_batch(self) -> None:
+        img_matrices: list[ImageMatrix] = [
+            np.full((100, 50, 3), 255, dtype="uint8"),
+            np.full((60, 50, 3), 255, dtype="uint8"),
+            np.full((250, 50, 3), 255, dtype="uint8"),
+        ]
+        box = [[0, 10], [20, 10], [20, 15], [0, 15]]
+        reader = Mock()
+        reader.detect.side_effect = lambda batch, reformat: ([[[0, 20, 10, 15]]] * len(batch), [[]] * len(batch))
+        reader.readtext_batched.side_effect = lambda batch, batch_size: [[(box, "text", 0.9)]] * len(batch)
+        pool = MagicMock()
+        pool.acquire.return_value.__enter__.return_value = reader
+
+        with patch("app.base.common.image.reader_pool", pool):
+            with self.subTest("Detection in batches"):
+                polygons = self.instance.get_text_polygons_batch(
+                    img_matrices, detect_only=True, batch_size=2, tile_height=100, overlap=20
+                )
+                # four 100x50 tiles (one of the first image, three of the last) go in two batches,
+                # the 60x50 tile is batched separately
+                self.assertEqual(3, reader.detect.call_count)
+                self.assertEqual(3, len(polygons))
+                self.assertEqual([box], [polygon.tolist() for polygon in polygons[0]])
+                self.assertEqual([box], [polygon.tolist() for polygon in polygons[1]])
+                self.assertEqual(
+                    [[[x, y + top] for x, y in box] for top in (0, 80, 150)],
+                    [polygon.tolist() for polygon in polygons[2]],
+                )
+
+            with self.subTest("Recognition in batches"):
+                polygons = self.instance.get_text_polygons_batch(
+                    img_matrices, batch_size=8, tile_height=100, overlap=20
+                )
+                self.assertEqual(2, reader.readtext_batched.call_count)
+                self.assertEqual([box], [polygon.tolist() for polygon in polygons[1]])
+
+            with self.subTest("Hide text on images"):
+                masked = self.instance.hide_text_on_images([img.copy() for img in img_matrices], detect_only=True)
+                self.assertEqual(3, len(masked))
+                for img_matrix in masked:
+                    self.assertEqual(list(FILL_TEXT_COLOR), img_matrix[12, 10].tolist())
+
+        with self.subTest("Invalid images"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_text_polygons_batch([None])
+        self.assertEqual(self.messages.IMG_MATRIX_TYPE_ERROR, e.exception.message)
+
+    def test_text_box_cache(self) -> None:
+        img_matrices: list[ImageMatrix] = [np.full((100, 50, 3), 255, dtype="uint8") for _ in range(2)]
+        img_matrices[1][0, 0] = 0
+        box = [[0, 10], [20, 10], [20, 15], [0, 15]]
+        reader = Mock()
+        reader.detect.side_effect = lambda batch, reformat=True: ([[[0, 20, 10, 15]]] * len(batch), [[]] * len(batch))
+        reader.readtext.return_value = []
+        pool = MagicMock()
+        pool.acquire.return_value.__enter__.return_value = reader
+
+        with tempfile.TemporaryDirectory() as cache_dir, patch("app.base.common.image.reader_pool", pool):
+            instance = ImageCV(cache=TextBoxCache(cache_dir, max_size=1024 ** 2))
+
+            with self.subTest("Boxes cached by batch"):
+                _ = instance.get_text_polygons_batch(img_matrices[:1], detect_only=True)
+                polygons = instance.get_text_polygons_batch(img_matrices, detect_only=True)
+                self.assertEqual(2, reader.detect.call_count)
+                self.assertEqual(1, len(reader.detect.call_args.args[0]))
+                self.assertEqual([[box], [box]], [[polygon.tolist() for polygon in p] for p in polygons])
+
+            with self.subTest("Same boxes replayed by tiles"):
+                polygons = instance.get_text_polygons_by_tiles(img_matrices[0].copy(), detect_only=True)
+                self.assertEqual(2, reader.detect.call_count)
+                self.assertEqual([box], [polygon.tolist() for polygon in polygons])
+
+            with self.subTest("Other languages and settings are separate records"):
+                _ = instance.get_text_polygons_by_tiles(img_matrices[0], (Language.ENGLISH,), detect_only=True)
+                _ = instance.get_text_polygons_by_tiles(img_matrices[0])
+                _ = instance.get_text_polygons_by_tiles(img_matrices[0], scale=0.5)
+                self.assertEqual(3, reader.detect.call_count)
+                self.assertEqual(2, reader.readtext.call_count)
+                self.assertEqual(5, instance.cache.stats["count"])
+
+            with self.subTest("Empty result is cached"):
+                self.assertEqual([], instance.get_text_polygons_by_tiles(img_matrices[0]))
+                self.assertEqual(2, reader.readtext.call_count)
+
     def test_found_and_hide_text_on_image(self):
         with self.subTest("Found and hide text on image"):
             img_path_before: Path = self.img_with_text_path
@@ -164,3 +531,47 @@ class TestImageCV(TestCase):
             img_matrix_after: ImageMatrix = self.instance.read_image(img_path_after)
 
             self.assertFalse(self.instance.is_images_the_same_pixels(img_matrix_before, img_matrix_after))
+
+
+class TestImageArtifact(TestCase):
+
+    def setUp(self) -> None:
+        self.dir_data_path: Path = merge_path_elements([get_current_path(), "app", "tests", "data"])
+        self.img_path: ImgPath = merge_path_elements([self.dir_data_path, 'img_with_text.png'])
+        self.exception = ImageCV.exception
+        self.messages = ImageCV.messages
+
+    def test_from_bytes(self) -> None:
+        img_matrix: ImageMatrix = ImageCV(cache=None).read_image(self.img_path)
+
+        with self.subTest("Decoded without a file"):
+            with open(self.img_path, "rb") as file:
+                artifact = ImageArtifact.from_bytes("page", file.read())
+            self.assertIsNone(artifact.path)
+            self.assertTrue(np.array_equal(img_matrix, artifact.matrix))
+
+        with self.subTest("Invalid bytes"), self.assertRaises(self.exception) as e:
+            _ = ImageArtifact.from_bytes("page", b"test")
+        self.assertEqual(self.messages.IMG_DECODE_ERROR, e.exception.message)
+
+        with self.subTest("Invalid bytes type"), self.assertRaises(self.exception) as e:
+            _ = ImageArtifact.from_bytes("page", None)
+        self.assertEqual(self.messages.IMG_BYTES_TYPE_ERROR, e.exception.message)
+
+    def test_from_composite(self) -> None:
+        psd_path: ImgPath = merge_path_elements([self.dir_data_path, 'template_test.psd'])
+        composite = Image(cache=None).get_composite_image(psd_path)
+
+        artifact = ImageArtifact.from_composite("reference", composite)
+        self.assertEqual((composite.height, composite.width, 3), artifact.matrix.shape)
+        self.assertEqual(list(composite.convert("RGB").getpixel((0, 0)))[::-1], artifact.matrix[0, 0].tolist())
+        self.assertTrue(np.array_equal(artifact.matrix, Image(cache=None).get_composite_matrix(psd_path)))
+
+    def test_save(self) -> None:
+        artifact = ImageArtifact.from_file("page", self.img_path)
+
+        with tempfile.TemporaryDirectory() as save_dir:
+            save_path: ImgSavePath = merge_path_elements([save_dir, 'page.png'])
+            self.assertEqual(save_path, artifact.save(save_path))
+            self.assertEqual(save_path, artifact.path)
+            self.assertTrue(np.array_equal(artifact.matrix, ImageCV(cache=None).read_image(save_path)))
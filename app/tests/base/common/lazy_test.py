@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from app.base.common.lazy import LazyModule, lazy_import
+
+
+class TestLazyModule(TestCase):
+
+    def test_lazy_import(self) -> None:
+        module: LazyModule = lazy_import("json")
+
+        with self.subTest("Not loaded before attribute access"):
+            self.assertIsNone(module._module)
+
+        with self.subTest("Loaded on attribute access"):
+            self.assertEqual("[1]", module.dumps([1]))
+            self.assertIs(sys.modules["json"], module._module)
+            self.assertTrue(module.is_loaded)
+
+        with self.subTest("Unknown module"), self.assertRaises(ModuleNotFoundError):
+            _ = lazy_import("unknown_module").attribute
+
+    def test_heavy_modules_not_imported(self) -> None:
+        heavy_modules: tuple[str, ...] = ("keras", "tensorflow", "torch", "easyocr", "skimage", "sklearn", "psd_tools")
+        for module in ("app.compare.comparator", "app.engine.comparator", "app.engine.image_helper"):
+            with self.subTest(module=module):
+                process = subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        f"import sys, {module}; "
+                        f"print(','.join(name for name in {heavy_modules!r} if name in sys.modules))",
+                    ],
+                    capture_output=True,
+                    text=True,
+                )
+                self.assertEqual(0, process.returncode, process.stderr)
+                self.assertEqual("", process.stdout.strip())
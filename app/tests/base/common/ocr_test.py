@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from app.base.common.ocr import ReaderPool
+from app.base.constants import Language
+
+
+class TestReaderPool(TestCase):
+
+    def setUp(self) -> None:
+        self.reader_class = Mock(side_effect=lambda languages: Mock(languages=languages))
+        self.patcher = patch("app.base.common.ocr.easyocr", Mock(Reader=self.reader_class))
+        self.patcher.start()
+
+        self.instance = ReaderPool(max_idle=60)
+        self.exception = self.instance.exception
+        self.messages = self.instance.messages
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+
+    def test_acquire(self) -> None:
+        with self.subTest("Reader is loaded once per languages"):
+            with self.instance.acquire(("en", "ru")) as reader_first:
+                self.assertEqual(["en", "ru"], reader_first.languages)
+            with self.instance.acquire(["en", "ru"]) as reader_second:
+                self.assertIs(reader_first, reader_second)
+            self.reader_class.assert_called_once()
+
+        with self.subTest("Languages order does not matter"):
+            with self.instance.acquire((Language.RUSSIAN, Language.ENGLISH)) as reader:
+                self.assertIs(reader_first, reader)
+            self.reader_class.assert_called_once()
+
+        with self.subTest("Separate reader for other languages"):
+            with self.instance.acquire(("en", )) as reader:
+                self.assertIsNot(reader_first, reader)
+            self.assertEqual([("en", "ru"), ("en", )], self.instance.languages)
+
+        with self.subTest("Reader load error"), self.assertRaises(self.exception) as e:
+            self.reader_class.side_effect = Exception("test")
+            with self.instance.acquire(("de", )):
+                pass
+        self.assertEqual(
+            self.messages.READER_LOAD_ERROR.format(languages=("de", ), msg="test"), e.exception.message
+        )
+
+    def test_get_key(self) -> None:
+        with self.subTest("Sorted languages"):
+            self.assertEqual(("en", "ru"), self.instance.get_key((Language.RUSSIAN, Language.ENGLISH)))
+            self.assertEqual(("en", "ru"), self.instance.get_key(["en", "ru"]))
+
+        with self.subTest("Duplicate languages"):
+            self.assertEqual(("en", ), self.instance.get_key(("en", Language.ENGLISH)))
+
+    def test_acquire_concurrently(self) -> None:
+        def acquire(_) -> int:
+            with self.instance.acquire(("en", )) as reader:
+                return id(reader)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertEqual(1, len(set(executor.map(acquire, range(32)))))
+        self.reader_class.assert_called_once()
+
+    def test_acquire_while_loading(self) -> None:
+        self.instance.preload([("en", )])
+        loading, loaded = Event(), Event()
+
+        def load_reader(languages: list[str]) -> Mock:
+            loading.set()
+            loaded.wait(timeout=5)
+            return Mock(languages=languages)
+
+        self.reader_class.side_effect = load_reader
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.instance.preload, [("ru", )])
+            self.assertTrue(loading.wait(timeout=5))
+
+            with self.subTest("Loaded reader is available during a load"):
+                with self.instance.acquire(("en", )) as reader:
+                    self.assertEqual(["en"], reader.languages)
+                self.assertFalse(future.done())
+                self.assertEqual([("en", )], self.instance.languages)
+
+            loaded.set()
+            future.result(timeout=5)
+        self.assertEqual([("en", ), ("ru", )], self.instance.languages)
+
+    def test_preload(self) -> None:
+        self.instance.preload([("en", "ru"), ("en", )])
+        self.assertEqual([("en", "ru"), ("en", )], self.instance.languages)
+
+    def test_evict_idle(self) -> None:
+        self.instance.preload([("en", )])
+
+        with self.subTest("Recently used reader is kept"):
+            self.assertEqual([], self.instance.evict_idle())
+
+        with self.subTest("Reader in use is kept"), patch("app.base.common.ocr.monotonic", return_value=10 ** 9):
+            with self.instance.acquire(("en", )):
+                self.assertEqual([], self.instance.evict_idle())
+
+        with self.subTest("Shared reader is kept"), patch("app.base.common.ocr.monotonic", return_value=10 ** 9):
+            with self.instance.acquire(("en", ), exclusive=False):
+                self.assertEqual([], self.instance.evict_idle())
+
+        with self.subTest("Idle reader is evicted"), patch("app.base.common.ocr.monotonic", return_value=10 ** 10):
+            self.assertEqual([("en", )], self.instance.evict_idle())
+            self.assertEqual([], self.instance.languages)
@@ -1,10 +1,28 @@
-from unittest import TestCase
-from unittest.mock import Mock, patch
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock, patch
 
+import cv2 as cv
+import numpy as np
 from playwright.sync_api import sync_playwright
 
 from app.base.common.general import remove_file_or_folder, is_file_exists, merge_path_elements, get_current_path
-from app.base.common.web_driver import PlayWrightAction, PlaywrightSettings
+from app.base.common.web_driver import (
+    AssetCache,
+    AsyncBrowserPool,
+    AsyncPlayWrightAction,
+    BrowserPool,
+    PageRenderer,
+    PlayWrightAction,
+    PlaywrightSettings,
+    RequestRouter,
+    RouteSettings,
+    RouteStats,
+)
+from app.base.constants import RouteAction
 from app.base.types import Browser, PlayWrightPage, PageLocator, ScreenSavePath, Path
 
 
@@ -116,3 +134,553 @@ class TestPlaywright(TestCase):
             _ = action.get_screenshot_page(page, url, screen_save_path)
 
         self.assertEqual(self.messages.PAGE_TYPE_ERROR, e.exception.message)
+
+    def test_get_screenshot_image(self):
+        url: PageLocator = "https://www.google.com/"
+
+        with (
+            self.subTest("Got screenshot image"),
+            sync_playwright() as pwa,
+        ):
+            action = PlayWrightAction(pwa, PlaywrightSettings())
+            artifact = action.get_screenshot_image(action.new_page, url, name="google")
+            self.assertEqual("google", artifact.name)
+            self.assertIsNone(artifact.path)
+            self.assertEqual(3, artifact.matrix.ndim)
+
+        with (
+            self.subTest("Incorrect page type"),
+            sync_playwright() as pwa,
+            self.assertRaises(self.exception) as e
+        ):
+            action = PlayWrightAction(pwa, PlaywrightSettings())
+            _ = action.get_screenshot_image(None, url)
+        self.assertEqual(self.messages.PAGE_TYPE_ERROR, e.exception.message)
+
+
+class TestBrowserPool(TestCase):
+
+    def setUp(self) -> None:
+        self.exception = BrowserPool.exception
+        self.messages = BrowserPool.messages
+        self.driver = Mock()
+        self.driver.chromium.launch.side_effect = lambda **kwargs: Mock(**{
+            "is_connected.return_value": True, "new_context.side_effect": lambda **options: Mock()
+        })
+
+    def test__init__(self):
+        for size, max_uses in ((0, 1), (1, 0)):
+            with self.subTest("Invalid params", size=size, max_uses=max_uses), self.assertRaises(self.exception) as e:
+                BrowserPool(self.driver, size=size, max_uses=max_uses)
+            self.assertEqual(self.messages.BROWSER_POOL_PARAMS_ERROR, e.exception.message)
+
+    def test_new_context(self):
+        with self.subTest("Browsers are launched on demand up to the size"):
+            pool = BrowserPool(self.driver, size=2)
+            contexts = [pool.new_context() for _ in range(3)]
+            self.assertEqual(2, self.driver.chromium.launch.call_count)
+            self.assertEqual([2, 1], [pooled.active for pooled in pool.browsers])
+
+        with self.subTest("Released browser is reused"):
+            pool.release(contexts[2])
+            pool.release(contexts[1])
+            pool.new_context()
+            self.assertEqual(2, self.driver.chromium.launch.call_count)
+            contexts[1].close.assert_called_once()
+
+        with self.subTest("Closed pool"), self.assertRaises(self.exception) as e:
+            pool.close()
+            pool.new_context()
+        self.assertEqual(self.messages.BROWSER_POOL_CLOSED_ERROR, e.exception.message)
+        self.assertEqual([], pool.browsers)
+
+    def test_recycle(self):
+        pool = BrowserPool(self.driver, size=1, max_uses=2)
+        first = pool.new_context()
+        second = pool.new_context()
+        browser = pool.browsers[0].browser
+
+        with self.subTest("Exhausted busy browser keeps serving"):
+            third = pool.new_context()
+            self.assertEqual(1, self.driver.chromium.launch.call_count)
+
+        with self.subTest("Exhausted browser is closed when idle"):
+            for context in (first, second, third):
+                pool.release(context)
+            browser.close.assert_called_once()
+            self.assertEqual([], pool.browsers)
+            pool.new_context()
+            self.assertEqual(2, self.driver.chromium.launch.call_count)
+
+    def test_crash_replacement(self):
+        pool = BrowserPool(self.driver, size=1)
+        pool.release(pool.new_context())
+        crashed = pool.browsers[0].browser
+
+        with self.subTest("Disconnected browser is replaced"):
+            crashed.is_connected.return_value = False
+            pool.new_context()
+            crashed.close.assert_called_once()
+            self.assertIsNot(crashed, pool.browsers[0].browser)
+
+        with self.subTest("Browser crashed while creating a context"):
+            crashed = pool.browsers[0].browser
+            crashed.new_context.side_effect = Exception("Target closed")
+            crashed.is_connected.side_effect = [True, False]
+            pool.new_context()
+            self.assertEqual(3, self.driver.chromium.launch.call_count)
+            self.assertIsNot(crashed, pool.browsers[0].browser)
+
+        with self.subTest("Context error of a healthy browser"), self.assertRaises(self.exception) as e:
+            pool.browsers[0].browser.new_context.side_effect = Exception("Invalid option")
+            pool.new_context(viewport=0)
+        self.assertIn(self.messages.BROWSER_CONTEXT_ERROR[:-7], e.exception.message)
+
+    def test_page(self):
+        pool = BrowserPool(self.driver)
+        with pool.page() as page:
+            context = next(iter(pool._leases))
+            self.assertEqual(context.new_page.return_value, page)
+        context.close.assert_called_once()
+        self.assertEqual(0, pool.browsers[0].active)
+
+        with self.subTest("Page of PlayWrightAction from the pool"):
+            action = PlayWrightAction(self.driver, pool=pool)
+            page = action.new_page
+            self.assertEqual(1, pool.browsers[0].active)
+            handler = page.on.call_args.args[1]
+            handler(page)
+            self.assertEqual(0, pool.browsers[0].active)
+
+        with self.subTest("Page is closed after screenshot"):
+            page = Mock(spec=PlayWrightPage, **{"screenshot.return_value": cv.imencode(
+                ".png", np.zeros((10, 10, 3), dtype="uint8")
+            )[1].tobytes()})
+            action.get_screenshot_image(page, "test")
+            page.close.assert_called_once()
+
+        with self.subTest("Page is closed after error"), self.assertRaises(self.exception) as e:
+            page = Mock(spec=PlayWrightPage, **{"screenshot.side_effect": Exception("test")})
+            action.get_screenshot_page(page, "test", "test.png")
+        self.assertEqual(self.messages.GET_SCREENSHOT_PAGE_ERROR.format(msg="test"), e.exception.message)
+        page.close.assert_called_once()
+
+
+class TestAsyncBrowserPool(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.exception = AsyncBrowserPool.exception
+        self.messages = AsyncBrowserPool.messages
+        self.driver = Mock()
+        self.driver.chromium.launch = AsyncMock(side_effect=lambda **kwargs: Mock(**{
+            "is_connected.return_value": True,
+            "new_context": AsyncMock(side_effect=lambda **options: Mock(close=AsyncMock())),
+            "close": AsyncMock(),
+        }))
+
+    async def test_new_context(self):
+        with self.subTest("Concurrent contexts do not launch more browsers than the size"):
+            pool = AsyncBrowserPool(self.driver, size=2)
+            contexts = await asyncio.gather(*(pool.new_context() for _ in range(4)))
+            self.assertEqual(2, self.driver.chromium.launch.await_count)
+            self.assertEqual([2, 2], [pooled.active for pooled in pool.browsers])
+
+        with self.subTest("Released browser is reused"):
+            for context in contexts:
+                await pool.release(context)
+                context.close.assert_awaited_once()
+            await pool.new_context()
+            self.assertEqual(2, self.driver.chromium.launch.await_count)
+
+        with self.subTest("Closed pool"), self.assertRaises(self.exception) as e:
+            await pool.close()
+            await pool.new_context()
+        self.assertEqual(self.messages.BROWSER_POOL_CLOSED_ERROR, e.exception.message)
+        self.assertEqual([], pool.browsers)
+
+    async def test_recycle(self):
+        pool = AsyncBrowserPool(self.driver, size=1, max_uses=2)
+        contexts = [await pool.new_context() for _ in range(3)]
+        browser = pool.browsers[0].browser
+        self.assertEqual(1, self.driver.chromium.launch.await_count)
+
+        for context in contexts:
+            await pool.release(context)
+        browser.close.assert_awaited_once()
+        self.assertEqual([], pool.browsers)
+
+    async def test_crash_replacement(self):
+        pool = AsyncBrowserPool(self.driver, size=1)
+        await pool.release(await pool.new_context())
+        crashed = pool.browsers[0].browser
+
+        with self.subTest("Disconnected browser is replaced"):
+            crashed.is_connected.return_value = False
+            await pool.new_context()
+            crashed.close.assert_awaited_once()
+            self.assertIsNot(crashed, pool.browsers[0].browser)
+
+        with self.subTest("Browser crashed while creating a context"):
+            crashed = pool.browsers[0].browser
+            crashed.new_context.side_effect = Exception("Target closed")
+            crashed.is_connected.side_effect = [True, False]
+            await pool.new_context()
+            self.assertEqual(3, self.driver.chromium.launch.await_count)
+            self.assertIsNot(crashed, pool.browsers[0].browser)
+
+
+class TestAsyncPlayWrightAction(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.exception = AsyncPlayWrightAction.exception
+        self.messages = AsyncPlayWrightAction.messages
+        # url "<delay>:<height>" loads for delay seconds and renders an image of the given height
+        self.opened: int = 0
+        self.max_opened: int = 0
+        self.contexts: list[Mock] = []
+        self.browser = Mock(**{"new_context": AsyncMock(side_effect=self.new_context), "close": AsyncMock()})
+        self.driver = Mock()
+        self.driver.chromium.launch = AsyncMock(return_value=self.browser)
+
+    async def new_context(self) -> Mock:
+        page = Mock()
+
+        async def goto(url: PageLocator) -> None:
+            await self.goto(page, url)
+
+        page.goto = AsyncMock(side_effect=goto)
+        page.screenshot = AsyncMock(side_effect=lambda full_page: cv.imencode(
+            ".png", np.zeros((page.height, 10, 3), dtype="uint8")
+        )[1].tobytes())
+        context = Mock(**{"new_page": AsyncMock(return_value=page), "close": AsyncMock()})
+        self.contexts.append(context)
+        return context
+
+    async def goto(self, page: Mock, url: PageLocator) -> None:
+        delay, page.height = url.split(":")
+        page.height = int(page.height)
+        self.opened += 1
+        self.max_opened = max(self.max_opened, self.opened)
+        try:
+            await asyncio.sleep(float(delay))
+        finally:
+            self.opened -= 1
+
+    def test__init__(self):
+        for concurrency, timeout in ((0, 1), (1, 0)):
+            with self.subTest("Invalid params", concurrency=concurrency, timeout=timeout), self.assertRaises(
+                self.exception
+            ) as e:
+                AsyncPlayWrightAction(self.driver, concurrency=concurrency, timeout=timeout)
+            self.assertEqual(self.messages.ASYNC_RENDER_PARAMS_ERROR, e.exception.message)
+
+    async def test_get_screenshot_images(self):
+        urls = ["0.05:30", "0.01:20", "0:10", "0.02:40"]
+        async with AsyncPlayWrightAction(self.driver, concurrency=2, timeout=1) as action:
+            with self.subTest("Results in input order"):
+                images = await action.get_screenshot_images(urls)
+                self.assertEqual([f"screenshot_{number}" for number in range(4)], [image.name for image in images])
+                self.assertEqual([30, 20, 10, 40], [image.matrix.shape[0] for image in images])
+
+            with self.subTest("Concurrency limit"):
+                self.assertEqual(2, self.max_opened)
+                for context in self.contexts:
+                    context.close.assert_awaited_once()
+
+            with self.subTest("Names count"), self.assertRaises(self.exception) as e:
+                await action.get_screenshot_images(urls, names=["first"])
+            self.assertEqual(self.messages.PAGE_NAMES_COUNT_ERROR, e.exception.message)
+        self.browser.close.assert_awaited_once()
+
+    async def test_get_screenshot_image(self):
+        async with AsyncPlayWrightAction(self.driver, timeout=0.05) as action:
+            with self.subTest("Page timeout"), self.assertRaises(self.exception) as e:
+                await action.get_screenshot_images(["0:10", "1:10"])
+            self.assertEqual(self.messages.PAGE_TIMEOUT_ERROR.format(url="1:10", timeout=0.05), e.exception.message)
+            self.assertEqual(0, self.opened)
+            self.contexts[1].close.assert_awaited_once()
+
+            with self.subTest("Incorrect locator type"), self.assertRaises(self.exception) as e:
+                await action.get_screenshot_image(None)
+            self.assertEqual(self.messages.PAGE_TYPE_LOCATOR_ERROR, e.exception.message)
+
+        with self.subTest("Browser not initialized"), self.assertRaises(self.exception) as e:
+            await AsyncPlayWrightAction(self.driver).get_screenshot_image("0:10")
+        self.assertEqual(self.messages.INITIALIZE_BROWSER_ERROR, e.exception.message)
+
+    async def test_route_stats(self):
+        stats = RouteStats(blocked=1, served=2)
+        router = Mock(attach_async=AsyncMock(return_value=stats))
+        async with AsyncPlayWrightAction(self.driver, router=router) as action:
+            with patch.object(action, "_logger") as logger:
+                await action.get_screenshot_images(["0:10"], ["first"])
+        self.assertIs(stats, action.route_stats["first"])
+        logger.info.assert_called_once_with(self.messages.PAGE_ROUTE_STATS.format(
+            name="first", blocked=1, served=2, fetched=0, continued=0
+        ))
+
+    async def test_pool(self):
+        self.browser.is_connected = Mock(return_value=True)
+        async with AsyncBrowserPool(self.driver, size=1) as pool:
+            async with AsyncPlayWrightAction(self.driver, pool=pool) as action:
+                images = await action.get_screenshot_images(["0:10", "0:20"])
+                self.assertEqual([10, 20], [image.matrix.shape[0] for image in images])
+            self.driver.chromium.launch.assert_awaited_once()
+            self.browser.close.assert_not_awaited()
+            self.assertEqual(0, pool.browsers[0].active)
+        self.browser.close.assert_awaited_once()
+
+
+class TestPageRenderer(TestCase):
+
+    def setUp(self) -> None:
+        self.exception = PageRenderer.exception
+        self.messages = PageRenderer.messages
+        screenshot = cv.imencode(".png", np.zeros((10, 10, 3), dtype="uint8"))[1].tobytes()
+        self.page = Mock(**{"goto": AsyncMock(), "screenshot": AsyncMock(return_value=screenshot)})
+        self.browser = Mock(**{
+            "new_context": AsyncMock(side_effect=lambda: Mock(**{
+                "new_page": AsyncMock(return_value=self.page), "close": AsyncMock()
+            })),
+            "close": AsyncMock(),
+            "is_connected.return_value": True,
+        })
+        self.driver = Mock(**{"stop": AsyncMock()})
+        self.driver.chromium.launch = AsyncMock(return_value=self.browser)
+        self.patcher = patch(
+            "app.base.common.web_driver.async_playwright",
+            Mock(return_value=Mock(start=AsyncMock(return_value=self.driver))),
+        )
+        self.async_playwright = self.patcher.start()
+        self.instance = PageRenderer(size=1)
+
+    def tearDown(self) -> None:
+        self.instance.close()
+        self.patcher.stop()
+
+    def test__init__(self):
+        for size, max_uses in ((0, 1), (1, 0)):
+            with self.subTest("Invalid params", size=size, max_uses=max_uses), self.assertRaises(self.exception) as e:
+                PageRenderer(size=size, max_uses=max_uses)
+            self.assertEqual(self.messages.BROWSER_POOL_PARAMS_ERROR, e.exception.message)
+
+        with self.subTest("Invalid concurrency"), self.assertRaises(self.exception) as e:
+            PageRenderer(concurrency=0)
+        self.assertEqual(self.messages.ASYNC_RENDER_PARAMS_ERROR, e.exception.message)
+
+    def test_render(self):
+        with self.subTest("Driver and browser pool are started once"):
+            for _ in range(3):
+                images = self.instance.render(["first", "second"], ["first", "second"])
+                self.assertEqual(["first", "second"], [image.name for image in images])
+            self.async_playwright.assert_called_once()
+            self.driver.chromium.launch.assert_awaited_once()
+            self.assertEqual(6, self.browser.new_context.await_count)
+            self.assertEqual(0, self.instance.pool.browsers[0].active)
+            self.browser.close.assert_not_awaited()
+
+        with self.subTest("Disconnected browser is relaunched"):
+            self.browser.is_connected.return_value = False
+            self.instance.render(["first"])
+            self.assertEqual(2, self.driver.chromium.launch.await_count)
+            self.browser.close.assert_awaited()
+
+        with self.subTest("Page error"), self.assertRaises(self.exception) as e:
+            self.instance.render(["first"], ["first", "second"])
+        self.assertEqual(self.messages.PAGE_NAMES_COUNT_ERROR, e.exception.message)
+
+    def test_render_concurrently(self):
+        opened, max_opened = [0], [0]
+
+        async def goto(_) -> None:
+            opened[0] += 1
+            max_opened[0] = max(max_opened[0], opened[0])
+            await asyncio.sleep(0.02)
+            opened[0] -= 1
+
+        self.page.goto.side_effect = goto
+        instance = PageRenderer(size=1, concurrency=2)
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = list(executor.map(lambda _: instance.render(["first", "second"]), range(3)))
+        finally:
+            instance.close()
+        self.assertEqual([2, 2, 2], [len(images) for images in results])
+        self.assertEqual(2, max_opened[0])
+
+    def test_close(self):
+        self.instance.render(["first"])
+        self.instance.close()
+        self.assertFalse(self.instance.is_running)
+        self.browser.close.assert_awaited_once()
+        self.driver.stop.assert_awaited_once()
+
+        with self.subTest("Restart after close"):
+            self.instance.render(["first"])
+            self.assertEqual(2, self.async_playwright.call_count)
+
+    def test_start_error(self):
+        self.async_playwright.return_value.start.side_effect = Exception("test")
+        with self.assertRaises(self.exception) as e:
+            self.instance.render(["first"])
+        self.assertEqual(self.messages.BROWSER_LAUNCH_ERROR.format(msg="test"), e.exception.message)
+        self.assertFalse(self.instance.is_running)
+
+
+class TestRequestRouter(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = AssetCache(self.cache_dir.name, max_size=1024 * 1024)
+        self.instance = RequestRouter(cache=self.cache)
+        self.font_url = "https://fonts.gstatic.com/s/roboto/v30/roboto.woff2"
+        self.cache.set(self.cache.get_asset_key(self.font_url), {"content_type": "font/woff2", "body": b"font\ndata"})
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
+    @staticmethod
+    def get_route(url: str, resource_type: str, status: int = 200) -> Mock:
+        response = Mock(status=status, headers={"content-type": "text/css"}, **{"body.return_value": b"body {}"})
+        return Mock(request=Mock(url=url, resource_type=resource_type), **{"fetch.return_value": response})
+
+    def test_get_action(self):
+        cases = [
+            ("Local file", "file:///tmp/index.html", "document", RouteAction.CONTINUE),
+            ("Inline data", "data:image/png;base64,AAAA", "image", RouteAction.CONTINUE),
+            ("Blocked resource type", "https://example.com/video.mp4", "media", RouteAction.BLOCK),
+            ("Blocked subdomain", "https://www.google-analytics.com/analytics.js", "script", RouteAction.BLOCK),
+            ("Similar host is not blocked", "https://notdoubleclick.net/app.js", "script", RouteAction.CONTINUE),
+            ("Cached asset", self.font_url, "font", RouteAction.SERVE),
+            ("Missing asset", "https://cdn.jsdelivr.net/npm/bootstrap.min.js", "script", RouteAction.FETCH),
+            ("Font of other host is not fetched", "https://example.com/font.woff2", "font", RouteAction.CONTINUE),
+            ("Other request", "https://example.com/logo.png", "image", RouteAction.CONTINUE),
+        ]
+        for name, url, resource_type, action in cases:
+            with self.subTest(name):
+                self.assertEqual(action, self.instance.get_action(url, resource_type))
+
+        offline = RequestRouter(RouteSettings(allow_network=False), cache=self.cache)
+        with self.subTest("Offline missing asset"):
+            self.assertEqual(RouteAction.BLOCK, offline.get_action("https://unpkg.com/style.css", "stylesheet"))
+
+        with self.subTest("Offline cached asset"):
+            self.assertEqual(RouteAction.SERVE, offline.get_action(self.font_url, "font"))
+
+        with self.subTest("Offline other request"):
+            self.assertEqual(RouteAction.BLOCK, offline.get_action("https://example.com/logo.png", "image"))
+            self.assertEqual(RouteAction.BLOCK, offline.get_action("https://example.com/font.woff2", "font"))
+
+        with self.subTest("Without cache"):
+            self.assertEqual(RouteAction.CONTINUE, RequestRouter(cache=None).get_action(self.font_url, "font"))
+
+    def test_handle(self):
+        stats = RouteStats()
+
+        with self.subTest("Serve from cache"):
+            route = self.get_route(self.font_url, "font")
+            self.instance.handle(route, stats)
+            route.fulfill.assert_called_once_with(
+                status=200, body=b"font\ndata", content_type="font/woff2",
+                headers={"access-control-allow-origin": "*"}
+            )
+
+        with self.subTest("Fetch and store"):
+            url = "https://fonts.googleapis.com/css?family=Roboto"
+            route = self.get_route(url, "stylesheet")
+            self.instance.handle(route, stats)
+            route.fulfill.assert_called_once_with(response=route.fetch.return_value, body=b"body {}")
+            self.assertEqual(RouteAction.SERVE, self.instance.get_action(url, "stylesheet"))
+
+        with self.subTest("Failed response is not stored"):
+            url = "https://unpkg.com/missing.css"
+            self.instance.handle(self.get_route(url, "stylesheet", status=404), stats)
+            self.assertEqual(RouteAction.FETCH, self.instance.get_action(url, "stylesheet"))
+
+        with self.subTest("Block and continue"):
+            route = self.get_route("https://mc.yandex.ru/metrika/tag.js", "script")
+            self.instance.handle(route, stats)
+            route.abort.assert_called_once_with("blockedbyclient")
+            route = self.get_route("https://example.com/logo.png", "image")
+            self.instance.handle(route, stats)
+            route.continue_.assert_called_once()
+
+        with self.subTest("Stylesheet of other host is not stored"):
+            url = "https://example.com/style.css"
+            route = self.get_route(url, "stylesheet")
+            self.instance.handle(route, stats)
+            route.continue_.assert_called_once()
+            route.fetch.assert_not_called()
+            self.assertFalse(self.cache.has(url))
+
+        with self.subTest("Network error"):
+            route = self.get_route("https://cdnjs.cloudflare.com/font.woff", "font")
+            route.fetch.side_effect = Exception("net::ERR_NAME_NOT_RESOLVED")
+            self.instance.handle(route, stats)
+            route.abort.assert_called_once()
+
+        self.assertEqual(RouteStats(blocked=2, served=1, fetched=2, continued=2), stats)
+
+    def test_attach(self):
+        with self.subTest("Sync page"):
+            page = Mock()
+            stats = self.instance.attach(page)
+            pattern, handler = page.route.call_args.args
+            self.assertEqual("**/*", pattern)
+            handler(self.get_route(self.font_url, "font"))
+            self.assertEqual(RouteStats(served=1), stats)
+
+    async def test_attach_async(self):
+        context = Mock(route=AsyncMock())
+        stats = await self.instance.attach_async(context)
+        _, handler = context.route.call_args.args
+
+        route = self.get_route("https://fonts.googleapis.com/css?family=Inter", "stylesheet")
+        route.fetch = AsyncMock(return_value=Mock(
+            status=200, headers={"content-type": "text/css"}, body=AsyncMock(return_value=b"body {}")
+        ))
+        route.fulfill = AsyncMock()
+        with patch("app.base.common.web_driver.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await handler(route)
+        await handler(Mock(request=Mock(url="https://hotjar.com/c.js", resource_type="script"), abort=AsyncMock()))
+        self.assertEqual(RouteStats(blocked=1, fetched=1), stats)
+        self.assertEqual(RouteAction.SERVE, self.instance.get_action(route.request.url, "stylesheet"))
+
+        with self.subTest("Disk cache is used from a thread"):
+            self.assertEqual(
+                [self.instance.get_action, self.instance.set_cached_asset],
+                [call.args[0] for call in to_thread.call_args_list]
+            )
+
+
+class TestAssetCache(TestCase):
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.seed_dir = tempfile.TemporaryDirectory()
+        self.instance = AssetCache(self.cache_dir.name, max_size=1024 * 1024)
+        for path, body in (("fonts.gstatic.com/s/roboto.woff2", b"font"), ("unpkg.com/lib/style.css", b"body {}")):
+            path = os.path.join(self.seed_dir.name, *path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(body)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        self.seed_dir.cleanup()
+
+    def test_seed(self):
+        with self.subTest("Assets are stored by their urls"):
+            self.assertEqual(
+                ["https://fonts.gstatic.com/s/roboto.woff2", "https://unpkg.com/lib/style.css"],
+                sorted(self.instance.seed(self.seed_dir.name))
+            )
+            self.assertEqual(
+                {"content_type": "text/css", "body": b"body {}"},
+                self.instance.get(self.instance.get_asset_key("https://unpkg.com/lib/style.css"))
+            )
+            offline = RequestRouter(RouteSettings(allow_network=False), cache=self.instance)
+            self.assertEqual(RouteAction.SERVE, offline.get_action("https://fonts.gstatic.com/s/roboto.woff2", "font"))
+
+        with self.subTest("Cached assets are not overwritten"):
+            self.assertEqual([], self.instance.seed(self.seed_dir.name))
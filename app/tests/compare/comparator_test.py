@@ -1,11 +1,17 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+import cv2 as cv
+import numpy as np
+
 from PIL import ImagePath
 
-from app.base.common.general import merge_path_elements, get_current_path
+from app.base.common.general import merge_path_elements, get_current_path, is_file_exists, remove_file_or_folder
+from app.base.common.lazy import skimage_metrics
+from app.base.constants import NeuralNetwork
 from app.base.types import Path, ImgMatrix
-from app.compare.comparator import Comparator, IsSimilar
+from app.compare.comparator import Comparator, BatchComparator, ComparisonMethod, IsSimilar
+from app.compare.neural_network import BACKBONES
 
 
 class TestComparator(TestCase):
@@ -134,3 +140,227 @@ class TestComparator(TestCase):
             ).compare_by_neural_network_vgg16()
             self.assertEqual(IsSimilar.NO, results["is_similar"])
             self.assertTrue(results["percent"] < 85.0)
+
+    def test_compare_by_neural_network(self):
+        img_first_path: ImagePath = self.img_with_text_path
+        img_second_path: ImagePath = self.img_with_text_hided_path
+
+        for backbone in NeuralNetwork:
+            with self.subTest("Same images", backbone=backbone):
+                results = Comparator(
+                    img_first=img_first_path, img_second=img_first_path
+                ).compare_by_neural_network(backbone=backbone)
+                self.assertEqual(IsSimilar.YES, results["is_similar"])
+                self.assertEqual(100.0, results["percent"])
+
+        with self.subTest("Unknown backbone"), self.assertRaises(Comparator.exception) as e:
+            _ = Comparator(img_first=img_first_path, img_second=img_second_path).compare_by_neural_network(
+                backbone="unknown"
+            )
+        self.assertEqual(
+            Comparator.messages.UNKNOWN_BACKBONE_ERROR.format(backbone="unknown"), e.exception.message
+        )
+
+    def test_compare_by_structural_similarity_index_near_threshold(self):
+        img_first_path: ImagePath = self.img_with_text_path
+
+        for img_second_path in (self.img_with_text_hided_path, self.img_page_path):
+            comparator = Comparator(img_first=img_first_path, img_second=img_second_path)
+            score = skimage_metrics.structural_similarity(*comparator.prepare_images())
+            for shift in (-0.03, -0.01, 0.01, 0.03):
+                similarity = score + shift
+                with self.subTest("Full resolution verdict", img=img_second_path, similarity=similarity):
+                    results = comparator.compare_by_structural_similarity_index(similarity)
+                    self.assertEqual(IsSimilar.YES if shift < 0 else IsSimilar.NO, results["is_similar"])
+                    self.assertAlmostEqual(round(score, 2) * 100, results["percent"], places=6)
+
+    def test_compare_by_structural_similarity_index_pyramid(self):
+        comparator = Comparator(img_first=self.img_with_text_path, img_second=self.img_page_path)
+        results_full = comparator.compare_by_structural_similarity_index()
+
+        with self.subTest("Pyramid is off by default"), patch.object(
+                comparator.image_cv, "get_image_pyramid", wraps=comparator.image_cv.get_image_pyramid
+        ) as pyramid:
+            self.assertEqual(results_full, comparator.compare_by_structural_similarity_index())
+            self.assertTrue(all(call.args[1] == 0 for call in pyramid.call_args_list))
+
+        with self.subTest("Borderline pair is refined to full resolution"):
+            results_pyramid = comparator.compare_by_structural_similarity_index(pyramid_levels=3, pyramid_margin=1.0)
+            self.assertEqual(results_full, results_pyramid)
+
+        with self.subTest("Clear pair is decided on the coarse level"), patch.object(
+                skimage_metrics, "structural_similarity", wraps=skimage_metrics.structural_similarity
+        ) as structural_similarity:
+            comparator.compare_by_structural_similarity_index(similarity=0.0, pyramid_levels=3, pyramid_margin=0.0)
+            structural_similarity.assert_called_once()
+            img_first, _ = comparator.prepare_images()
+            self.assertLess(structural_similarity.call_args.args[0].size, img_first.size)
+
+    def test_compare_by_neural_network_rgb(self):
+        comparator = Comparator(img_first=self.img_with_text_path, img_second=self.img_page_path)
+        with patch(
+                "app.compare.comparator.FeatureExtractor.get_features", return_value=np.ones((2, 4))
+        ) as get_features:
+            comparator.compare_by_neural_network(backbone=NeuralNetwork.MOBILENET_V2)
+
+        img_first, _ = comparator.prepare_images(
+            img_shape=BACKBONES[NeuralNetwork.MOBILENET_V2].input_size, to_grayscale=False
+        )
+        np.testing.assert_array_equal(cv.cvtColor(img_first, cv.COLOR_BGR2RGB), get_features.call_args.args[0][0])
+
+    def test_compare_by_perceptual_hash(self):
+        img_first_path: ImagePath = self.img_with_text_path
+        img_third_path: ImagePath = self.img_page_path
+
+        with self.subTest("Same images"):
+            comparator = Comparator(img_first=img_first_path, img_second=img_first_path)
+            results = comparator.compare_by_perceptual_hash()
+            self.assertEqual(IsSimilar.YES, results["is_similar"])
+            self.assertEqual(comparator.hash_first, comparator.hash_second)
+
+        with self.subTest("Very different"):
+            results = Comparator(img_first=img_first_path, img_second=img_third_path).compare_by_perceptual_hash(0)
+            self.assertEqual(IsSimilar.NO, results["is_similar"])
+
+        with self.subTest("No verdict"):
+            self.assertIsNone(
+                Comparator(img_first=img_first_path, img_second=img_third_path).compare_by_perceptual_hash(64)
+            )
+
+        with self.subTest("Prefilter skips SSIM"), patch.object(
+            Comparator, "_compare_by_structural_similarity_index"
+        ) as mock:
+            results = Comparator(img_first=img_first_path, img_second=img_first_path).compare_all(
+                {ComparisonMethod.SSIM: 0.55}, max_hash_distance=0
+            )
+            mock.assert_not_called()
+            self.assertEqual(IsSimilar.YES, results[ComparisonMethod.SSIM]["is_similar"])
+
+    def test_get_tile_bounds(self):
+        with self.subTest("Even split"):
+            self.assertEqual([(0, 512), (512, 1024)], Comparator.get_tile_bounds(1024, 512))
+
+        with self.subTest("Small remainder joined to the last tile"):
+            self.assertEqual([(0, 512), (512, 1027)], Comparator.get_tile_bounds(1027, 512))
+
+        with self.subTest("Length less than tile"):
+            self.assertEqual([(0, 100)], Comparator.get_tile_bounds(100, 512))
+
+    def test_compare_by_tiled_structural_similarity_index(self):
+        img_first_path: ImagePath = self.img_with_text_path
+        img_second_path: ImagePath = self.img_with_text_hided_path
+        img_third_path: ImagePath = self.img_page_path
+
+        with self.subTest("Same images"):
+            results = Comparator(
+                img_first=img_first_path, img_second=img_first_path
+            ).compare_by_tiled_structural_similarity_index(tile_size=256)
+            self.assertEqual(IsSimilar.YES, results["is_similar"])
+            self.assertEqual(100.0, results["percent"])
+            self.assertEqual([[1.0] * 3] * 3, results["tiles"])
+
+        with self.subTest("Very different"):
+            heatmap_path: Path = merge_path_elements([self.dir_data_path, 'heatmap_test.png'])
+            results = Comparator(
+                img_first=img_first_path, img_second=img_third_path
+            ).compare_by_tiled_structural_similarity_index(heatmap_path=heatmap_path)
+            self.assertEqual(IsSimilar.NO, results["is_similar"])
+            self.assertTrue(is_file_exists(heatmap_path))
+            remove_file_or_folder(heatmap_path)
+
+        with self.subTest("Tile grid"):
+            results = Comparator(
+                img_first=img_first_path, img_second=img_second_path
+            ).compare_by_tiled_structural_similarity_index(tile_size=320)
+            self.assertEqual((2, 2), (len(results["tiles"]), len(results["tiles"][0])))
+            self.assertTrue(all(score < 1.0 for row in results["tiles"] for score in row))
+
+    def test_compare_all(self):
+        img_first_path: ImagePath = self.img_with_text_path
+        img_second_path: ImagePath = self.img_with_text_hided_path
+        comparator = Comparator(img_first=img_first_path, img_second=img_second_path)
+
+        with self.subTest("Same results as separate comparisons"), patch.object(
+            comparator.image_cv, "read_image", wraps=comparator.image_cv.read_image
+        ) as mock:
+            results = comparator.compare_all({ComparisonMethod.MSE: 0.85, ComparisonMethod.SSIM: 0.55})
+            self.assertEqual(2, mock.call_count)
+            self.assertEqual(comparator.compare_by_mean_squared_error(0.85), results[ComparisonMethod.MSE])
+            self.assertEqual(comparator.compare_by_structural_similarity_index(0.55), results[ComparisonMethod.SSIM])
+
+        with self.subTest("Only requested methods"):
+            results = comparator.compare_all({ComparisonMethod.MSE: 0.85})
+            self.assertEqual([ComparisonMethod.MSE], list(results))
+
+    def test_compare_streaming(self):
+        similarities = {ComparisonMethod.MSE: 0.85, ComparisonMethod.SSIM: 0.55}
+        comparator = Comparator(img_first=self.img_with_text_path, img_second=self.img_with_text_hided_path)
+        expected = comparator.compare_all(similarities)
+
+        for band_height in (1024, 100, 7, 1):
+            with self.subTest("Same results as full comparison", band_height=band_height):
+                results = comparator.compare_streaming(similarities, band_height=band_height)
+                self.assertEqual(expected, results)
+
+        with self.subTest("Different sizes"):
+            comparator = Comparator(img_first=self.img_with_text_path, img_second=self.img_page_path)
+            self.assertEqual(comparator.compare_all(similarities), comparator.compare_streaming(similarities))
+
+        with self.subTest("Unsupported method"), self.assertRaises(self.exception) as e:
+            comparator.compare_streaming({ComparisonMethod.VGG16: 0.85})
+        self.assertEqual(self.messages.STREAMING_METHOD_ERROR.format(methods=ComparisonMethod.VGG16), str(e.exception))
+
+
+class TestBatchComparator(TestCase):
+
+    def setUp(self) -> None:
+        self.dir_data_path: Path = merge_path_elements([get_current_path(), "app", "tests", "data"])
+
+        self.img_with_text_path: Path = merge_path_elements([self.dir_data_path, 'img_with_text.png'])
+        self.img_with_text_hided_path: Path = merge_path_elements([self.dir_data_path, 'img_with_text_hided.png'])
+        self.img_page_path: Path = merge_path_elements([self.dir_data_path, 'img_page.png'])
+
+    def test__validate_params(self) -> None:
+        with self.subTest("Invalid images list"), self.assertRaises(BatchComparator.exception) as e:
+            _ = BatchComparator(img_reference=self.img_with_text_path, imgs_compared=self.img_page_path)
+        self.assertEqual(BatchComparator.messages.INVALID_IMGS_TYPE_ERROR, e.exception.message)
+
+        with self.subTest("Invalid image in list"), self.assertRaises(BatchComparator.exception) as e:
+            _ = BatchComparator(img_reference=self.img_with_text_path, imgs_compared=[None])
+        self.assertEqual(BatchComparator.messages.INVALID_IMG_TYPE_ERROR, e.exception.message)
+
+    def test_compare_by_neural_network_vgg16(self) -> None:
+        imgs_compared: list[Path] = [self.img_with_text_path, self.img_with_text_hided_path, self.img_page_path]
+        results = BatchComparator(
+            img_reference=self.img_with_text_path, imgs_compared=imgs_compared
+        ).compare_by_neural_network_vgg16()
+
+        with self.subTest("Results in input order"):
+            self.assertEqual(3, len(results))
+
+        with self.subTest("Same images"):
+            self.assertEqual(IsSimilar.YES, results[0]["is_similar"])
+            self.assertEqual(100.0, results[0]["percent"])
+
+        with self.subTest("Match pairwise comparison"):
+            for img_path, result in zip(imgs_compared[1:], results[1:]):
+                expected = Comparator(
+                    img_first=self.img_with_text_path, img_second=img_path
+                ).compare_by_neural_network_vgg16()
+                self.assertEqual(expected["is_similar"], result["is_similar"])
+                self.assertAlmostEqual(expected["percent"], result["percent"], places=2)
+
+        with self.subTest("Empty images list"):
+            self.assertEqual([], BatchComparator(
+                img_reference=self.img_with_text_path, imgs_compared=[]
+            ).compare_by_neural_network_vgg16())
+
+    def test_compare_by_neural_network_rgb(self) -> None:
+        comparator = BatchComparator(img_reference=self.img_with_text_path, imgs_compared=[self.img_page_path])
+        with patch(
+                "app.compare.comparator.FeatureExtractor.get_features", return_value=np.ones((2, 4))
+        ) as get_features:
+            comparator.compare_by_neural_network_vgg16()
+
+        img_reference, _ = comparator.prepare_images(img_shape=BACKBONES[NeuralNetwork.VGG16].input_size)
+        np.testing.assert_array_equal(cv.cvtColor(img_reference, cv.COLOR_BGR2RGB), get_features.call_args.args[0][0])
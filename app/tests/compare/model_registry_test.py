@@ -0,0 +1,53 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.compare.model_registry import ModelRegistry, ModelInfo
+
+
+class TestModelRegistry(TestCase):
+
+    def setUp(self) -> None:
+        self.model = Mock()
+        self.model.count_params.return_value = 10
+        self.model.input_shape = (None, 4, 4, 3)
+        self.loader = Mock(return_value=self.model)
+
+        self.instance = ModelRegistry()
+        self.instance.register("test", self.loader)
+        self.exception = self.instance.exception
+        self.messages = self.instance.messages
+
+    def test_get_model(self) -> None:
+        with self.subTest("Model is loaded once"):
+            self.assertIs(self.model, self.instance.get_model("test"))
+            self.assertIs(self.model, self.instance.get_model("test"))
+            self.loader.assert_called_once()
+
+        with self.subTest("Model info"):
+            info: ModelInfo = self.instance.info["test"]
+            self.assertEqual("test", info.name)
+            self.assertEqual(40, info.weights_size)
+
+        with self.subTest("Unknown model"), self.assertRaises(self.exception) as e:
+            _ = self.instance.get_model("unknown")
+        self.assertEqual(self.messages.UNKNOWN_MODEL_ERROR.format(name="unknown"), e.exception.message)
+
+        with self.subTest("Model load error"), self.assertRaises(self.exception) as e:
+            self.instance.register("broken", Mock(side_effect=Exception("test")))
+            _ = self.instance.get_model("broken")
+        self.assertEqual(self.messages.MODEL_LOAD_ERROR.format(name="broken", msg="test"), e.exception.message)
+
+    def test_warm_up(self) -> None:
+        infos: list[ModelInfo] = self.instance.warm_up(["test"])
+
+        self.assertEqual(["test"], [info.name for info in infos])
+        self.model.predict.assert_called_once()
+        self.assertEqual((1, 4, 4, 3), self.model.predict.call_args[0][0].shape)
+
+    def test_clear(self) -> None:
+        _ = self.instance.get_model("test")
+        self.instance.clear()
+
+        self.assertEqual({}, self.instance.info)
+        _ = self.instance.get_model("test")
+        self.assertEqual(2, self.loader.call_count)
@@ -0,0 +1,75 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from app.base.constants import NeuralNetwork
+from app.base.exceptions import ModelRegistryException
+from app.base.types import FeatureMatrix, ImgMatrix
+from app.compare.neural_network import BACKBONES, FeatureExtractor, EmbeddingCache, model_registry
+
+
+class TestFeatureExtractor(TestCase):
+
+    def test_get_cosine_similarities(self) -> None:
+        feature: FeatureMatrix = np.array([1.0, 0.0, 1.0])
+        features: FeatureMatrix = np.array([[1.0, 0.0, 1.0], [0.0, 1.0, 0.0], [2.0, 0.0, 2.0], [0.0, 0.0, 0.0]])
+
+        similarities: FeatureMatrix = FeatureExtractor.get_cosine_similarities(feature, features)
+
+        with self.subTest("Same direction"):
+            self.assertAlmostEqual(1.0, similarities[0])
+            self.assertAlmostEqual(1.0, similarities[2])
+
+        with self.subTest("Orthogonal"):
+            self.assertAlmostEqual(0.0, similarities[1])
+
+        with self.subTest("Zero vector"):
+            self.assertAlmostEqual(0.0, similarities[3])
+
+    def test_get_features(self) -> None:
+        img_matrices: list[ImgMatrix] = [np.zeros((4, 4, 3), dtype="uint8"), np.ones((4, 4, 3), dtype="uint8")]
+        predicted: FeatureMatrix = np.array([[1.0, 2.0], [3.0, 4.0]], dtype="float32")
+
+        with tempfile.TemporaryDirectory() as cache_path:
+            instance = FeatureExtractor(cache=EmbeddingCache(cache_path, max_size=1024 ** 2))
+
+            with self.subTest("Cache miss"), patch.object(FeatureExtractor, "predict", return_value=predicted) as mock:
+                np.testing.assert_array_equal(predicted, instance.get_features(img_matrices))
+                mock.assert_called_once()
+                self.assertEqual(2, instance.cache.stats["misses"])
+
+            with self.subTest("Cache hit"), patch.object(FeatureExtractor, "predict") as mock:
+                np.testing.assert_array_equal(predicted, instance.get_features(img_matrices))
+                mock.assert_not_called()
+                self.assertEqual(2, instance.cache.stats["hits"])
+
+        with tempfile.TemporaryDirectory() as cache_path:
+            instance = FeatureExtractor(cache=EmbeddingCache(cache_path, max_size=1024 ** 2))
+            predicted = np.array([[0.1234567, 1.0], [1.0, 0.7654321]], dtype="float32")
+
+            with self.subTest("Same features on cache miss and hit"), patch.object(
+                    FeatureExtractor, "predict", return_value=predicted
+            ):
+                missed: FeatureMatrix = instance.get_features(img_matrices)
+                np.testing.assert_array_equal(missed, instance.get_features(img_matrices))
+                np.testing.assert_array_equal(predicted.astype("float16"), missed)
+
+    def test_backbones(self) -> None:
+        with self.subTest("Registered backbones"):
+            for name in NeuralNetwork:
+                self.assertIn(name, BACKBONES)
+                self.assertIn(name, model_registry._loaders)
+
+        with self.subTest("Unknown backbone"), self.assertRaises(ModelRegistryException):
+            FeatureExtractor("unknown")
+
+        with self.subTest("Backbone preprocessing"):
+            img_matrices: list[ImgMatrix] = [np.zeros((4, 4, 3), dtype="uint8")]
+            model = Mock(predict=Mock(return_value=np.zeros((1, 2, 2, 8), dtype="float32")))
+            instance = FeatureExtractor(NeuralNetwork.MOBILENET_V2, cache=None)
+            with patch.object(instance.backbone, "preprocess", side_effect=lambda batch: batch) as preprocess, \
+                    patch.object(model_registry, "get_model", return_value=model):
+                self.assertEqual((1, 32), instance.get_features(img_matrices).shape)
+                preprocess.assert_called_once()
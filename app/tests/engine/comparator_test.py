@@ -5,8 +5,11 @@ from app.engine.comparator import (
     ComparatorBase,
     ComparatorMeanSquaredError,
     ComparatorStructuralSimilarityIndex,
+    ComparatorNeuralNetwork,
     ComparatorNeuralNetworkVGG16
 )
+from app.compare.model_registry import model_registry
+from app.engine.image_helper import ImageHelper
 
 
 class MockComparatorBase(ComparatorBase):
@@ -40,6 +43,16 @@ class TestCompareImages(TestCase):
             self.assertTupleEqual((200, 200), image.shape)
             self.assertEqual(40000, image.size)
 
+        with self.subTest('Prepare decoded image'):
+            image = ImageHelper.read_image(test_image_path)
+            self.assertTupleEqual(
+                (200, 200), MockComparatorBase().prepare_comparison_image(image, (200, 200)).shape
+            )
+            self.assertTupleEqual(
+                (200, 200, 3),
+                MockComparatorBase().prepare_comparison_image(image, (200, 200), convert_grayscale=False).shape
+            )
+
     def test_compare_by_mean_squared_error(self):
         with self.subTest('Different images'):
             comparator = ComparatorMeanSquaredError(self.test_reference_image_path,
@@ -98,3 +111,13 @@ class TestCompareImages(TestCase):
             self.assertEqual(1, int(index))
             self.assertEqual(100.0, comparator.get_similarity_percentages(index))
             self.assertTrue(comparator.are_images_similar(index))
+
+    def test_neural_network_backbone(self):
+        with self.subTest('Input size of the backbone'):
+            comparator = ComparatorNeuralNetwork(self.test_reference_image_path, self.test_image_path,
+                                                 backbone='mobilenet_v2')
+            self.assertEqual((224, 224), comparator.image_size)
+
+        with self.subTest('Unknown backbone'), self.assertRaises(model_registry.exception) as e:
+            ComparatorNeuralNetwork(self.test_reference_image_path, self.test_image_path, backbone='unknown')
+        self.assertEqual(model_registry.messages.UNKNOWN_MODEL_ERROR.format(name='unknown'), str(e.exception))
@@ -1,12 +1,16 @@
+import tempfile
 from unittest import TestCase
 from os import path, getcwd, remove
 
+import numpy as np
+
 from app.engine.image_helper import (
     ImageHelper,
     ImageHelperTypeException,
     ImageHelperFileExtensionException,
     ImageHelperPSDPathHException,
     ImageHelperGetImagePathException,
+    ImageHelperDecodeImageException,
 )
 
 
@@ -37,6 +41,31 @@ class TestImageHelper(TestCase):
 
             remove(save_image_path)
 
+    def test_get_psd_image(self):
+        psd_path = path.join(self.test_data_path, 'template_test.psd')
+
+        with self.subTest('Incorrect psd_path type'):
+            with self.assertRaises(ImageHelperTypeException):
+                ImageHelper.get_psd_image(None)
+
+        with self.subTest('Incorrect psd_path'):
+            with self.assertRaises(ImageHelperPSDPathHException):
+                ImageHelper.get_psd_image(self.test_data_path)
+
+        with self.subTest('Get psd image'):
+            self.assertEqual(3, ImageHelper.get_psd_image(psd_path).ndim)
+
+    def test_decode_image(self):
+        test_image_path = path.join(self.test_data_path, 'img_with_text_test.png')
+
+        with self.subTest('Decode image'):
+            with open(test_image_path, 'rb') as file:
+                self.assertTupleEqual((639, 601, 3), ImageHelper.decode_image(file.read()).shape)
+
+        with self.subTest('Invalid image bytes'):
+            with self.assertRaises(ImageHelperDecodeImageException):
+                ImageHelper.decode_image(b'test')
+
     def test_get_image_resolution(self):
         test_image_path = path.join(self.test_data_path, 'img_with_text_test.png')
 
@@ -61,6 +90,20 @@ class TestImageHelper(TestCase):
             with self.assertRaises(ImageHelperGetImagePathException):
                 ImageHelper.read_image('')
 
+    def test_get_image_hash(self):
+        image_matrix = np.arange(48, dtype='uint8').reshape((4, 4, 3))
+
+        with self.subTest('Same hash for the path and the pixel matrix'), tempfile.TemporaryDirectory() as folder:
+            image_path = ImageHelper.write_image(image_matrix, path.join(folder, 'image.png'))
+            self.assertEqual(ImageHelper.get_image_hash(image_matrix), ImageHelper.get_image_hash(image_path))
+
+        with self.subTest('Different pixels'):
+            image_matrix_changed = image_matrix.copy()
+            image_matrix_changed[0, 0] = image_matrix_changed[0, 0] + 1
+            self.assertNotEqual(
+                ImageHelper.get_image_hash(image_matrix), ImageHelper.get_image_hash(image_matrix_changed)
+            )
+
     def test_hide_text(self):
         test_image_path = path.join(self.test_data_path, 'img_with_text_test.png')
         save_image_path = path.join(self.test_data_path, 'img_with_filled_text.png')
@@ -3,11 +3,15 @@ import shutil
 from unittest import TestCase
 from unittest.mock import patch
 
+import numpy as np
+
 from django.contrib.auth.models import User
 
+from app.base.common.image import ImageArtifact
+from app.base.common.web_driver import PageRenderer, RequestRouter
 from app.engine.util import remove_folder_or_file, join_path, create_folder
 from app.engine.сontroller import CompareController
-from app.models import UserSession, UserSettings, Comparison
+from app.models import UserSession, UserSettings, ComparisonResults
 
 test_data = os.path.join(os.getcwd(), 'app', 'tests', 'test_data')
 
@@ -45,21 +49,32 @@ class ControllerTest(TestCase):
         controller = CompareController(user_id=10)
         controller.exec()
 
-        # checks the existence of images
-        self.assertTrue(os.path.isfile(join_path([cache_path, 'site_image_0.png'])))
-        self.assertTrue(os.path.isfile(join_path([cache_path, 'reference_image.png'])))
+        # images are compared in memory and are not written to the cache folder
+        self.assertFalse(os.path.isfile(join_path([cache_path, 'site_image_0.png'])))
+        self.assertFalse(os.path.isfile(join_path([cache_path, 'reference_image.png'])))
 
         # checks comparisons
-        results = Comparison.objects.filter(uui='7fbc1219-62e3-4aa7-a5fe-cb2629d03579')
+        results = ComparisonResults.objects.filter(username_id=10)
         self.assertEqual(2, len(results))
-        self.assertEqual('MSE', results[0].method)
-        self.assertEqual('SSIM', results[1].method)
+        self.assertEqual('mse', results[0].method)
+        self.assertEqual('ssim', results[1].method)
         self.assertTrue(results[0].value)
         self.assertTrue(results[1].value)
+        self.assertEqual(results[0].hash_compared, results[1].hash_compared)
 
         # remove cache data
         remove_folder_or_file(cache_path)
 
+    def test_get_hash_verdict(self):
+        cases = [
+            ('Same hash', '0000000000000000', (1.0, True)),
+            ('Distance within the bound', '0000000000000003', None),
+            ('Distance beyond the bound', 'ffffffffffffffff', (0.0, False)),
+        ]
+        for name, image_hash, verdict in cases:
+            with self.subTest(name):
+                self.assertEqual(verdict, CompareController.get_hash_verdict('0000000000000000', image_hash))
+
     def test_get_rendered_sits_image_paths(self):
         # create cache folder
         cache_path = join_path([test_data, '7fbc1219-62e3-4aa7-a5fe-cb2629d03579'])
@@ -77,6 +92,30 @@ class ControllerTest(TestCase):
         # remove cache data
         remove_folder_or_file(cache_path)
 
+    def test_get_rendered_sits_images(self):
+        # create cache folder
+        cache_path = join_path([test_data, '7fbc1219-62e3-4aa7-a5fe-cb2629d03579'])
+        create_folder(cache_path)
+        # copy and move archive
+        source_path = join_path([test_data, 'page_test.zip'])
+        destination_path = join_path([cache_path, 'archive.zip'])
+        shutil.copy(source_path, destination_path)
+
+        image = ImageArtifact('site_image_0', np.zeros((10, 10, 3), dtype='uint8'))
+        with patch.object(PageRenderer, 'render', return_value=[image]) as render:
+            controller = CompareController(user_id=10)
+            self.assertEqual([image], controller.get_rendered_sits_images())
+
+        # all pages are rendered in one concurrent call by file urls
+        urls, names = render.call_args.args
+        self.assertTrue(all(url.startswith('file://') for url in urls))
+        self.assertEqual([f'site_image_{number}' for number in range(len(urls))], names)
+        self.assertIsInstance(render.call_args.kwargs['router'], RequestRouter)
+        self.assertFalse(os.path.isfile(join_path([cache_path, 'archive.zip'])))
+
+        # remove cache data
+        remove_folder_or_file(cache_path)
+
     def test_get_reference_image_path(self):
         # create cache folder
         cache_path = join_path([test_data, '7fbc1219-62e3-4aa7-a5fe-cb2629d03579'])
@@ -0,0 +1,123 @@
+from django.test import TestCase
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+from app.models import AuthUser, ComparisonResults, ImageHash
+
+databases_config = []
+
+
+def setUpModule():
+    # pytest runs the module without the django test runner, so the test database is created here
+    setup_test_environment()
+    databases_config.extend(setup_databases(verbosity=0, interactive=False))
+
+
+def tearDownModule():
+    teardown_databases(databases_config, verbosity=0)
+    teardown_test_environment()
+
+
+def flip_bits(value: str, *bits: int) -> str:
+    number = int(value, 16)
+    for bit in bits:
+        number ^= 1 << bit
+    return f'{number:016x}'
+
+
+class TestImageHashManager(TestCase):
+    hash_value = '0123456789abcdef'
+
+    def setUp(self):
+        ImageHash.objects.add('reference', self.hash_value)
+
+    def test_get_bands(self):
+        self.assertEqual(
+            {'band_0': '0123', 'band_1': '4567', 'band_2': '89ab', 'band_3': 'cdef'},
+            ImageHash.objects.get_bands(self.hash_value)
+        )
+
+    def test_add(self):
+        ImageHash.objects.add('reference', self.hash_value)
+        self.assertEqual(1, ImageHash.objects.filter(uuid='reference').count())
+
+    def test_find_similar(self):
+        # bits 0, 16, 32 and 48 are in the bands 3, 2, 1 and 0 respectively
+        cases = [
+            ('Same hash', self.hash_value, 0, 1),
+            ('Different hash', flip_bits(self.hash_value, 0), 0, 0),
+            ('Distance equal to the limit', flip_bits(self.hash_value, 0, 1, 2), 3, 1),
+            ('Distance above the limit', flip_bits(self.hash_value, 0, 1, 2, 3), 3, 0),
+            ('Bits in three bands, one band matches', flip_bits(self.hash_value, 0, 16, 32), 3, 1),
+            ('Bits in every band, no band matches', flip_bits(self.hash_value, 0, 16, 32, 48), 3, 0),
+            ('Limit not below the bands count, full scan', flip_bits(self.hash_value, 0, 16, 32, 48), 4, 1),
+        ]
+        for name, value, max_distance, count in cases:
+            with self.subTest(name):
+                self.assertEqual(count, len(ImageHash.objects.find_similar(value, max_distance)))
+
+
+class TestComparisonResultsManager(TestCase):
+    hash_reference = '0123456789abcdef'
+    hash_compared = 'fedcba9876543210'
+    content_hash_reference = 'a' * 64
+    content_hash_compared = 'b' * 64
+
+    def setUp(self):
+        self.user = AuthUser.objects.create(username='bob_tester', email='bob@test.com')
+        self.result = ComparisonResults.objects.add(
+            username=self.user,
+            uuid_reference='reference',
+            uuid_compared='compared',
+            hash_reference=self.hash_reference,
+            hash_compared=self.hash_compared,
+            content_hash_reference=self.content_hash_reference,
+            content_hash_compared=self.content_hash_compared,
+            method='ssim',
+            value=0.75,
+            threshold=0.55,
+            is_similar=True,
+        )
+
+    def find_previous(self, **fields) -> ComparisonResults | None:
+        return ComparisonResults.objects.find_previous(**{
+            'username_id': self.user.id,
+            'method': 'ssim',
+            'hash_reference': self.hash_reference,
+            'hash_compared': self.hash_compared,
+            'content_hash_reference': self.content_hash_reference,
+            'content_hash_compared': self.content_hash_compared,
+            **fields
+        })
+
+    def test_add(self):
+        self.assertEqual({'reference', 'compared'}, set(ImageHash.objects.values_list('uuid', flat=True)))
+
+        with self.subTest('Same images are indexed once'):
+            ComparisonResults.objects.add(
+                username=self.user,
+                uuid_reference='reference',
+                uuid_compared='compared',
+                hash_reference=self.hash_reference,
+                hash_compared=self.hash_compared,
+                method='mse',
+                value=0.9,
+                threshold=0.45,
+                is_similar=True,
+            )
+            self.assertEqual(2, ImageHash.objects.count())
+
+    def test_find_previous(self):
+        other_user = AuthUser.objects.create(username='alice_tester', email='alice@test.com')
+        cases = [
+            ('Other method', {'method': 'mse'}),
+            ('Other user', {'username_id': other_user.id}),
+            ('Other reference', {'hash_reference': flip_bits(self.hash_reference, 0)}),
+            ('Same perceptual hashes, other content', {'content_hash_compared': 'c' * 64}),
+        ]
+
+        with self.subTest('Same pair'):
+            self.assertEqual(self.result, self.find_previous())
+
+        for name, fields in cases:
+            with self.subTest(name):
+                self.assertIsNone(self.find_previous(**fields))
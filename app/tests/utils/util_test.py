@@ -93,4 +93,11 @@ class UtilTest(TestCase):
             rmtree(test_dir)
 
     def test_get_uuid(self):
-        self.assertEqual(36, len(get_uuid()))
+        with self.subTest('Random uuid'):
+            self.assertEqual(36, len(get_uuid()))
+            self.assertNotEqual(get_uuid(), get_uuid())
+
+        with self.subTest('Uuid by name'):
+            self.assertEqual(36, len(get_uuid('name')))
+            self.assertEqual(get_uuid('name'), get_uuid('name'))
+            self.assertNotEqual(get_uuid('name'), get_uuid('other_name'))
@@ -3,7 +3,7 @@ from django import setup
 from os import environ, path, getcwd, walk, makedirs, remove
 from shutil import rmtree
 from zipfile import ZipFile, BadZipFile
-from uuid import uuid4
+from uuid import NAMESPACE_OID, uuid4, uuid5
 
 from app.constants import ARCHIVE_EXPANSION
 from app.utils.exceptions import (
@@ -58,8 +58,11 @@ def find_files_with_name(folder_path: str, key_file: str, inclusion: bool = Fals
     return paths
 
 
-def get_uuid():
-    return str(uuid4())
+def get_uuid(name: str | None = None) -> str:
+    # the same name always gives the same uuid, e.g. a content hash identifies an image across sessions
+    if name is None:
+        return str(uuid4())
+    return str(uuid5(NAMESPACE_OID, name))
 
 
 def extract_extension(filename: str) -> str:
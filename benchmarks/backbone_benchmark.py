@@ -0,0 +1,61 @@
+"""Сравнение сверточных нейросетей для получения признаков изображений.
+
+Для каждой нейросети замеряется время загрузки, задержка получения признаков пакета изображений,
+прирост памяти процесса и доля совпадений вердикта о схожести с VGG16.
+
+Запуск:
+    python -m benchmarks.backbone_benchmark --images app/tests/data/*.png --similarity 0.85 --repeat 3
+"""
+import argparse
+from timeit import repeat
+
+from app.base.common.image import ImageCV
+from app.base.constants import NeuralNetwork
+from app.base.types import ImgMatrix, FeatureMatrix, ModelName
+from app.compare.neural_network import BACKBONES, FeatureExtractor, model_registry
+
+
+def get_similarities(name: ModelName, img_matrices: list[ImgMatrix]) -> FeatureMatrix:
+    """Функция вычисления схожести первого изображения с остальными.
+
+    Args:
+        name: Название нейросети.
+        img_matrices: Матрицы изображений, приведенные к размеру входа нейросети.
+
+    Returns:
+        Вектор косинусной схожести для каждого изображения, кроме первого.
+    """
+    features: FeatureMatrix = FeatureExtractor(name, cache=None).predict(img_matrices)
+    return FeatureExtractor.get_cosine_similarities(features[0], features[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", nargs="+", required=True)
+    parser.add_argument("--similarity", type=float, default=0.85)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    image_cv = ImageCV()
+    img_matrices: list[ImgMatrix] = [image_cv.read_image(path) for path in args.images]
+
+    verdicts: dict[ModelName, FeatureMatrix] = {}
+    for name, backbone in BACKBONES.items():
+        batch: list[ImgMatrix] = [image_cv.resize_image(img, backbone.input_size) for img in img_matrices]
+        model_registry.warm_up([name])
+        timings: list[float] = repeat(lambda: get_similarities(name, batch), number=1, repeat=args.repeat)
+        verdicts[name] = get_similarities(name, batch) > args.similarity
+
+        info = model_registry.info[name]
+        agreement: float = (verdicts[name] == verdicts[NeuralNetwork.VGG16]).mean() * 100
+        print(
+            f"{name}: load {info.load_time:.2f} s, "
+            f"predict {min(timings) * 1000:.1f} ms ({len(batch)} images), "
+            f"weights {info.weights_size / 1024 ** 2:.1f} MB, "
+            f"memory {info.memory_usage / 1024 ** 2:.1f} MB, "
+            f"agreement with VGG16 {agreement:.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Замер времени получения скриншота страницы с запуском браузера на каждую проверку и из пула браузеров.
+
+Страница задается ссылкой или берется встроенная страница data URL, поэтому замер не зависит от сети.
+
+Запуск:
+    python -m benchmarks.browser_pool_benchmark --checks 10 --size 2 --max-uses 50
+"""
+import argparse
+from statistics import mean
+from time import perf_counter
+
+from playwright.sync_api import sync_playwright
+
+from app.base.common.web_driver import BrowserPool, PlayWrightAction, PlaywrightSettings
+
+DEFAULT_URL: str = "data:text/html," + "<p>Layout check</p>" * 200
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--checks", type=int, default=10)
+    parser.add_argument("--size", type=int, default=2)
+    parser.add_argument("--max-uses", type=int, default=50)
+    args = parser.parse_args()
+
+    with sync_playwright() as driver:
+        cold: list[float] = []
+        for _ in range(args.checks):
+            start: float = perf_counter()
+            action = PlayWrightAction(driver, PlaywrightSettings())
+            action.get_screenshot_image(action.new_page, args.url)
+            action.browser.close()
+            cold.append(perf_counter() - start)
+
+        pooled: list[float] = []
+        with BrowserPool(driver, PlaywrightSettings(), size=args.size, max_uses=args.max_uses) as pool:
+            action = PlayWrightAction(driver, pool=pool)
+            for _ in range(args.checks):
+                start = perf_counter()
+                action.get_screenshot_image(action.new_page, args.url)
+                pooled.append(perf_counter() - start)
+
+    for name, timings in (("cold browser", cold), ("browser pool", pooled)):
+        print(f"{name}: mean {mean(timings) * 1000:.0f} ms, first {timings[0] * 1000:.0f} ms, "
+              f"last {timings[-1] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
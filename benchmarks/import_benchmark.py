@@ -0,0 +1,62 @@
+"""Замер времени импорта модулей приложения по данным `python -X importtime`.
+
+Выводит суммарное время импорта и самые тяжелые пакеты. При превышении бюджета завершается с кодом 1,
+что позволяет использовать замер как проверку на регрессии.
+
+Запуск:
+    python -m benchmarks.import_benchmark --module app.compare.comparator --top 10 --budget-ms 1500
+"""
+import argparse
+import subprocess
+import sys
+
+HEAVY_MODULES: tuple[str, ...] = ("keras", "tensorflow", "torch", "easyocr", "skimage", "sklearn", "psd_tools")
+
+
+def get_import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Функция получения времени импорта всех модулей.
+
+    Args:
+        module: Название импортируемого модуля.
+
+    Returns:
+        Словарь с кумулятивным временем импорта в микросекундах и уровнем вложенности по названиям модулей.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # nested imports are indented by two spaces per level
+        times[name.strip()] = (int(cumulative), (len(name) - len(name.lstrip()) - 1) // 2)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.compare.comparator")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    times: dict[str, tuple[int, int]] = get_import_times(args.module)
+    total: float = sum(cumulative for cumulative, level in times.values() if level == 0) / 1000
+    print(f"{args.module}: {total:.1f} ms")
+    for name, (cumulative, _) in sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:args.top]:
+        print(f"  {name}: {cumulative / 1000:.1f} ms")
+
+    heavy: list[str] = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    if heavy:
+        print(f"heavy modules imported at startup: {', '.join(heavy)}")
+    if heavy or (args.budget_ms is not None and total > args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Замер скорости сравнения изображений по методу MSE.
+
+Запуск:
+    python -m benchmarks.mse_benchmark --width 1920 --height 10000 --repeat 5
+"""
+import argparse
+from timeit import repeat
+
+import cv2 as cv
+import numpy as np
+
+from app.base.common.image import ImageCV
+from app.base.types import ImgMatrix
+
+
+def get_screenshots(width: int, height: int) -> tuple[ImgMatrix, ImgMatrix]:
+    """Функция генерации пары черно-белых скриншотов, отличающихся небольшим блоком.
+
+    Args:
+        width: Ширина изображения.
+        height: Высота изображения.
+
+    Returns:
+        Кортеж с матрицами первого и второго изображений.
+    """
+    img_first: ImgMatrix = np.random.default_rng(0).integers(0, 256, (height, width), dtype="uint8")
+    img_second: ImgMatrix = img_first.copy()
+    img_second[height // 2: height // 2 + 100, width // 4: width // 2] = 0
+    return img_first, img_second
+
+
+def legacy_mean_squared_error(img_first: ImgMatrix, img_second: ImgMatrix) -> float:
+    """Функция вычисления MSE прежним способом: попиксельная проверка и копии во float64."""
+    difference = cv.subtract(img_first, img_second)
+    if all(cv.countNonZero(channel) == 0 for channel in cv.split(difference)):
+        return 0.0
+    error = np.sum((img_first.astype("float") - img_second.astype("float")) ** 2)
+    return error / float(img_first.shape[0] * img_first.shape[1])
+
+
+def fused_mean_squared_error(img_first: ImgMatrix, img_second: ImgMatrix) -> float:
+    """Функция вычисления MSE за один проход без промежуточных матриц."""
+    return ImageCV().get_squared_error(img_first, img_second) / float(img_first.shape[0] * img_first.shape[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    img_first, img_second = get_screenshots(args.width, args.height)
+    assert np.isclose(legacy_mean_squared_error(img_first, img_second), fused_mean_squared_error(img_first, img_second))
+
+    for name, function in (("legacy", legacy_mean_squared_error), ("fused", fused_mean_squared_error)):
+        timings: list[float] = repeat(lambda: function(img_first, img_second), number=1, repeat=args.repeat)
+        print(f"{name}: {min(timings) * 1000:.1f} ms ({args.width}x{args.height})")
+
+
+if __name__ == "__main__":
+    main()
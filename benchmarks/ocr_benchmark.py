@@ -0,0 +1,42 @@
+"""Замер скорости скрытия текста на скриншотах с распознаванием текста и только с поиском его областей.
+
+Запуск:
+    python -m benchmarks.ocr_benchmark --images app/tests/data/img_page.png --repeat 3
+"""
+import argparse
+from timeit import repeat
+
+from app.base.common.image import ImageCV
+from app.base.common.ocr import reader_pool
+from app.base.constants import Language
+from app.base.types import ImgMatrix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", nargs="+", required=True)
+    parser.add_argument("--languages", nargs="+", default=[Language.RUSSIAN, Language.ENGLISH])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    image_cv = ImageCV()
+    # the reader is loaded before timing, so only text detection and recognition are measured
+    reader_pool.preload([args.languages])
+
+    for path in args.images:
+        img_matrix: ImgMatrix = image_cv.read_image(path)
+        megapixels: float = img_matrix.shape[0] * img_matrix.shape[1] / 10 ** 6
+        timings: dict[str, float] = {}
+        for name, detect_only in (("readtext", False), ("detect", True)):
+            timings[name] = min(repeat(
+                lambda: image_cv.get_text_polygons(img_matrix, args.languages, detect_only),
+                number=1,
+                repeat=args.repeat,
+            ))
+            print(f"{path} {name}: {timings[name] * 1000:.0f} ms, {timings[name] * 1000 / megapixels:.0f} ms/MP")
+        saved: float = (timings["readtext"] - timings["detect"]) * 1000 / megapixels
+        print(f"{path}: detection only saves {saved:.0f} ms/MP ({img_matrix.shape[1]}x{img_matrix.shape[0]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Замер пикового потребления памяти при сравнении высоких изображений по MSE и SSIM.
+
+Для каждой высоты создаются два синтетических изображения страницы, которые сравниваются
+в отдельном процессе обычным способом (compare_all) и потоково (compare_streaming) из файлов PNG
+и из сохраненных файлов npy. Выводится время и пиковый объем резидентной памяти процесса.
+
+Запуск:
+    python -m benchmarks.streaming_benchmark --heights 5000 20000 40000 --width 1280
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+import cv2 as cv
+import numpy as np
+
+from app.base.types import ImgMatrix, Path
+from app.compare.comparator import Comparator, ComparisonMethod
+
+MODES: tuple[str, ...] = ("full", "streaming", "streaming_npy")
+
+
+def create_page(height: int, width: int, seed: int) -> ImgMatrix:
+    """Функция создания синтетического изображения страницы со строками текста.
+
+    Args:
+        height: Высота изображения.
+        width: Ширина изображения.
+        seed: Зерно генератора случайных чисел.
+
+    Returns:
+        Матрица изображения.
+    """
+    rng = np.random.default_rng(seed)
+    img_matrix: ImgMatrix = np.full((height, width, 3), 255, dtype="uint8")
+    for top in range(20, height - 20, 40):
+        cv.putText(img_matrix, f"line {top} {rng.integers(10 ** 6)}", (20, top), cv.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+    return img_matrix
+
+
+def run(mode: str, first: Path, second: Path) -> None:
+    """Функция сравнения изображений в текущем процессе с выводом времени и пиковой памяти."""
+    similarities = {ComparisonMethod.MSE: 0.85, ComparisonMethod.SSIM: 0.55}
+    comparator = Comparator(img_first=first, img_second=second)
+    start: float = perf_counter()
+    if mode == "full":
+        results = comparator.compare_all(similarities)
+    else:
+        results = comparator.compare_streaming(similarities)
+    elapsed: float = perf_counter() - start
+    peak: float = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    scores: str = ", ".join(f"{method} {result['percent']:.0f}%" for method, result in results.items())
+    print(f"{elapsed * 1000:.0f} ms, peak RSS {peak:.0f} MB, {scores}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--heights", nargs="+", type=int, default=[5000, 20000, 40000])
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--run", nargs=3, metavar=("MODE", "FIRST", "SECOND"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        for height in args.heights:
+            paths: dict[str, list[Path]] = {"png": [], "npy": []}
+            for seed in (0, 1):
+                img_matrix: ImgMatrix = create_page(height, args.width, seed)
+                paths["png"].append(os.path.join(folder, f"page_{seed}.png"))
+                paths["npy"].append(os.path.join(folder, f"page_{seed}.npy"))
+                cv.imwrite(paths["png"][-1], img_matrix)
+                np.save(paths["npy"][-1], cv.cvtColor(img_matrix, cv.COLOR_BGR2GRAY))
+                del img_matrix
+
+            for mode in MODES:
+                first, second = paths["npy" if mode == "streaming_npy" else "png"]
+                process = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.streaming_benchmark", "--run", mode, first, second],
+                    capture_output=True,
+                    text=True,
+                )
+                output: str = process.stdout.strip() or f"failed with exit code {process.returncode}"
+                print(f"{args.width}x{height} {mode}: {output}")
+
+
+if __name__ == "__main__":
+    main()
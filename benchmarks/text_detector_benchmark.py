@@ -0,0 +1,74 @@
+"""Сравнение поиска текста классическим детектором OpenCV с поиском EasyOCR.
+
+Для каждого изображения замеряется время поиска областей текста обоими способами и совпадение
+закрашиваемых масок по метрике IoU (пересечение к объединению), где эталоном считается EasyOCR.
+С ключом --opencv-only EasyOCR не загружается, и замеряется только детектор OpenCV.
+
+Запуск:
+    python -m benchmarks.text_detector_benchmark --images app/tests/data/img_page.png --repeat 3
+"""
+import argparse
+from timeit import repeat
+
+import cv2 as cv
+import numpy as np
+
+from app.base.common.image import ImageCV
+from app.base.common.ocr import reader_pool
+from app.base.constants import Language, TextDetector
+from app.base.types import ImgMatrix, TextPolygon
+
+
+def get_text_mask(img_matrix: ImgMatrix, polygons: list[TextPolygon]) -> ImgMatrix:
+    """Функция получения маски закрашиваемых областей текста.
+
+    Args:
+        img_matrix: Матрица изображения.
+        polygons: Список четырехугольников областей текста.
+
+    Returns:
+        Булева маска размером с изображение.
+    """
+    mask: ImgMatrix = np.zeros(img_matrix.shape[:2], dtype="uint8")
+    if polygons:
+        cv.fillPoly(mask, polygons, 1)
+    return mask > 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", nargs="+", required=True)
+    parser.add_argument("--languages", nargs="+", default=[Language.RUSSIAN, Language.ENGLISH])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--opencv-only", action="store_true")
+    args = parser.parse_args()
+
+    detectors: list[TextDetector] = [TextDetector.OPENCV] if args.opencv_only else list(TextDetector)
+    if TextDetector.EASYOCR in detectors:
+        # the reader is loaded before timing, so only text detection is measured
+        reader_pool.preload([args.languages])
+
+    image_cv = ImageCV()
+    for path in args.images:
+        img_matrix: ImgMatrix = image_cv.read_image(path)
+        masks: dict[TextDetector, ImgMatrix] = {}
+        for detector in detectors:
+            def detect() -> list[TextPolygon]:
+                return image_cv.get_text_polygons_by_tiles(img_matrix, args.languages, True, detector=detector)
+
+            timing: float = min(repeat(detect, number=1, repeat=args.repeat))
+            polygons: list[TextPolygon] = detect()
+            masks[detector] = get_text_mask(img_matrix, polygons)
+            print(f"{path} {detector}: {timing * 1000:.0f} ms, {len(polygons)} regions")
+
+        if len(masks) == len(TextDetector):
+            reference, candidate = masks[TextDetector.EASYOCR], masks[TextDetector.OPENCV]
+            intersection: int = np.count_nonzero(reference & candidate)
+            union: int = np.count_nonzero(reference | candidate)
+            iou: float = intersection / union if union else 1.0
+            covered: float = intersection / max(np.count_nonzero(reference), 1)
+            print(f"{path}: IoU with EasyOCR {iou:.2f}, EasyOCR text covered {covered * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
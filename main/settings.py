@@ -4,7 +4,26 @@ from pathlib import Path
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 CACHE_PATH = os.path.join(BASE_DIR, 'cache')
+# on-disk caches of embeddings, composites, text regions and page assets
+DISK_CACHE_PATH = os.getenv('DISK_CACHE_PATH', os.path.join(CACHE_PATH, 'disk'))
 UPLOADS_FILES_PATH = 'results/uploads'  # folder for downloadable content
+# neural network models loaded and warmed up at worker boot, comma separated (e.g. "vgg16")
+WARM_UP_MODELS = [name for name in os.getenv('WARM_UP_MODELS', '').split(',') if name]
+# text recognition readers loaded at worker boot, language sets separated by ';' (e.g. "en,ru;en")
+PRELOAD_OCR_LANGUAGES = [languages.split(',') for languages in os.getenv('PRELOAD_OCR_LANGUAGES', '').split(';')
+                         if languages]
+
+# rendered pages whose perceptual hash is farther than this distance from the reference are judged different
+# without running SSIM and the neural network, identical hashes are judged similar
+PERCEPTUAL_HASH_MAX_DISTANCE = int(os.getenv('PERCEPTUAL_HASH_MAX_DISTANCE', '20'))
+
+# request routing while rendering layouts: 'false' aborts external requests that are not served from the asset
+# cache, hosts are comma separated and extend the built-in lists of trackers and cdn hosts
+ROUTE_ALLOW_NETWORK = os.getenv('ROUTE_ALLOW_NETWORK', 'true').lower() == 'true'
+ROUTE_EXTRA_BLOCKED_HOSTS = [host.strip() for host in os.getenv('ROUTE_BLOCKED_HOSTS', '').split(',') if host.strip()]
+ROUTE_EXTRA_CACHED_HOSTS = [host.strip() for host in os.getenv('ROUTE_CACHED_HOSTS', '').split(',') if host.strip()]
+# folder of page assets copied to the asset cache at worker boot, files are laid out as <host>/<path> of their urls
+ASSET_CACHE_SEED_PATH = os.getenv('ASSET_CACHE_SEED_PATH')
 
 DEBUG = os.getenv('DEBUG', 'true').lower() == 'true'
 PROD_HOST = os.getenv('PROD_HOST')
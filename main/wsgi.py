@@ -1,6 +1,21 @@
 import os
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
 application = get_wsgi_application()
+
+if settings.WARM_UP_MODELS:
+    # backbones are registered in the registry when the neural network module is imported
+    from app.compare.neural_network import model_registry
+    model_registry.warm_up(settings.WARM_UP_MODELS)
+
+if settings.PRELOAD_OCR_LANGUAGES:
+    from app.base.common.ocr import reader_pool
+    reader_pool.preload(settings.PRELOAD_OCR_LANGUAGES)
+
+if settings.ASSET_CACHE_SEED_PATH:
+    # pages rendered without network access get fonts and css frameworks from the seeded asset cache
+    from app.base.common.web_driver import asset_cache
+    asset_cache.seed(settings.ASSET_CACHE_SEED_PATH)